@@ -0,0 +1,332 @@
+import os
+import cmd
+import bisect
+import argparse
+import operator
+import contextlib
+
+import skeleton
+
+class RangeIndex(object):
+    # Disjoint, sorted address ranges [start, end] supporting logarithmic membership queries.
+    # Overlapping or adjacent ranges are merged when added.
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def add(self, start: int, end: int):
+        i = bisect.bisect_left(self.ends, start - 1)
+        j = bisect.bisect_right(self.starts, end + 1)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+
+    def contains(self, address: int):
+        i = bisect.bisect_right(self.starts, address) - 1
+        return i >= 0 and address <= self.ends[i]
+
+    def first_hit(self, addresses):
+        # First address inside one of the ranges, or None. Most accesses are contiguous, so the span of the whole
+        # access is checked against the index before looking at individual addresses.
+        if not self.starts or not addresses:
+            return None
+        low = min(addresses)
+        high = max(addresses)
+        i = bisect.bisect_right(self.starts, high) - 1
+        if i < 0 or self.ends[i] < low:
+            return None
+        for address in addresses:
+            if self.contains(address):
+                return address
+        return None
+
+COMPARISONS = {"==": operator.eq, "!=": operator.ne, "<": operator.lt, ">": operator.gt, "<=": operator.le, ">=": operator.ge}
+
+class Debugger(cmd.Cmd):
+    # Interactive debugger for a Core: PC breakpoints (optionally conditional on a register value), watchpoints on
+    # SDMEM / VDMEM address ranges, single stepping and register / memory inspection.
+    # Between stops the core runs through Core.step with only a set lookup per instruction. Watchpoints use the
+    # observer API (Core.add_observer), so the memory wrappers are only installed while a watchpoint exists.
+    intro = "Vector Core Debugger - type help or ? to list commands."
+    prompt = "(vdb) "
+
+    def __init__(self, core, iodir: str, log: bool = False, stdin = None):
+        super().__init__(stdin = stdin)
+        if stdin != None:
+            self.use_rawinput = False
+        self.core = core
+        self.iodir = iodir
+        self.log = log # Show the per-instruction print log of the core while running.
+        self.breakpoints = {} # PC -> list of conditions, None for an unconditional breakpoint.
+        self.watchpoints = [] # (memory name, start, end, kind) as entered by the user.
+        self.indexes = {}     # (memory name, "R" / "W") -> RangeIndex of the watched addresses.
+        self.hit = None
+        self.finished = False
+        if core.program == None:
+            core.load_program()
+
+    # --- Observer ---
+
+    def on_memory_access(self, events):
+        for pc, memory, kind, addresses in events:
+            index = self.indexes.get((memory, kind))
+            if index == None:
+                continue
+            address = index.first_hit(addresses)
+            if address != None and self.hit == None:
+                self.hit = "Watchpoint: {} {} at address {} by PC {}".format(memory, "read" if kind == "R" else "write", address, pc)
+
+    def rebuild_watchpoints(self):
+        self.indexes = {}
+        for memory, start, end, kind in self.watchpoints:
+            for k in kind:
+                self.indexes.setdefault((memory, k), RangeIndex()).add(start, end)
+        if self.core.instrumentation != None and self in self.core.instrumentation.observers:
+            self.core.remove_observer(self)
+        if self.watchpoints:
+            self.core.add_observer(self)
+
+    # --- Execution ---
+
+    def condition_holds(self, condition):
+        register, index, compare, value = condition
+        return compare(self.read_register(register, index), value)
+
+    def breakpoint_hit(self, program_counter: int):
+        conditions = self.breakpoints[program_counter]
+        return None in conditions or any(self.condition_holds(condition) for condition in conditions)
+
+    def execute(self, count: int = None):
+        # Run until a breakpoint / watchpoint triggers, the program stops, or count instructions have retired.
+        # The breakpoint at the starting PC is stepped over, so continue always makes progress.
+        if self.finished:
+            print("The program has finished.")
+            return
+        core = self.core
+        breakpoints = self.breakpoints
+        instrumentation = core.instrumentation
+        self.hit = None
+        retired = 0
+        with contextlib.ExitStack() as stack:
+            if not self.log:
+                devnull = stack.enter_context(open(os.devnull, 'w'))
+                stack.enter_context(contextlib.redirect_stdout(devnull))
+            while True:
+                if retired and core.program_counter in breakpoints and self.breakpoint_hit(core.program_counter):
+                    self.hit = "Breakpoint: PC {}".format(core.program_counter)
+                    break
+                if not core.step():
+                    self.finished = True
+                    break
+                retired += 1
+                if instrumentation != None:
+                    instrumentation.flush()
+                if self.hit != None or retired == count:
+                    break
+        if self.hit != None:
+            print(self.hit)
+        if self.finished:
+            if instrumentation != None:
+                instrumentation.flush()
+            print("Program stopped at PC", core.program_counter, "after", retired, "instructions.")
+            core.dumpregs(self.iodir)
+            core.SDMEM.dump()
+            core.VDMEM.dump()
+        else:
+            self.show_current()
+
+    def show_current(self):
+        program_counter = self.core.program_counter
+        if program_counter < len(self.core.program):
+            print("PC", program_counter, ":", " ".join(self.core.program[program_counter]))
+
+    # --- Operand parsing ---
+
+    def read_register(self, register: str, index: int = None):
+        if register == "VL":
+            return self.core.SRs["VL"].registers[0][0]
+        if register == "VM":
+            return self.core.SRs["VM"].registers[0][0]
+        if register[:2] == "SR":
+            return self.core.RFs["SRF"].values[int(register[2:])]
+        return self.core.RFs["VRF"].registers[int(register[2:])][index if index != None else 0]
+
+    def parse_register(self, word: str):
+        # SRn, VRn, VRn[i], VL or VM -> (register, element index), raises ValueError.
+        word = word.strip().upper()
+        index = None
+        if word.endswith("]") and "[" in word:
+            word, index = word[:-1].split("[")
+            index = int(index)
+        if word in ("VL", "VM") and index == None:
+            return word, None
+        if word[:2] in ("SR", "VR") and word[2:].isdigit():
+            rf = self.core.RFs["SRF" if word[:2] == "SR" else "VRF"]
+            if int(word[2:]) < rf.reg_count and (index == None or (word[:2] == "VR" and 0 <= index < rf.vec_length)):
+                return word, index
+        raise ValueError("invalid register: " + word)
+
+    def parse_range(self, words: list):
+        # MEMORY START[:END] -> (DMEM, start, end), raises ValueError.
+        memory = {"SDMEM": self.core.SDMEM, "VDMEM": self.core.VDMEM}.get(words[0].upper())
+        if memory == None:
+            raise ValueError("unknown memory: " + words[0])
+        bounds = [int(word, 0) for word in words[1].split(":")]
+        start, end = bounds[0], bounds[-1]
+        if not 0 <= start <= end < memory.size:
+            raise ValueError("invalid address range: " + words[1])
+        return memory, start, end
+
+    # --- Commands ---
+
+    def do_break(self, arg):
+        "break PC [if REG OP VALUE] - stop before executing PC, optionally only when e.g. SR1 == 4 or VR2[3] > 0 holds."
+        words = arg.split()
+        try:
+            program_counter = int(words[0])
+            condition = None
+            if len(words) > 1:
+                if words[1] != "if" or len(words) != 5 or words[3] not in COMPARISONS:
+                    raise ValueError("expected: break PC if REG OP VALUE")
+                register, index = self.parse_register(words[2])
+                condition = (register, index, COMPARISONS[words[3]], int(words[4], 0))
+        except (ValueError, IndexError) as e:
+            print("Error:", e)
+            return
+        self.breakpoints.setdefault(program_counter, []).append(condition)
+        if condition == None:
+            print("Breakpoint at PC", program_counter)
+        else:
+            print("Breakpoint at PC", program_counter, "if", " ".join(words[2:]))
+
+    def do_delete(self, arg):
+        "delete [PC] - remove the breakpoints at PC, or all breakpoints."
+        if arg.strip():
+            try:
+                self.breakpoints.pop(int(arg), None)
+            except ValueError:
+                print("Error: invalid PC", arg)
+        else:
+            self.breakpoints = {}
+
+    def do_watch(self, arg):
+        "watch SDMEM|VDMEM START[:END] [r|w|rw] - stop after an instruction accesses the range (default: w)."
+        words = arg.split()
+        try:
+            memory, start, end = self.parse_range(words)
+            kind = words[2].upper() if len(words) > 2 else "W"
+            if kind not in ("R", "W", "RW"):
+                raise ValueError("access kind must be r, w or rw")
+        except (ValueError, IndexError) as e:
+            print("Error:", e)
+            return
+        self.watchpoints.append((memory.name, start, end, kind))
+        self.rebuild_watchpoints()
+        print("Watchpoint", len(self.watchpoints) - 1, "on", memory.name, start, "-", end, kind)
+
+    def do_unwatch(self, arg):
+        "unwatch [N] - remove watchpoint N, or all watchpoints."
+        if arg.strip():
+            try:
+                del self.watchpoints[int(arg)]
+            except (ValueError, IndexError):
+                print("Error: no watchpoint", arg)
+                return
+        else:
+            self.watchpoints = []
+        self.rebuild_watchpoints()
+
+    def do_info(self, arg):
+        "info - list the breakpoints and watchpoints."
+        for program_counter in sorted(self.breakpoints):
+            for condition in self.breakpoints[program_counter]:
+                if condition == None:
+                    print("Breakpoint at PC", program_counter)
+                else:
+                    print("Breakpoint at PC", program_counter, "(conditional)")
+        for i, (memory, start, end, kind) in enumerate(self.watchpoints):
+            print("Watchpoint", i, "on", memory, start, "-", end, kind)
+
+    def do_step(self, arg):
+        "step [N] - execute N instructions (default 1)."
+        try:
+            count = int(arg) if arg.strip() else 1
+        except ValueError:
+            print("Error: invalid count", arg)
+            return
+        if count > 0:
+            self.execute(count)
+
+    def do_continue(self, arg):
+        "continue - run until a breakpoint or watchpoint triggers or the program stops."
+        self.execute()
+
+    def do_inspect(self, arg):
+        "inspect SRn|VRn|VL|VM | SDMEM|VDMEM START[:END] - print a register or a memory slice."
+        words = arg.split()
+        try:
+            if len(words) == 2:
+                memory, start, end = self.parse_range(words)
+                values = [memory.Read(address) for address in range(start, end + 1)]
+                self.print_values(values, start)
+                return
+            register, index = self.parse_register(words[0])
+        except (ValueError, IndexError) as e:
+            print("Error:", e)
+            return
+        if register == "VM":
+            vector_mask = self.read_register("VM")
+            print("VM =", "{:064b}".format(vector_mask)[-64:], "(" + str(bin(vector_mask).count("1")), "lanes set)")
+        elif register[:2] == "VR" and index == None:
+            self.print_values(self.core.RFs["VRF"].registers[int(register[2:])], 0)
+        else:
+            print(register + ("" if index == None else "[{}]".format(index)), "=", self.read_register(register, index))
+
+    def print_values(self, values: list, first: int):
+        # Eight values per row, prefixed with the index / address of the first one.
+        width = max(len(str(value)) for value in values) if values else 1
+        for i in range(0, len(values), 8):
+            print("{:>8}: ".format(first + i) + " ".join(str(value).rjust(width) for value in values[i:i+8]))
+
+    def do_where(self, arg):
+        "where - show the next instruction."
+        self.show_current()
+
+    def do_log(self, arg):
+        "log on|off - show or hide the per-instruction log of the core while running."
+        self.log = arg.strip().lower() == "on"
+
+    def do_quit(self, arg):
+        "quit - leave the debugger."
+        return True
+
+    def do_EOF(self, arg):
+        print("")
+        return True
+
+    def emptyline(self):
+        pass
+
+if __name__ == "__main__":
+    #parse arguments for input file location
+    parser = argparse.ArgumentParser(description='Vector Core Debugger')
+    parser.add_argument('--iodir', default="", type=str, help='Path to the folder containing the input files - instructions and data.')
+    parser.add_argument('--commands', default=None, type=str, help='Read debugger commands from this file instead of the terminal.')
+    parser.add_argument('--log', action='store_true', help='Show the per-instruction log of the core while running.')
+    args = parser.parse_args()
+
+    iodir = os.path.abspath(args.iodir)
+    print("IO Directory:", iodir)
+
+    imem = skeleton.IMEM(iodir)
+    sdmem = skeleton.DMEM("SDMEM", iodir, 13)
+    vdmem = skeleton.DMEM("VDMEM", iodir, 17)
+    vcore = skeleton.Core(imem, sdmem, vdmem)
+
+    if args.commands:
+        with open(args.commands, 'r') as cmdf:
+            Debugger(vcore, iodir, args.log, cmdf).cmdloop()
+    else:
+        Debugger(vcore, iodir, args.log).cmdloop()
@@ -0,0 +1,331 @@
+import os
+import pickle
+import random
+import argparse
+import tempfile
+import contextlib
+from multiprocessing import Pool
+
+import skeleton
+import original
+
+# Differential fuzzing of the execution paths of the functional simulator against the plain Core.step loop, and
+# of that loop against the frozen original interpreter (original.py). Every random program is run by the
+# reference and by each backend, and the final architectural state (program counter, SRF, VRF, VL, VM, SDMEM
+# and VDMEM) has to match exactly. A diverging program is shrunk to a minimal reproducer and written out as an
+# IO directory that skeleton.py can run.
+#
+# Programs are a loop over a random body, so every run terminates:
+#   SR1, SR2  base addresses      SR3  stride (may be negative)   SR4, SR5  free scalars (VL candidates, extremes)
+#   SR6       1                   SR7  trip count                 VR7       small offsets for LVI / SVI
+# The body only writes SR1 - SR5 and VR0 - VR6, and only branches forward; the loop branch counts SR7 down, or a
+# LOOP instruction repeats the body SR7 times.
+
+MAX_STEPS = 5000
+
+VECTOR_ARITHMETIC = ["ADDVV", "SUBVV", "MULVV", "DIVVV", "ADDVS", "SUBVS", "MULVS", "DIVVS", "ADDPVV", "SUBPVV", "MULPVV", "CMULPVV"]
+VECTOR_COMPARE = ["SEQVV", "SNEVV", "SGTVV", "SLTVV", "SGEVV", "SLEVV", "SEQVS", "SNEVS", "SGTVS", "SLTVS", "SGEVS", "SLEVS"]
+SCALAR_ARITHMETIC = ["ADD", "SUB", "AND", "OR", "XOR"]
+EXTREMES = [0, 1, -1, 2, 7, 64, 2**15, -2**15, 2**30, 2**31 - 1, -2**31]
+
+# --- Programs ---
+
+def random_instruction(rng):
+    # One body instruction as a word list. Branch targets are filled in by random_program.
+    vr = lambda: "VR{}".format(rng.randint(0, 6))
+    sr = lambda: "SR{}".format(rng.randint(1, 5))
+    base = lambda: "SR{}".format(rng.randint(1, 2))
+    kind = rng.random()
+    if kind < 0.25:
+        op = rng.choice(VECTOR_ARITHMETIC)
+        return [op, vr(), vr(), vr() if op.endswith("VV") else "SR{}".format(rng.randint(0, 7))]
+    if kind < 0.35:
+        op = rng.choice(VECTOR_COMPARE)
+        return [op, vr(), vr() if op.endswith("VV") else "SR{}".format(rng.randint(0, 7))]
+    if kind < 0.45:
+        return [rng.choice(["LV", "SV"]), vr(), base()]
+    if kind < 0.52:
+        return [rng.choice(["LVWS", "SVWS"]), vr(), base(), "SR3"]
+    if kind < 0.57:
+        return [rng.choice(["LVI", "SVI"]), vr(), base(), "VR7"]
+    if kind < 0.63:
+        return [rng.choice(["UNPACKLO", "UNPACKHI", "PACKLO", "PACKHI"]), vr(), vr(), vr()]
+    if kind < 0.71:
+        return rng.choice([["CVM"], ["POP", sr()], ["MTCL", "SR{}".format(rng.randint(4, 5))], ["MFCL", sr()],
+                           [rng.choice(["SUMV", "MINV", "MAXV"]), sr(), vr()]])
+    if kind < 0.79:
+        if rng.random() < 0.5:
+            return ["LS", "SR{}".format(rng.randint(3, 5)), "SR0", str(rng.randint(3, 5))]
+        return ["SS", "SR{}".format(rng.randint(1, 7)), "SR0", str(rng.randint(8, 15))]
+    if kind < 0.87:
+        if rng.random() < 0.3:
+            return [rng.choice(["SLL", "SRL", "SRA"]), "SR{}".format(rng.randint(4, 5)), sr(), "SR6"]
+        if rng.random() < 0.3:
+            return [rng.choice(["ADD", "SUB"]), base(), base(), "SR3"] # Walk a base address by the stride.
+        return [rng.choice(SCALAR_ARITHMETIC), "SR{}".format(rng.randint(4, 5)), sr(), sr()]
+    return [rng.choice(["BEQ", "BNE", "BGT", "BLT", "BGE", "BLE"]), sr(), sr()] # Forward branch.
+
+def random_program(rng, max_body: int = 12):
+    # [{"id", "words", "target"}], see serialize. Ids follow program order. The loop either counts SR7 down and
+    # branches back, or is a LOOP instruction over the body, whose target is the HALT right after the body.
+    hardware = rng.random() < 0.3
+    items = [{"words": ["LS", "SR{}".format(r), "SR0", str(r)], "target": None} for r in range(1, 8)]
+    items.append({"words": ["LV", "VR7", "SR0"], "target": None})
+    if hardware:
+        items.append({"words": ["LOOP", "SR7"], "target": None})
+    body_start = len(items)
+    for _ in range(rng.randint(1, max_body)):
+        items.append({"words": random_instruction(rng), "target": None})
+    if not hardware:
+        items.append({"words": ["SUB", "SR7", "SR7", "SR6"], "target": None})
+        items.append({"words": ["BGT", "SR7", "SR0"], "target": body_start})
+    items.append({"words": ["HALT"], "target": None})
+    last = len(items) - 1 if hardware else len(items) - 3 # Up to the end of the body or the trip count update.
+    for i, item in enumerate(items):
+        item["id"] = i
+        if item["words"][0] == "LOOP":
+            item["target"] = len(items) - 1
+        elif item["words"][0] in skeleton.LoopCollapser.BRANCHES and item["target"] == None:
+            item["target"] = rng.randint(i + 1, last)
+    return items
+
+def serialize(items: list):
+    # Code.asm lines. A branch whose target was removed jumps to the next remaining instruction instead.
+    # The operand of LOOP is its body length, one less than the distance to its target.
+    positions = {item["id"]: position for position, item in enumerate(items)}
+    ids = sorted(positions)
+    lines = []
+    for position, item in enumerate(items):
+        words = list(item["words"])
+        if item["target"] != None:
+            target = next((i for i in ids if i >= item["target"]), ids[-1])
+            words.append(str(positions[target] - position - (1 if words[0] == "LOOP" else 0)))
+        lines.append(" ".join(words))
+    return lines
+
+def random_images(rng):
+    sdmem = [0] * 16
+    sdmem[1] = rng.randint(2000, 6000)
+    sdmem[2] = rng.randint(2000, 6000)
+    sdmem[3] = rng.choice([0, 1, 2, 3, -1, -7, 16, -30, rng.randint(-30, 30)])
+    sdmem[4] = rng.choice([0, 1, 3, 17, 32, 63, 64, rng.randint(0, 64)])
+    sdmem[5] = rng.choice(EXTREMES + [rng.randint(-100, 100)])
+    sdmem[6] = 1
+    sdmem[7] = rng.randint(1, 6)
+    vdmem = [rng.randint(0, 80) for _ in range(64)]
+    vdmem += [rng.choice(EXTREMES) if rng.random() < 0.3 else rng.randint(-1000, 1000) for _ in range(8192 - 64)]
+    return sdmem, vdmem
+
+def random_case(seed: int):
+    rng = random.Random(seed)
+    items = random_program(rng)
+    sdmem, vdmem = random_images(rng)
+    return items, sdmem, vdmem, rng.random()
+
+# --- Backends ---
+
+def make_core(lines: list, sdmem: list, vdmem: list):
+    core = skeleton.Core(skeleton.IMEM("", lines), skeleton.DMEM("SDMEM", "", 13, sdmem), skeleton.DMEM("VDMEM", "", 17, vdmem))
+    core.load_program()
+    return core
+
+def trimmed(values):
+    values = list(values)
+    while values and values[-1] == 0:
+        values.pop()
+    return values
+
+def final_state(core, error = None):
+    return {"error": error, "program_counter": core.program_counter,
+            "SRF": list(core.RFs["SRF"].values), "VRF": [list(r) for r in core.RFs["VRF"].registers],
+            "VL": core.SRs["VL"].registers[0][0], "VM": core.SRs["VM"].registers[0][0],
+            "SDMEM": trimmed(core.SDMEM.data), "VDMEM": trimmed(core.VDMEM.data)}
+
+def run_steps(core, limit: int = MAX_STEPS):
+    # Step until the program stops; None if it stopped, "steps" if it ran out of steps, else the exception name.
+    try:
+        for _ in range(limit):
+            if not core.step():
+                return None
+    except Exception as e: # A crash is an outcome the backends have to agree on.
+        return type(e).__name__
+    return "steps"
+
+def run_reference(lines, sdmem, vdmem, split):
+    core = make_core(lines, sdmem, vdmem)
+    return final_state(core, run_steps(core))
+
+def run_collapse(lines, sdmem, vdmem, split):
+    core = make_core(lines, sdmem, vdmem)
+    core.enable_loop_collapsing()
+    return final_state(core, run_steps(core))
+
+def run_lockstep(lines, sdmem, vdmem, split):
+    # Two cores share the decoded program, the second one with another trip count so the batch diverges at the
+    # loop exit. The first one has to match the reference. A crash of the second core would end the whole batch,
+    # so if its own run crashes both cores get the same images.
+    other_sdmem = list(sdmem)
+    other_sdmem[7] = 1 + int(split * 6)
+    if run_reference(lines, other_sdmem, vdmem, split)["error"] != None:
+        other_sdmem = sdmem
+    cores = [make_core(lines, sdmem, vdmem), make_core(lines, other_sdmem, vdmem)]
+    try:
+        skeleton.run_lockstep(cores)
+        error = None
+    except Exception as e:
+        error = type(e).__name__
+    return final_state(cores[0], error)
+
+def run_resume(lines, sdmem, vdmem, split):
+    # Stop after a random number of steps, pickle the snapshot and finish on a fresh core.
+    core = make_core(lines, sdmem, vdmem)
+    steps = int(split * 200)
+    try:
+        for _ in range(steps):
+            if not core.step():
+                return final_state(core)
+    except Exception as e:
+        return final_state(core, type(e).__name__)
+    state = pickle.loads(pickle.dumps(core.snapshot()))
+    core = make_core(lines, sdmem, vdmem)
+    core.restore(state)
+    return final_state(core, run_steps(core, MAX_STEPS - steps))
+
+class NullObserver(object):
+    def on_retire(self, events):
+        pass
+
+    def on_memory_access(self, events):
+        pass
+
+    def on_register_write(self, events):
+        pass
+
+def run_observed(lines, sdmem, vdmem, split):
+    # Every instrumentation wrapper installed.
+    core = make_core(lines, sdmem, vdmem)
+    core.add_observer(NullObserver(), batch_size = 7)
+    error = run_steps(core)
+    core.instrumentation.flush()
+    return final_state(core, error)
+
+ADDED_INSTRUCTIONS = {"LOOP"} | set(skeleton.PACKED_OPERATIONS) | set(skeleton.REDUCTIONS)
+
+def run_original(lines, sdmem, vdmem, split):
+    # The frozen interpreter skeleton.py started from (see original.py), which loads the images from files. It
+    # has no step function, so it is compared on the final state only. Programs using instructions added since
+    # are skipped (None).
+    if any(line.split(" ")[0] in ADDED_INSTRUCTIONS for line in lines):
+        return None
+    with tempfile.TemporaryDirectory() as iodir:
+        write_files(iodir, lines, sdmem, vdmem)
+        core = original.Core(original.IMEM(iodir), original.DMEM("SDMEM", iodir, 13), original.DMEM("VDMEM", iodir, 17))
+    try:
+        error = None if core.run(MAX_STEPS) else "steps"
+    except Exception as e:
+        # No output files are written after a crash, and skeleton.py computes vector results in place, so only
+        # the crash itself has to match.
+        return {"error": type(e).__name__}
+    return {"error": error, "program_counter": core.program_counter,
+            "SRF": [register[0] for register in core.RFs["SRF"].registers], "VRF": [list(r) for r in core.RFs["VRF"].registers],
+            "VL": core.SRs["VL"].registers[0][0], "VM": core.SRs["VM"].registers[0][0],
+            "SDMEM": trimmed(core.SDMEM.data), "VDMEM": trimmed(core.VDMEM.data)}
+
+BACKENDS = {"collapse": run_collapse, "lockstep": run_lockstep, "resume": run_resume, "observed": run_observed,
+            "original": run_original}
+
+def diverging(items, sdmem, vdmem, split, backends: list):
+    # (backend, first differing part of the state) for the first backend disagreeing with the reference, or None.
+    # Programs running out of steps in the reference are not valid cases, a backend returning None skips the case.
+    lines = serialize(items)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        expected = run_reference(lines, sdmem, vdmem, split)
+        if expected["error"] == "steps":
+            return None
+        for name in backends:
+            state = BACKENDS[name](lines, sdmem, vdmem, split)
+            if state == None:
+                continue
+            for part in state:
+                if state[part] != expected[part]:
+                    return name, part
+    return None
+
+def check_seed(job):
+    seed, backends = job
+    items, sdmem, vdmem, split = random_case(seed)
+    return seed, diverging(items, sdmem, vdmem, split, backends)
+
+# --- Minimization ---
+
+def minimize(items, sdmem, vdmem, split, backends: list):
+    # Greedy delta debugging: drop chunks of body instructions (halving the chunk size down to one) while the
+    # program still diverges, then zero the memory images where possible.
+    failing = lambda candidate, sd, vd: diverging(candidate, sd, vd, split, backends) != None
+    fixed = lambda item: item["words"][0] == "HALT"
+    chunk = max(1, len(items) // 2)
+    while chunk >= 1:
+        i = 0
+        while i < len(items):
+            candidate = items[:i] + [item for item in items[i:i + chunk] if fixed(item)] + items[i + chunk:]
+            if len(candidate) < len(items) and failing(candidate, sdmem, vdmem):
+                items = candidate
+            else:
+                i += chunk
+        chunk //= 2
+    for image in ("sdmem", "vdmem"):
+        values = sdmem if image == "sdmem" else vdmem
+        step = max(1, len(values) // 2)
+        while step >= 1:
+            for start in range(0, len(values), step):
+                if any(values[start:start + step]):
+                    candidate = values[:start] + [0] * len(values[start:start + step]) + values[start + step:]
+                    if failing(items, candidate if image == "sdmem" else sdmem, candidate if image == "vdmem" else vdmem):
+                        values = candidate
+                        if image == "sdmem":
+                            sdmem = values
+                        else:
+                            vdmem = values
+            step //= 2
+    return items, sdmem, vdmem
+
+def write_case(directory: str, items: list, sdmem: list, vdmem: list):
+    os.makedirs(directory, exist_ok=True)
+    write_files(directory, serialize(items), sdmem, vdmem)
+
+def write_files(directory: str, lines: list, sdmem: list, vdmem: list):
+    with open(os.path.join(directory, "Code.asm"), 'w') as f:
+        f.write("\n".join(lines) + "\n")
+    for name, values in (("SDMEM.txt", trimmed(sdmem)), ("VDMEM.txt", trimmed(vdmem))):
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write("".join("{}\n".format(value) for value in values))
+
+def fuzz(programs: int, seed: int = 0, backends: list = None, processes: int = None, output: str = "fuzz_failures"):
+    # Check `programs` random cases in parallel, returns the failing seeds after writing their minimized cases.
+    backends = backends or list(BACKENDS)
+    jobs = [(seed + i, backends) for i in range(programs)]
+    with Pool(processes) as pool:
+        failures = [(case_seed, divergence) for case_seed, divergence in pool.imap_unordered(check_seed, jobs, chunksize = 16)
+                    if divergence != None]
+    for case_seed, (backend, part) in sorted(failures):
+        items, sdmem, vdmem, split = random_case(case_seed)
+        items, sdmem, vdmem = minimize(items, sdmem, vdmem, split, [backend])
+        directory = os.path.join(output, "seed_{}".format(case_seed))
+        write_case(directory, items, sdmem, vdmem)
+        print("FUZZ - MISMATCH: seed", case_seed, "backend", backend, "differs in", part, "- minimized case written into", directory)
+        for line in serialize(items):
+            print("    " + line)
+    return [case_seed for case_seed, divergence in failures]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Vector Core Differential Fuzzer')
+    parser.add_argument('--programs', default=1000, type=int, help='Number of random programs to check.')
+    parser.add_argument('--seed', default=0, type=int, help='Seed of the first program, program i uses seed + i.')
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS), help='Execution paths to compare with the reference.')
+    parser.add_argument('--jobs', default=None, type=int, help='Number of worker processes, defaults to the number of CPUs.')
+    parser.add_argument('--output', default="fuzz_failures", type=str, help='Directory receiving the minimized failing cases.')
+    args = parser.parse_args()
+
+    failures = fuzz(args.programs, args.seed, args.backends, args.jobs, args.output)
+    print("FUZZ -", args.programs, "programs,", len(failures), "mismatches")
+    raise SystemExit(1 if failures else 0)
@@ -0,0 +1,134 @@
+import os
+import time
+import pickle
+import hashlib
+
+import skeleton
+from sampling import basic_blocks
+
+# Incremental re-simulation. While a program runs, its state is checkpointed at basic block boundaries, each time
+# the execution is about to leave the part of the program it has executed so far (its prefix). Every instruction
+# executed before the checkpoint lies inside that prefix, so the checkpoint is valid for any program with the same
+# decoded prefix and the same input images. A later run looks up the deepest checkpoint matching its own prefixes
+# and resumes from there, so editing the tail of Code.asm only re-executes the instructions after the edit point.
+
+def prefix_hashes(program: list):
+    # hashes[n] identifies the first n decoded instructions. Comments and blank lines are not part of the key.
+    digest = hashlib.sha256()
+    hashes = [digest.hexdigest()[:32]]
+    for instruction in program:
+        digest.update((" ".join(instruction) + "\n").encode())
+        hashes.append(digest.hexdigest()[:32])
+    return hashes
+
+def input_key(core):
+    # The simulator source and the memory images the run starts from.
+    digest = hashlib.sha256()
+    with open(skeleton.__file__, 'rb') as f:
+        digest.update(f.read())
+    digest.update(core.SDMEM.data.tobytes())
+    digest.update(b'\0')
+    digest.update(core.VDMEM.data.tobytes())
+    return digest.hexdigest()[:32]
+
+class CheckpointStore(object):
+    # Checkpoints on disk, one pickle per checkpoint named "<inputs>-<prefix hash>-<prefix length>-<retired>.pkl".
+    # The name holds the whole key, so a lookup only lists the directory. Loading or saving a checkpoint marks it as
+    # used, and the least recently used ones are removed beyond `limit` checkpoints.
+    def __init__(self, directory: str, limit: int = 64):
+        self.directory = os.path.abspath(directory)
+        self.limit = limit
+        os.makedirs(self.directory, exist_ok=True)
+
+    def entries(self):
+        # [(inputs, prefix hash, prefix length, retired instructions, file name)]
+        entries = []
+        for name in os.listdir(self.directory):
+            fields = name[:-len(".pkl")].split("-") if name.endswith(".pkl") else []
+            if len(fields) == 4 and fields[2].isdigit() and fields[3].isdigit():
+                entries.append((fields[0], fields[1], int(fields[2]), int(fields[3]), name))
+        return entries
+
+    def lookup(self, inputs: str, hashes: list):
+        # Deepest checkpoint of a run over the same inputs whose prefix matches the program, or None.
+        matches = [entry for entry in self.entries()
+                   if entry[0] == inputs and entry[2] < len(hashes) and hashes[entry[2]] == entry[1]]
+        for entry in sorted(matches, key = lambda entry: entry[3], reverse = True):
+            path = os.path.join(self.directory, entry[4])
+            try:
+                with open(path, 'rb') as f:
+                    checkpoint = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                continue # Removed or half written by a concurrent run.
+            os.utime(path)
+            return checkpoint
+        return None
+
+    def save(self, inputs: str, hashes: list, reach: int, retired: int, state: dict):
+        name = "{}-{}-{}-{}.pkl".format(inputs, hashes[reach], reach, retired)
+        path = os.path.join(self.directory, name)
+        if os.path.exists(path):
+            os.utime(path)
+            return
+        temporary = path + ".{}.tmp".format(os.getpid())
+        with open(temporary, 'wb') as f:
+            pickle.dump({"reach": reach, "retired": retired, "state": state}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self):
+        paths = [os.path.join(self.directory, entry[4]) for entry in self.entries()]
+        if len(paths) <= self.limit:
+            return
+        used = {}
+        for path in paths:
+            try:
+                used[path] = os.path.getmtime(path)
+            except OSError:
+                pass
+        for path in sorted(used, key = used.get)[:len(used) - self.limit]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def run_incremental(core, store: CheckpointStore, gap: int = 10000):
+    # Core.run, resuming from the deepest matching checkpoint of the store and saving new checkpoints at least
+    # `gap` retired instructions apart. A recorded trace, the efficiency counters and the observers need the whole
+    # run, so a core with any of them does not resume.
+    # Returns the number of retired instructions skipped by resuming.
+    if core.program == None:
+        core.load_program()
+    hashes = prefix_hashes(core.program)
+    blocks = basic_blocks(core.program)
+    inputs = input_key(core)
+    retired = 0
+    reach = 0 # Every instruction executed so far lies below this PC.
+
+    whole_run = core.trace != None or core.efficiency != None or core.instrumentation != None
+    checkpoint = store.lookup(inputs, hashes) if not whole_run else None
+    if checkpoint != None:
+        core.restore(checkpoint["state"])
+        retired = checkpoint["retired"]
+        reach = checkpoint["reach"]
+        print("CHECKPOINT - Resumed at program counter", core.program_counter, "after", retired, "instructions")
+    skipped = retired
+    saved = retired
+
+    start = time.perf_counter()
+    while True:
+        program_counter = core.program_counter
+        if program_counter >= reach and retired - saved >= gap and 0 < program_counter < len(blocks) and blocks[program_counter] != blocks[program_counter - 1]:
+            store.save(inputs, hashes, reach, retired, core.snapshot())
+            saved = retired
+        if not core.step():
+            break
+        retired += 1
+        # A collapsed loop or a forward branch moves the program counter past instructions that may not have run;
+        # counting them into the prefix only makes the key stricter.
+        reach = max(reach, program_counter + 1, core.program_counter)
+
+    if core.instrumentation != None:
+        core.instrumentation.flush()
+    print("CHECKPOINT - Ran", retired - skipped, "instructions in", "{:.3f}".format(time.perf_counter() - start), "s")
+    return skipped
@@ -0,0 +1,316 @@
+import os
+import math
+import random
+import argparse
+import contextlib
+from multiprocessing import Pool
+
+import skeleton
+import timing
+
+# Sampled timing simulation.
+#   1. profile: a functional run splits the retired instructions into fixed-size intervals and records the basic
+#      block vector (instructions executed per basic block) of every interval.
+#   2. cluster: the normalized vectors are grouped into phases with k-means, and a few intervals of each phase are
+#      picked, the one closest to the phase centroid first.
+#   3. record_intervals: a second functional run only records the trace of the picked intervals, each preceded by
+#      `warmup` instructions to warm up the pipeline and bank state. It skips ahead by restoring the checkpoints
+#      the profile run took at interval boundaries, and only steps from the nearest one before each interval.
+#   4. estimate: the trace slices are replayed by the timing model of a configuration, and the cycles per
+#      instruction of each phase are extrapolated to all the instructions of that phase.
+# Steps 1-3 are functional and independent of the hardware configuration, so a sweep pays them once and then
+# simulates only the sampled instructions per configuration.
+
+def basic_blocks(program: list):
+    # Basic block number of every PC: blocks start at PC 0, at branch targets and after branches.
+    leaders = {0}
+    for pc, instruction in enumerate(program):
+        if instruction[0] in timing.BRANCHES:
+            leaders.add(pc + 1)
+            try:
+                leaders.add(pc + int(instruction[3]))
+            except (ValueError, IndexError):
+                pass
+        elif instruction[0] == "LOOP":
+            try:
+                leaders.add(pc + 1)
+                leaders.add(pc + 1 + int(instruction[2]))
+            except (ValueError, IndexError):
+                pass
+    blocks = []
+    for pc in range(len(program)):
+        if pc in leaders and pc > 0:
+            blocks.append(blocks[-1] + 1)
+        else:
+            blocks.append(blocks[-1] if blocks else 0)
+    return blocks
+
+class BlockProfiler(object):
+    # Observer collecting the basic block vector of every `interval` retired instructions.
+    def __init__(self, blocks: list, interval: int):
+        self.blocks = blocks
+        self.interval = interval
+        self.vectors = []
+        self.current = [0] * (max(blocks) + 1 if blocks else 1)
+        self.count = 0
+        self.instructions = 0
+
+    def on_retire(self, events):
+        blocks = self.blocks
+        current = self.current
+        for pc, words in events:
+            current[blocks[pc]] += 1
+            self.count += 1
+            if self.count == self.interval:
+                self.vectors.append(current)
+                current = self.current = [0] * len(current)
+                self.count = 0
+        self.instructions += len(events)
+
+    def finish(self):
+        if self.count:
+            self.vectors.append(self.current)
+        return self.vectors
+
+class Checkpoints(object):
+    # Core snapshots taken every `spacing` retired instructions. At most MAX_CHECKPOINTS are kept: when there are
+    # more, every other one is dropped and the spacing doubles, so long runs stay within a fixed memory budget.
+    MAX_CHECKPOINTS = 64
+
+    def __init__(self, spacing: int):
+        self.spacing = spacing
+        self.snapshots = {} # Retired instructions -> snapshot.
+
+    def add(self, retired: int, state: dict):
+        self.snapshots[retired] = state
+        if len(self.snapshots) > Checkpoints.MAX_CHECKPOINTS:
+            self.spacing *= 2
+            self.snapshots = {position: state for position, state in self.snapshots.items() if position % self.spacing == 0}
+
+    def before(self, retired: int):
+        # (position, snapshot) of the last checkpoint at or before retired, or (0, None).
+        positions = [position for position in self.snapshots if position <= retired]
+        if not positions:
+            return 0, None
+        return max(positions), self.snapshots[max(positions)]
+
+def make_core(iodir):
+    imem = skeleton.IMEM(iodir)
+    sdmem = skeleton.DMEM("SDMEM", iodir, 13)
+    vdmem = skeleton.DMEM("VDMEM", iodir, 17)
+    core = skeleton.Core(imem, sdmem, vdmem)
+    core.load_program()
+    return core
+
+def profile(iodir, interval: int):
+    # Basic block vectors of all the intervals of a functional run over iodir, the number of instructions and
+    # the checkpoints of the run at interval boundaries.
+    checkpoints = Checkpoints(interval)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        core = make_core(iodir)
+        profiler = BlockProfiler(basic_blocks(core.program), interval)
+        core.add_observer(profiler)
+        retired = 0
+        while core.step():
+            retired += 1
+            if retired % checkpoints.spacing == 0:
+                checkpoints.add(retired, core.snapshot())
+        core.instrumentation.flush()
+    return profiler.finish(), profiler.instructions, checkpoints
+
+def distance(a: list, b: list):
+    return sum((x - y) * (x - y) for x, y in zip(a, b))
+
+def kmeans(points: list, k: int, rng, iterations: int = 100):
+    # Lloyd's algorithm with k-means++ seeding. Returns (labels, centroids, sum of squared distances).
+    centroids = [list(rng.choice(points))]
+    while len(centroids) < k:
+        weights = [min(distance(point, centroid) for centroid in centroids) for point in points]
+        if sum(weights) == 0:
+            break
+        centroids.append(list(rng.choices(points, weights)[0]))
+    labels = None
+    for _ in range(iterations):
+        new_labels = [min(range(len(centroids)), key = lambda c: distance(point, centroids[c])) for point in points]
+        if new_labels == labels:
+            break
+        labels = new_labels
+        for c in range(len(centroids)):
+            members = [point for point, label in zip(points, labels) if label == c]
+            if members:
+                centroids[c] = [sum(column) / len(members) for column in zip(*members)]
+    sse = sum(distance(point, centroids[label]) for point, label in zip(points, labels))
+    return labels, centroids, sse
+
+def cluster(vectors: list, max_phases: int = 8, threshold: float = 0.05, seed: int = 0):
+    # Phases of the intervals: the smallest k whose clustering leaves at most `threshold` of the spread of a
+    # single cluster, best of a few seeds per k. Vectors are normalized, so the interval length does not matter.
+    points = [[count / max(1, sum(vector)) for count in vector] for vector in vectors]
+    rng = random.Random(seed)
+    best = None
+    for k in range(1, min(max_phases, len(points)) + 1):
+        best = min((kmeans(points, k, rng) for _ in range(3)), key = lambda result: result[2])
+        if k == 1:
+            spread = best[2]
+        if best[2] <= threshold * spread:
+            break
+    labels, centroids, sse = best
+    # Renumber the phases in order of first appearance, dropping empty ones.
+    order = {}
+    for label in labels:
+        order.setdefault(label, len(order))
+    return [order[label] for label in labels], [centroids[label] for label in sorted(order, key = order.get)], points
+
+def choose_samples(points: list, labels: list, centroids: list, per_phase: int, rng):
+    # Sampled intervals of every phase: the one closest to the centroid, then random other members.
+    samples = {}
+    for phase, centroid in enumerate(centroids):
+        members = [i for i, label in enumerate(labels) if label == phase]
+        representative = min(members, key = lambda i: distance(points[i], centroid))
+        others = [i for i in members if i != representative]
+        samples[phase] = [representative] + rng.sample(others, min(len(others), per_phase - 1))
+    return samples
+
+def record_intervals(iodir, ranges: list, checkpoints: Checkpoints = None):
+    # Trace slices of the given (start, end) retired instruction ranges, from a functional run that only records
+    # while inside one of them, and resumes from the last checkpoint before each one. Returns {(start, end): trace}.
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    recorded = []
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        core = make_core(iodir)
+        retired = 0
+        for start, end in merged:
+            position, state = checkpoints.before(start) if checkpoints != None else (0, None)
+            if position > retired:
+                core.restore(state)
+                retired = position
+            while retired < start and core.step():
+                retired += 1
+            core.trace = []
+            while retired < end and core.step():
+                retired += 1
+            recorded.append((start, core.trace))
+            core.trace = None
+    slices = {}
+    for start, end in ranges:
+        for base, trace in recorded:
+            if base <= start and end <= base + len(trace):
+                slices[(start, end)] = trace[start - base:end - base]
+                break
+    return slices
+
+class SampledRun(object):
+    # Functional part of a sampled simulation: phases, sampled intervals and their trace slices.
+    def __init__(self, iodir, interval: int = 1000, max_phases: int = 8, per_phase: int = 2, warmup: int = 500, seed: int = 0):
+        self.iodir = iodir
+        self.interval = interval
+        self.warmup = warmup
+        vectors, self.instructions, checkpoints = profile(iodir, interval)
+        self.labels, centroids, points = cluster(vectors, max_phases, seed = seed)
+        self.lengths = [sum(vector) for vector in vectors]
+        self.samples = choose_samples(points, self.labels, centroids, per_phase, random.Random(seed))
+        self.ranges = {}
+        for phase, intervals in self.samples.items():
+            for i in intervals:
+                start = i * interval
+                self.ranges[i] = (max(0, start - warmup), start + self.lengths[i])
+        self.traces = record_intervals(iodir, list(self.ranges.values()), checkpoints)
+
+    def phase_instructions(self, phase: int):
+        return sum(length for length, label in zip(self.lengths, self.labels) if label == phase)
+
+    def sampled_instructions(self):
+        return sum(len(trace) for trace in self.traces.values())
+
+    def estimate(self, config):
+        # Extrapolated cycles for one configuration with a 95% confidence half-width from the spread of the
+        # cycles per instruction among the sampled intervals of each phase (stratified sampling).
+        model = timing.TimingModel(config)
+        phases = []
+        for phase, intervals in sorted(self.samples.items()):
+            cpis = []
+            for i in intervals:
+                start, end = self.ranges[i]
+                stats = model.simulate(self.traces[(start, end)], i * self.interval - start)
+                cpis.append(stats["cycles"] / max(1, stats["instructions"]))
+            phases.append((phase, cpis, len([label for label in self.labels if label == phase]), self.phase_instructions(phase)))
+
+        # Phases with a single sample borrow the pooled relative variance of the others.
+        relative = [variance(cpis) / (mean(cpis) ** 2) for phase, cpis, count, instructions in phases if len(cpis) > 1 and mean(cpis) > 0]
+        pooled = mean(relative) if relative else None
+        cycles = 0.0
+        error = 0.0
+        for phase, cpis, count, instructions in phases:
+            cycles += mean(cpis) * instructions
+            if len(cpis) < count:
+                spread = variance(cpis) if len(cpis) > 1 else (pooled * mean(cpis) ** 2 if pooled != None else None)
+                if spread == None:
+                    error = None
+                elif error != None:
+                    error += (instructions ** 2) * spread / len(cpis) * (1 - len(cpis) / count)
+        return {"config": config.name, "cycles": round(cycles), "error": None if error == None else 1.96 * math.sqrt(error),
+                "phases": len(phases), "simulated_instructions": self.sampled_instructions(), "instructions": self.instructions}
+
+# Sampled run shared with the pool workers, see timing.simulate_configs.
+_worker_run = None
+
+def _init_worker(run):
+    global _worker_run
+    _worker_run = run
+
+def _estimate_worker(config):
+    return _worker_run.estimate(config)
+
+def estimate_configs(run: SampledRun, configs: list, processes: int = None):
+    if processes == 1 or len(configs) <= 1:
+        return [run.estimate(config) for config in configs]
+    with Pool(processes, initializer=_init_worker, initargs=(run,)) as pool:
+        return pool.map(_estimate_worker, configs)
+
+def mean(values: list):
+    return sum(values) / len(values)
+
+def variance(values: list):
+    average = mean(values)
+    return sum((value - average) ** 2 for value in values) / (len(values) - 1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Vector Core Sampled Timing Simulation')
+    parser.add_argument('--iodir', default="", type=str, help='Path to the folder containing the input files - instructions and data.')
+    parser.add_argument('--config', nargs='*', default=[], type=str, help='Timing configuration files, defaults to Config.txt in iodir.')
+    parser.add_argument('--interval', default=1000, type=int, help='Instructions per interval.')
+    parser.add_argument('--max-phases', default=8, type=int, help='Upper bound on the number of phases.')
+    parser.add_argument('--per-phase', default=2, type=int, help='Intervals simulated per phase.')
+    parser.add_argument('--warmup', default=500, type=int, help='Instructions simulated before each interval to warm up the pipeline.')
+    parser.add_argument('--seed', default=0, type=int, help='Seed for the clustering and the sample choice.')
+    parser.add_argument('--jobs', default=None, type=int, help='Number of worker processes, defaults to the number of CPUs.')
+    parser.add_argument('--validate', action='store_true', help='Also run the full timing simulation and print the estimation error.')
+    args = parser.parse_args()
+
+    iodir = os.path.abspath(args.iodir)
+    print("IO Directory:", iodir)
+
+    run = SampledRun(iodir, args.interval, args.max_phases, args.per_phase, args.warmup, args.seed)
+    print("Sampling -", run.instructions, "instructions,", len(run.labels), "intervals,", len(run.samples), "phases,",
+          run.sampled_instructions(), "instructions to simulate per configuration")
+
+    if args.config:
+        configs = [timing.Config(filepath) for filepath in args.config]
+    elif os.path.exists(os.path.join(iodir, "Config.txt")):
+        configs = [timing.Config(os.path.join(iodir, "Config.txt"))]
+    else:
+        configs = [timing.Config()]
+    trace = timing.record_trace(iodir) if args.validate else None
+
+    for config, stats in zip(configs, estimate_configs(run, configs, args.jobs)):
+        error = "n/a" if stats["error"] == None else "{:.0f}".format(stats["error"])
+        line = "{:<24} cycles: {:<10} +/- {}".format(stats["config"], stats["cycles"], error)
+        if trace != None:
+            full = timing.TimingModel(config).simulate(trace)["cycles"]
+            line += "  (full: {}, error: {:+.2f}%)".format(full, 100.0 * (stats["cycles"] - full) / full)
+        print(line)
@@ -0,0 +1,271 @@
+import io
+import os
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+import contextlib
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+import skeleton
+
+# Protocol: newline delimited JSON over a Unix socket or a localhost TCP port.
+# A client sends one job per line and receives a stream of events, one per line, tagged with the job number it
+# was given in submission order on that connection:
+#   {"job": 0, "event": "queued", "position": 3}
+#   {"job": 0, "event": "started"}
+#   {"job": 0, "event": "done", "instructions": ..., "seconds": ..., ...} or {"job": 0, "event": "error", "error": ...}
+# A job is either
+#   {"iodir": path, "datadir": path}                     - Code.asm from iodir, data images and outputs in datadir (default iodir)
+#   {"program": [lines], "sdmem": [ints], "vdmem": [ints]} - everything inline, the final state is returned instead of dumped
+# with the options "trace" (record and dump Trace.txt), "collapse_loops" (see Core.enable_loop_collapsing),
+# "efficiency" (return the report of Core.enable_efficiency_counters as text), "log" (return the per-instruction log)
+# and "return_state" (return registers and memories for iodir jobs too).
+
+def parse_address(address: str):
+    # "host:port" (TCP) or a Unix socket path.
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return host, int(port)
+    return address, None
+
+# --- Worker side ---
+
+PROGRAM_CACHE_SIZE = 64
+
+# Decoded programs kept by a worker between jobs: program hash -> [program, operands, LoopCollapser template].
+_programs = collections.OrderedDict()
+
+def decoded_program(core):
+    key = hashlib.sha256("\n".join(core.IMEM.instructions).encode()).hexdigest()
+    if key in _programs:
+        _programs.move_to_end(key)
+        entry = _programs[key]
+        core.load_program(entry[0], entry[1])
+    else:
+        core.load_program()
+        entry = _programs[key] = [core.program, core.operands, None]
+        if len(_programs) > PROGRAM_CACHE_SIZE:
+            _programs.popitem(last = False)
+    return entry
+
+def run_job(job: dict):
+    # Run one job to completion in the current process and return its "done" event payload.
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        log = io.StringIO() if job.get("log") else stack.enter_context(open(os.devnull, 'w'))
+        stack.enter_context(contextlib.redirect_stdout(log))
+        if "iodir" in job:
+            iodir = os.path.abspath(job["iodir"])
+            datadir = os.path.abspath(job.get("datadir", iodir))
+            imem = skeleton.IMEM(iodir)
+            sdmem = skeleton.DMEM("SDMEM", datadir, 13)
+            vdmem = skeleton.DMEM("VDMEM", datadir, 17)
+        else:
+            datadir = None
+            imem = skeleton.IMEM("", job["program"])
+            sdmem = skeleton.DMEM("SDMEM", "", 13, job.get("sdmem", []))
+            vdmem = skeleton.DMEM("VDMEM", "", 17, job.get("vdmem", []))
+        core = skeleton.Core(imem, sdmem, vdmem)
+        entry = decoded_program(core)
+        if job.get("trace"):
+            core.trace = []
+        if job.get("collapse_loops"):
+            if entry[2] == None:
+                entry[2] = skeleton.LoopCollapser(core)
+            core.enable_loop_collapsing(entry[2])
+        if job.get("efficiency"):
+            core.enable_efficiency_counters()
+
+        instructions = 1
+        while core.step():
+            instructions += 1
+
+        if core.loops != None:
+            core.loops.dump_report()
+        result = {"instructions": instructions, "seconds": time.perf_counter() - start, "pc": core.program_counter}
+        if datadir != None:
+            core.dumpregs(datadir)
+            if job.get("trace"):
+                core.dumptrace(datadir)
+            sdmem.dump()
+            vdmem.dump()
+            result["outputs"] = datadir
+    if core.loops != None:
+        result["loops"] = {head: report for head, report in core.loops.report.items()}
+    if core.efficiency != None:
+        report = io.StringIO()
+        with contextlib.redirect_stdout(report):
+            core.efficiency.dump_report()
+        result["efficiency"] = report.getvalue()
+    if datadir == None or job.get("return_state"):
+        result["SRF"] = core.RFs["SRF"].registers
+        result["VRF"] = core.RFs["VRF"].registers
+        result["SDMEM"] = sdmem.data.tolist()
+        result["VDMEM"] = vdmem.data.tolist()
+    if job.get("log"):
+        result["log"] = log.getvalue()
+    return result
+
+def warm_worker():
+    # Pool initializer: pay the imports and the first allocations when a worker starts rather than on its first job.
+    run_job({"program": ["CVM", "HALT"]})
+    _programs.clear()
+
+# --- Server side ---
+
+class SimulationServer(object):
+    # Accepts jobs from any number of connections into one FIFO queue, served by `workers` dispatchers which each
+    # hand one job at a time to the process pool.
+    def __init__(self, workers: int = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = None
+        self.queue = asyncio.Queue()
+        self.completed = 0
+
+    async def warm(self):
+        self.pool = ProcessPoolExecutor(self.workers, initializer = warm_worker)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self.pool, os.getpid) for _ in range(self.workers)])
+        print("Server - Started", self.workers, "worker processes")
+
+    async def dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job, send = await self.queue.get()
+            try:
+                await send({"event": "started"})
+                try:
+                    result = await loop.run_in_executor(self.pool, run_job, job)
+                    result["event"] = "done"
+                except Exception as e: # Report a failing job to its client and keep serving the others.
+                    result = {"event": "error", "error": "{}: {}".format(type(e).__name__, e)}
+                self.completed += 1
+                await send(result)
+            finally:
+                self.queue.task_done()
+
+    async def handle(self, reader, writer):
+        lock = asyncio.Lock()
+        pending = []
+        number = 0
+        while True:
+            try:
+                line = await reader.readline()
+            except ConnectionError:
+                break
+            if not line:
+                break
+            if not line.strip():
+                continue
+            job_number = number
+            number += 1
+
+            async def send(event, job_number = job_number):
+                # Events for a client that has disconnected are dropped, its jobs still run to completion.
+                event["job"] = job_number
+                async with lock:
+                    if writer.is_closing():
+                        return
+                    try:
+                        writer.write((json.dumps(event) + "\n").encode())
+                        await writer.drain()
+                    except ConnectionError:
+                        writer.close()
+
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict) or ("iodir" not in job and "program" not in job):
+                    raise ValueError("a job needs an iodir or a program")
+            except ValueError as e:
+                await send({"event": "error", "error": str(e)})
+                continue
+            done = asyncio.get_running_loop().create_future()
+
+            async def reply(event, send = send, done = done):
+                await send(event)
+                if event["event"] != "started":
+                    done.set_result(None)
+
+            await send({"event": "queued", "position": self.queue.qsize() + 1})
+            await self.queue.put((job, reply))
+            pending.append(done)
+        # The client closed its side: finish its queued jobs before closing the connection.
+        await asyncio.gather(*pending)
+        writer.close()
+
+    async def serve(self, address: str):
+        await self.warm()
+        host, port = parse_address(address)
+        if port == None:
+            if os.path.exists(host):
+                os.remove(host)
+            server = await asyncio.start_unix_server(self.handle, path = host)
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+        dispatchers = [asyncio.create_task(self.dispatch()) for _ in range(self.workers)]
+        print("Server - Listening on", address)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for dispatcher in dispatchers:
+                dispatcher.cancel()
+            self.pool.shutdown()
+
+# --- Client side ---
+
+async def submit_jobs(address: str, jobs: list, on_event = None):
+    # Send the jobs over one connection, call on_event for every streamed event and return the final events.
+    host, port = parse_address(address)
+    if port == None:
+        reader, writer = await asyncio.open_unix_connection(host)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    writer.write("".join(json.dumps(job) + "\n" for job in jobs).encode())
+    await writer.drain()
+    writer.write_eof()
+    results = [None] * len(jobs)
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        event = json.loads(line)
+        if on_event != None:
+            on_event(event)
+        if event["event"] in ("done", "error"):
+            results[event["job"]] = event
+    writer.close()
+    return results
+
+def submit(address: str, jobs: list, on_event = None):
+    return asyncio.run(submit_jobs(address, jobs, on_event))
+
+def print_event(event):
+    if event["event"] == "done":
+        print("Server - Job", event["job"], "finished:", event["instructions"], "instructions in", "{:.3f}".format(event["seconds"]), "s")
+        for head, (end, times, iterations, reason) in sorted(event.get("loops", {}).items(), key = lambda item: int(item[0])):
+            if reason == None:
+                print("LOOP - PC ", head, "-", end, ": collapsed ", times, " times, ", iterations, " iterations")
+            else:
+                print("LOOP - PC ", head, "-", end, ": not collapsed,", reason)
+        print(event.get("efficiency", ""), end = "")
+        if "outputs" in event:
+            print("Server - Job", event["job"], "outputs written into:", event["outputs"])
+    elif event["event"] == "error":
+        print("Server - ERROR: Job", event["job"], "failed:", event["error"])
+    else:
+        print("Server - Job", event["job"], event["event"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Vector Core Simulation Server')
+    parser.add_argument('--address', default="127.0.0.1:8413", type=str, help='Unix socket path or host:port to listen on.')
+    parser.add_argument('--workers', default=None, type=int, help='Number of worker processes, defaults to the number of CPUs.')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(SimulationServer(args.workers).serve(args.address))
+    except KeyboardInterrupt:
+        print("Server - Stopped")
@@ -1,12 +1,19 @@
 import os
 import argparse
+from array import array
+import operator
+from operator import itemgetter
+from itertools import compress, chain
 
 class IMEM(object):
-    def __init__(self, iodir):
+    def __init__(self, iodir, instructions: list = None):
         self.size = pow(2, 16) # Can hold a maximum of 2^16 instructions.
         self.filepath = os.path.abspath(os.path.join(iodir, "Code.asm"))
         self.instructions = []
 
+        if instructions != None: # Program handed over directly (e.g. by the simulation server) instead of Code.asm.
+            self.instructions = [ins.strip() for ins in instructions]
+            return
         try:
             with open(self.filepath, 'r') as insf:
                 self.instructions = [ins.strip() for ins in insf.readlines()]
@@ -24,46 +31,148 @@ class IMEM(object):
 
 class DMEM(object):
     # Word addressible - each address contains 32 bits.
-    def __init__(self, name, iodir, addressLen):
+    # The words are kept in a compact array('i') which only covers the pages touched so far (the loaded
+    # image and any page written to afterwards). Addresses beyond the materialized region read as zero.
+    def __init__(self, name, iodir, addressLen, data: list = None):
         self.name = name
         self.size = pow(2, addressLen)
+        self.page_size = pow(2, 10) # The backing store grows in pages of 1K words.
         self.min_value  = -pow(2, 31)
         self.max_value  = pow(2, 31) - 1
         self.ipfilepath = os.path.abspath(os.path.join(iodir, name + ".txt"))
         self.opfilepath = os.path.abspath(os.path.join(iodir, name + "OP.txt"))
-        self.data = []
+        self.data = array('i')
 
+        if data != None: # Image handed over directly instead of the input file.
+            self.data = array('i', data[:self.size])
+            return
+        # The whole file is read as bytes and split on whitespace in one pass; int() accepts the byte strings
+        # directly. A short file leaves the remaining words at zero, blank lines are skipped.
         try:
-            with open(self.ipfilepath, 'r') as ipf:
-                self.data = [int(line.strip()) for line in ipf.readlines()]
-            print(self.name, "- Data loaded from file:", self.ipfilepath)
-            # print(self.name, "- Data:", self.data)
-            self.data.extend([0x0 for i in range(self.size - len(self.data))])
-        except:
+            with open(self.ipfilepath, 'rb') as ipf:
+                words = ipf.read().split()
+        except OSError:
             print(self.name, "- ERROR: Couldn't open input file in path:", self.ipfilepath)
+            return
+        del words[self.size:]
+        try:
+            self.data = array('i', map(int, words))
+        except (ValueError, OverflowError):
+            print(self.name, "- ERROR: Invalid 32 bit word in input file:", self.ipfilepath)
+            return
+        print(self.name, "- Data loaded from file:", self.ipfilepath)
+        # print(self.name, "- Data:", self.data)
+
+    def materialize(self, idx: int): # Zero-fill the backing store up to the end of the page containing idx.
+        end = min(self.size, (idx // self.page_size + 1) * self.page_size)
+        if end > len(self.data):
+            self.data.frombytes(bytes((end - len(self.data)) * self.data.itemsize))
 
     def Read(self, idx: int): # Use this to read from DMEM.
-        if idx < self.size:
-            return self.data[idx]
+        if -self.size <= idx < self.size:
+            if idx < 0:
+                idx += self.size # Negative addresses wrap around, as they did with the list backed memory.
+            if idx < len(self.data):
+                return self.data[idx]
+            return 0
+        elif idx < 0:
+            raise IndexError("list index out of range") # Below -size the list backed memory failed the same way.
         else:
             print("DMEM - ERROR: Invalid memory access at index: ", idx, " with memory size: ", self.size)
             return None
 
     def Write(self, idx: int, val): # Use this to write into DMEM.
-        if idx < self.size:
+        if -self.size <= idx < self.size:
+            if idx < 0:
+                idx += self.size
+            if idx >= len(self.data):
+                self.materialize(idx)
             self.data[idx] = val
             return self.data[idx]
+        elif idx < 0:
+            raise IndexError("list assignment index out of range")
         else:
             print("DMEM - ERROR: Invalid memory access at index: ", idx, " with memory size: ", self.size)
             return None
 
+    # Bulk accesses used by the vector memory instructions. The whole address vector is validated in one pass
+    # and then transferred with slicing / fancy indexing. Lanes whose mask entry is falsy are skipped (and read
+    # as zero). If any active address falls outside [0, size) nothing is transferred and None is returned, so
+    # the caller can fall back to element-wise Read/Write and report the offending lanes.
+    def read_gather(self, addresses: list, mask: list = None):
+        if mask is not None:
+            lanes = [i for i in range(len(addresses)) if mask[i]]
+            values = self.read_gather([addresses[i] for i in lanes])
+            if values == None:
+                return None
+            result = [0x0] * len(addresses)
+            for i, value in zip(lanes, values):
+                result[i] = value
+            return result
+        if len(addresses) == 0:
+            return []
+        if min(addresses) < 0 or max(addresses) >= self.size:
+            return None
+        if max(addresses) >= len(self.data):
+            return [self.data[idx] if idx < len(self.data) else 0 for idx in addresses]
+        if len(addresses) == 1:
+            return [self.data[addresses[0]]]
+        return list(itemgetter(*addresses)(self.data))
+
+    def read_strided(self, base: int, stride: int, n: int, mask: list = None):
+        if n == 0 or mask is not None:
+            return self.read_gather([base + (i * stride) for i in range(n)], mask)
+        last = base + (stride * (n - 1))
+        if min(base, last) < 0 or max(base, last) >= self.size:
+            return None
+        if max(base, last) >= len(self.data):
+            return self.read_gather([base + (i * stride) for i in range(n)])
+        if stride == 0:
+            return [self.data[base]] * n
+        stop = base + (stride * n)
+        return self.data[base:(stop if stop >= 0 else None):stride].tolist()
+
+    def write_scatter(self, addresses: list, values: list, mask: list = None):
+        if mask is not None:
+            lanes = [i for i in range(len(addresses)) if mask[i]]
+            return self.write_scatter([addresses[i] for i in lanes], [values[i] for i in lanes])
+        if len(addresses) == 0:
+            return values
+        if min(addresses) < 0 or max(addresses) >= self.size:
+            return None
+        self.materialize(max(addresses))
+        data = self.data
+        for idx, val in zip(addresses, values): # Sequential so that the last lane wins on repeated addresses.
+            data[idx] = val
+        return values
+
+    def write_strided(self, base: int, stride: int, values: list, mask: list = None):
+        n = len(values)
+        if n == 0 or mask is not None or stride == 0:
+            return self.write_scatter([base + (i * stride) for i in range(n)], values, mask)
+        last = base + (stride * (n - 1))
+        if min(base, last) < 0 or max(base, last) >= self.size:
+            return None
+        self.materialize(max(base, last))
+        stop = base + (stride * n)
+        self.data[base:(stop if stop >= 0 else None):stride] = array('i', values)
+        return values
+
+    def snapshot(self):
+        return array('i', self.data)
+
+    def restore(self, data):
+        self.data = array('i', data)
+
     def dump(self):
+        # The whole image is formatted into one string by a single % over a template of one line per word, the
+        # words beyond the materialized region being literal zeros in the template.
+        text = ("%d\n" * len(self.data) + "0\n" * (self.size - len(self.data))) % tuple(self.data)
         try:
             with open(self.opfilepath, 'w') as opf:
-                lines = [str(data) + '\n' for data in self.data]
-                opf.writelines(lines)
+                opf.write(text)
             print(self.name, "- Dumped data into output file in path:", self.opfilepath)
-        except:
+        except OSError:
             print(self.name, "- ERROR: Couldn't open output file in path:", self.opfilepath)
 
 class RegisterFile(object):
@@ -75,6 +184,9 @@ class RegisterFile(object):
         self.min_value  = -pow(2, self.reg_bits-1)
         self.max_value  = pow(2, self.reg_bits-1) - 1
         self.registers  = [[0x0 for e in range(self.vec_length)] for r in range(self.reg_count)] # list of lists of integers
+        self.bounds     = [(0x0, 0x0) for r in range(self.reg_count)] # (min, max) enclosing the elements of each register
+        self.zeros      = [0x0 for e in range(self.vec_length)]
+        self.scratch    = [0x0 for e in range(self.vec_length)] # Result buffer for writes to a register that is also read.
 
     def Read(self, idx: int):
         if idx < self.reg_count:
@@ -83,9 +195,28 @@ class RegisterFile(object):
             print(self.name, "- ERROR: Invalid register access at index: ", idx, " with register count: ", self.reg_count)
             return None
 
-    def Write(self, idx: int, val: list):
+    def buffer(self, idx: int, *sources: int):
+        # Zeroed list for the result of a write to register idx: the register's own storage, or the scratch buffer
+        # if the register is also one of the sources (or idx is invalid, which Write then reports).
+        if idx < self.reg_count and not any(self.registers[idx] is self.registers[source] for source in sources):
+            result = self.registers[idx]
+        else:
+            result = self.scratch
+        result[:] = self.zeros
+        return result
+
+    def Write(self, idx: int, val: list, bounds: tuple = None):
+        # The registers own their storage: val is copied into it unless it already is the register (see buffer).
+        # bounds is an optional (min, max) pair enclosing every element of val, derived by the caller from the
+        # bounds of its operands. If it lies within the register range no element can overflow, and the
+        # per-element saturation check is skipped.
         if idx < self.reg_count:
             if len(val) == self.vec_length:
+                if bounds != None and self.min_value <= bounds[0] and bounds[1] <= self.max_value:
+                    if val is not self.registers[idx]:
+                        self.registers[idx][:] = val
+                    self.bounds[idx] = bounds
+                    return self.registers[idx]
                 for i in range(len(val)):
                     if val[i] > self.max_value:
                         print(self.name, "- WARNING: Register write overflow at index: ", idx, " with vector index: ", i)
@@ -97,7 +228,9 @@ class RegisterFile(object):
                         val[i] = self.min_value
                     else:
                         pass
-                self.registers[idx] = val
+                if val is not self.registers[idx]:
+                    self.registers[idx][:] = val
+                self.bounds[idx] = (min(val), max(val))
                 return self.registers[idx]
             else:
                 print(self.name, "- ERROR: Invalid register write at index: ", idx, " with vector length: ", len(val))
@@ -106,25 +239,626 @@ class RegisterFile(object):
             print(self.name, "- ERROR: Invalid register write at index: ", idx, " with register count: ", self.reg_count)
             return None
 
+    def snapshot(self):
+        return [list(register) for register in self.registers], list(self.bounds)
+
+    def restore(self, state):
+        registers, bounds = state
+        for register, values in zip(self.registers, registers):
+            register[:] = values
+        self.bounds[:] = bounds
+
     def dump(self, iodir):
         opfilepath = os.path.abspath(os.path.join(iodir, self.name + ".txt"))
+        row_format = "{:<13}"*self.vec_length + "\n"
+        text = row_format.format(*range(self.vec_length)) + '-'*(self.vec_length*13) + "\n"
+        text += (row_format*self.reg_count).format(*chain.from_iterable(self.registers))
         try:
             with open(opfilepath, 'w') as opf:
-                row_format = "{:<13}"*self.vec_length
-                lines = [row_format.format(*[str(i) for i in range(self.vec_length)]) + "\n", '-'*(self.vec_length*13) + "\n"]
-                lines += [row_format.format(*[str(val) for val in data]) + "\n" for data in self.registers]
-                opf.writelines(lines)
+                opf.write(text)
             print(self.name, "- Dumped data into output file in path:", opfilepath)
-        except:
+        except OSError:
             print(self.name, "- ERROR: Couldn't open output file in path:", opfilepath)
 
+class ScalarRegisterFile(RegisterFile):
+    # Scalar registers kept as one flat array of 32 bit values. The scalar instructions use get / set, which
+    # work on plain ints; set saturates through the range check of the array itself, so an in-range write is a
+    # single store. Read / Write keep the one-element-list interface of RegisterFile. registers is a read-only
+    # view (one-element tuples): every write goes through set or Write.
+    def __init__(self, name, count):
+        super().__init__(name, count)
+
+    @property
+    def registers(self):
+        return tuple((value,) for value in self.values)
+
+    @registers.setter
+    def registers(self, registers):
+        # Only assigned by RegisterFile.__init__, the initial values move into the flat array.
+        self.values = array('i', [register[0] for register in registers])
+
+    def get(self, idx: int):
+        if idx < self.reg_count:
+            return self.values[idx]
+        else:
+            print(self.name, "- ERROR: Invalid register access at index: ", idx, " with register count: ", self.reg_count)
+            return None
+
+    def set(self, idx: int, value: int):
+        if idx < self.reg_count:
+            try:
+                self.values[idx] = value
+            except OverflowError:
+                print(self.name, "- WARNING: Register write overflow at index: ", idx, " with vector index: ", 0)
+                # Handling Overflow Exception by setting the value as the maximum / minimum value
+                self.values[idx] = self.max_value if value > self.max_value else self.min_value
+            return self.values[idx]
+        else:
+            print(self.name, "- ERROR: Invalid register write at index: ", idx, " with register count: ", self.reg_count)
+            return None
+
+    def snapshot(self):
+        return array('i', self.values)
+
+    def restore(self, state):
+        self.values[:] = state
+
+    def Read(self, idx: int):
+        value = self.get(idx)
+        return None if value == None else [value]
+
+    def Write(self, idx: int, val: list, bounds: tuple = None):
+        if idx < self.reg_count and len(val) != self.vec_length:
+            print(self.name, "- ERROR: Invalid register write at index: ", idx, " with vector length: ", len(val))
+            return None
+        value = self.set(idx, val[0])
+        return None if value == None else [value]
+
+# Interval arithmetic over the register bounds (see RegisterFile.Write). Lanes that are masked off or beyond VL
+# are written as zero, so every result range includes zero.
+def bounds_of(values: list):
+    return (min(min(values), 0), max(max(values), 0)) if values else (0, 0)
+
+def bounds_union(a: tuple, b: tuple):
+    return (min(a[0], b[0], 0), max(a[1], b[1], 0))
+
+def bounds_add(a: tuple, b: tuple):
+    return (min(a[0] + b[0], 0), max(a[1] + b[1], 0))
+
+def bounds_sub(a: tuple, b: tuple):
+    return (min(a[0] - b[1], 0), max(a[1] - b[0], 0))
+
+def bounds_mul(a: tuple, b: tuple):
+    products = (a[0] * b[0], a[0] * b[1], a[1] * b[0], a[1] * b[1])
+    return (min(min(products), 0), max(max(products), 0))
+
+def bounds_div(a: tuple, b: tuple):
+    magnitude = max(-a[0], a[1]) # |x // y| <= |x| for any non-zero integer y.
+    return (-magnitude, magnitude)
+
+# Packed 2x16 arithmetic (ADDPVV, SUBPVV, MULPVV, CMULPVV). Every 32 bit element holds two signed 16 bit halves,
+# high half first; complex data keeps the real part in the high half and the imaginary part in the low half.
+# Each half saturates to 16 bits, and the multiplications are Q15: the product is shifted right by 15 (floor).
+HALF_MIN = -pow(2, 15)
+HALF_MAX = pow(2, 15) - 1
+
+def active_lanes(vector_mask: int, vector_length: int, mvl: int):
+    # Popcount of the VM bits below VL, taken as an integer; lane 0 is the most significant of the MVL mask bits.
+    vector_length = min(max(0, vector_length), mvl)
+    return ((vector_mask >> (mvl - vector_length)) & ((1 << vector_length) - 1)).bit_count()
+
+def unpack_halves(value: int):
+    return value >> 16, ((value & 0xFFFF) ^ 0x8000) - 0x8000
+
+def pack_halves(high: int, low: int):
+    high = min(max(high, HALF_MIN), HALF_MAX)
+    low = min(max(low, HALF_MIN), HALF_MAX)
+    return (high * 65536) + (low & 0xFFFF)
+
+PACKED_OPERATIONS = {"ADDPVV": lambda ar, ai, br, bi: (ar + br, ai + bi),
+                     "SUBPVV": lambda ar, ai, br, bi: (ar - br, ai - bi),
+                     "MULPVV": lambda ar, ai, br, bi: ((ar * br) >> 15, (ai * bi) >> 15),
+                     "CMULPVV": lambda ar, ai, br, bi: (((ar * br) - (ai * bi)) >> 15, ((ar * bi) + (ai * br)) >> 15)}
+
+# Reductions of the active lanes of a vector register into a scalar register (SUMV, MINV, MAXV SRd VRs).
+# Lanes beyond VL and lanes with a clear mask bit do not take part; with no active lane the result is 0.
+REDUCTIONS = {"SUMV": sum, "MINV": min, "MAXV": max}
+
+class Instrumentation(object):
+    # Hot path events for the observers registered on a Core, delivered in batches.
+    # An observer implements any of these methods, each receiving a list of event tuples:
+    #   on_retire(events)         - (pc, instruction words), in program order
+    #   on_memory_access(events)  - (pc, memory name, "R" or "W", addresses), one event per instruction for the bulk vector accesses
+    #   on_register_write(events) - (pc, register file name, register index, written values)
+    # The memory and register events are collected by wrappers installed on the DMEM / RegisterFile instances
+    # only while an observer wants them, so un-observed runs execute the plain methods.
+    def __init__(self, core, batch_size: int):
+        self.core = core
+        self.batch_size = batch_size
+        self.observers = []
+        self.pc = None
+        self.inside = False # Set while a wrapped call runs, so nested calls (read_strided -> read_gather) are reported once.
+        self.retired = []
+        self.memory = []
+        self.registers = []
+
+    def wants(self, method: str):
+        return any(hasattr(observer, method) for observer in self.observers)
+
+    def attach(self):
+        self.detach()
+        if self.wants("on_register_write"):
+            for rf in list(self.core.RFs.values()) + list(self.core.SRs.values()):
+                if isinstance(rf, ScalarRegisterFile): # Its Write goes through set.
+                    rf.set = self.wrap_register_set(rf)
+                else:
+                    rf.Write = self.wrap_register_write(rf)
+        if self.wants("on_memory_access"):
+            for mem in (self.core.SDMEM, self.core.VDMEM):
+                mem.Read = self.wrap_memory(mem, "Read", "R", lambda idx: (idx,))
+                mem.Write = self.wrap_memory(mem, "Write", "W", lambda idx, val: (idx,))
+                mem.read_gather = self.wrap_memory(mem, "read_gather", "R", self.gather_addresses)
+                mem.write_scatter = self.wrap_memory(mem, "write_scatter", "W",
+                                                     lambda addresses, values, mask = None: self.gather_addresses(addresses, mask))
+                mem.read_strided = self.wrap_memory(mem, "read_strided", "R", self.strided_addresses)
+                mem.write_strided = self.wrap_memory(mem, "write_strided", "W",
+                                                     lambda base, stride, values, mask = None: self.strided_addresses(base, stride, len(values), mask))
+
+    def detach(self):
+        for obj in list(self.core.RFs.values()) + list(self.core.SRs.values()) + [self.core.SDMEM, self.core.VDMEM]:
+            for name in ("Write", "set", "Read", "read_gather", "write_scatter", "read_strided", "write_strided"):
+                obj.__dict__.pop(name, None)
+
+    def gather_addresses(self, addresses, mask = None):
+        return tuple(addresses[i] for i in range(len(addresses)) if mask is None or mask[i])
+
+    def strided_addresses(self, base, stride, n, mask = None):
+        return tuple(base + (i * stride) for i in range(n) if mask is None or mask[i])
+
+    def wrap_register_write(self, rf):
+        write = type(rf).Write
+        def Write(idx, val, bounds = None):
+            result = write(rf, idx, val, bounds)
+            if result != None:
+                self.registers.append((self.pc, rf.name, idx, list(result)))
+            return result
+        return Write
+
+    def wrap_register_set(self, rf):
+        set_value = type(rf).set
+        def set_register(idx, value):
+            result = set_value(rf, idx, value)
+            if result != None:
+                self.registers.append((self.pc, rf.name, idx, [result]))
+            return result
+        return set_register
+
+    def wrap_memory(self, mem, name, kind, addresses):
+        method = getattr(type(mem), name)
+        def wrapper(*args, **kwargs):
+            if self.inside:
+                return method(mem, *args, **kwargs)
+            self.inside = True
+            try:
+                result = method(mem, *args, **kwargs)
+            finally:
+                self.inside = False
+            if result != None:
+                self.memory.append((self.pc, mem.name, kind, addresses(*args, **kwargs)))
+            return result
+        return wrapper
+
+    def retire(self, pc: int, instruction: list):
+        self.pc = pc
+        self.retired.append((pc, tuple(instruction)))
+        if len(self.retired) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for observer in self.observers:
+            if self.retired and hasattr(observer, "on_retire"):
+                observer.on_retire(self.retired)
+            if self.memory and hasattr(observer, "on_memory_access"):
+                observer.on_memory_access(self.memory)
+            if self.registers and hasattr(observer, "on_register_write"):
+                observer.on_register_write(self.registers)
+        self.retired = []
+        self.memory = []
+        self.registers = []
+
+class LoopCollapser(object):
+    # Executes counted strip-mined loops as whole-array operations.
+    # A loop is a backward branch closing a body that only contains element-wise vector arithmetic
+    # (ADD/SUB/MUL/DIV VV and VS), LV/SV/LVWS/SVWS, SUMV/MINV/MAXV and scalar induction updates of the form
+    # ADD/SUB SRd SRd SRx with SRx not written in the body. Every vector register read in the body must either be
+    # defined earlier in the same iteration or not be written by the loop at all, so iterations only communicate
+    # through memory. Likewise the result of a reduction may only be read by the VS arithmetic following it in
+    # the same iteration; the reduction yields one result per iteration and the last one is written back.
+    # When execution reaches the head of such a loop the trip count is computed from the induction variables,
+    # the addresses of all iterations are generated and checked (in range, and every address written by the loop
+    # is touched by a single iteration only), and then each body instruction runs once over the flattened
+    # iterations. If any check fails the loop is left to the interpreter.
+    # A LOOP instruction whose body qualifies is collapsed the same way, with the trip count read from its count
+    # register instead of solved from a branch condition.
+    VECTOR_VV = {"ADDVV": operator.add, "SUBVV": operator.sub, "MULVV": operator.mul, "DIVVV": operator.floordiv}
+    VECTOR_VS = {"ADDVS": "ADDVV", "SUBVS": "SUBVV", "MULVS": "MULVV", "DIVVS": "DIVVV"}
+    BRANCHES = {"BEQ": lambda a, b: a == b, "BNE": lambda a, b: a != b, "BGT": lambda a, b: a > b,
+                "BLT": lambda a, b: a < b, "BGE": lambda a, b: a >= b, "BLE": lambda a, b: a <= b}
+    MAX_TRIP_COUNT = pow(2, 24)
+
+    def __init__(self, core, template = None):
+        self.core = core
+        self.plans = {}   # Loop head PC -> plan of a collapsible loop.
+        self.report = {}  # Loop head PC -> [branch PC, times collapsed, iterations collapsed, reason if not collapsed]
+        if template != None: # Reuse the analysis of a collapser built for the same decoded program.
+            self.plans = dict(template.plans)
+            self.report = {head: [end, 0, 0, reason] for head, (end, times, iterations, reason) in template.report.items()}
+            return
+        for end, instruction in enumerate(core.program):
+            if instruction[0] in LoopCollapser.BRANCHES and core.operands[end] != None and core.operands[end][2] < 0:
+                head = end + core.operands[end][2]
+                if head >= 0:
+                    self.add(head, self.analyze(head, end), end)
+            elif instruction[0] == "LOOP" and core.operands[end] != None and 0 < core.operands[end][1] < len(core.program) - end:
+                last = end + core.operands[end][1]
+                self.add(end, self.analyze(end + 1, last + 1, core.operands[end][0]), last)
+
+    def add(self, head: int, plan, end: int):
+        # Plan (or reason) of the loop entered at head, whose last instruction is at end.
+        if isinstance(plan, str):
+            self.report[head] = [end, 0, 0, plan]
+        else:
+            self.plans[head] = plan
+            self.report[head] = [end, 0, 0, None]
+
+    def analyze(self, head: int, end: int, count: int = None):
+        # Returns the plan of the loop over [head, end), or the reason it cannot be collapsed. The loop is closed by
+        # the branch at end, or repeated SR<count> times by a LOOP instruction when count is given.
+        program = self.core.program
+        operands = self.core.operands
+        srf_count = self.core.RFs["SRF"].reg_count
+        vrf_count = self.core.RFs["VRF"].reg_count
+        body = []
+        scalar_written = set()
+        vector_written = set()
+        reduced = set() # Destinations of SUMV / MINV / MAXV.
+        for pc in range(head, end):
+            word = program[pc][0]
+            ops = operands[pc]
+            if ops == None:
+                return "malformed instruction at PC " + str(pc)
+            if word in ("ADD", "SUB"):
+                scalar_written.add(ops[0])
+            elif word in REDUCTIONS:
+                scalar_written.add(ops[0])
+                reduced.add(ops[0])
+            elif word in LoopCollapser.VECTOR_VV or word in LoopCollapser.VECTOR_VS or word in ("LV", "LVWS"):
+                vector_written.add(ops[0])
+            elif word not in ("SV", "SVWS"):
+                return "unsupported instruction " + word + " at PC " + str(pc)
+            kinds = "SSS" if word in ("ADD", "SUB") else "VVV" if word in LoopCollapser.VECTOR_VV else "VVS" if word in LoopCollapser.VECTOR_VS else "SV" if word in REDUCTIONS else "VSS"
+            if any(idx >= (vrf_count if kind == "V" else srf_count) for idx, kind in zip(ops, kinds)):
+                return "invalid register at PC " + str(pc)
+
+        induction = {} # Scalar register -> [(PC of the update, sign, step register)]
+        defined = set()
+        scalar_read = set(operands[end][:2]) if count == None else set() # Outside the vector arithmetic.
+        scalar_defined = set()
+        for pc in range(head, end):
+            word = program[pc][0]
+            ops = operands[pc]
+            if word in ("ADD", "SUB"):
+                if ops[1] != ops[0] or ops[2] in scalar_written:
+                    return "scalar register SR" + str(ops[0]) + " is not an affine induction variable"
+                induction.setdefault(ops[0], []).append((pc, 1 if word == "ADD" else -1, ops[2]))
+                scalar_read.update(ops[1:])
+                continue
+            if word in LoopCollapser.VECTOR_VV:
+                vector_sources = ops[1:]
+            elif word in LoopCollapser.VECTOR_VS:
+                vector_sources = ops[1:2]
+                if ops[2] not in scalar_defined:
+                    scalar_read.add(ops[2])
+            elif word in ("SV", "SVWS"):
+                vector_sources = ops[:1]
+                scalar_read.update(ops[1:])
+            elif word in REDUCTIONS:
+                vector_sources = ops[1:]
+            else:
+                vector_sources = ()
+                scalar_read.update(ops[1:])
+            for idx in vector_sources:
+                if idx in vector_written and idx not in defined:
+                    return "VR" + str(idx) + " is carried across iterations"
+            if word in REDUCTIONS:
+                scalar_defined.add(ops[0])
+            elif word not in ("SV", "SVWS"):
+                defined.add(ops[0])
+            body.append((pc, word, ops))
+        for idx in reduced:
+            if idx in scalar_read:
+                return "reduction result SR" + str(idx) + " is carried across iterations or used as an address or branch operand"
+        if count != None:
+            return {"head": head, "end": end, "exit": end, "body": body, "induction": induction, "branch": None, "count": count}
+        branch = (program[end][0], operands[end][0], operands[end][1])
+        return {"head": head, "end": end, "exit": end + 1, "body": body, "induction": induction, "branch": branch, "count": None}
+
+    def scalar(self, plan: dict, init: dict, idx: int, pc: int):
+        # Value of SR<idx> seen by the instruction at pc, as a function of the iteration number.
+        if idx not in plan["induction"]:
+            return lambda k: init[idx]
+        updates = plan["induction"][idx]
+        total = sum(sign * init[step] for _, sign, step in updates)
+        offset = sum(sign * init[step] for update_pc, sign, step in updates if update_pc < pc)
+        return lambda k: init[idx] + (k * total) + offset
+
+    def trip_count(self, word: str, left, right):
+        # The body runs once, then again for as long as the closing branch is taken. left(k) and right(k) are the
+        # branch operands at the end of iteration k, both affine in k, so the count is solved for instead of
+        # iterated. Returns None for loops that do not terminate within MAX_TRIP_COUNT iterations.
+        condition = LoopCollapser.BRANCHES[word]
+        taken = lambda k: condition(left(k), right(k))
+        if not taken(0):
+            return 1
+        difference = left(0) - right(0)
+        step = (left(1) - right(1)) - difference
+        if step == 0:
+            return None
+        if word == "BEQ":
+            return 2
+        if word == "BNE":
+            if (-difference) % step == 0 and 0 < (-difference) // step < LoopCollapser.MAX_TRIP_COUNT:
+                return (-difference) // step + 1
+            return None
+        # The ordered comparisons are monotonic in k: taken up to some iteration, then never again.
+        low, high = 0, LoopCollapser.MAX_TRIP_COUNT
+        if taken(high):
+            return None
+        while high - low > 1:
+            middle = (low + high) // 2
+            if taken(middle):
+                low = middle
+            else:
+                high = middle
+        return high + 1
+
+    def collapse(self, plan: dict, head: int):
+        # Run the loop entered at head (its first instruction, or its LOOP instruction) as a whole.
+        core = self.core
+        srf = core.RFs["SRF"]
+        vrf = core.RFs["VRF"]
+        vdmem = core.VDMEM
+        init = {idx: srf.values[idx] for idx in range(srf.reg_count)}
+
+        if plan["count"] != None:
+            trips = init[plan["count"]]
+            if trips < 1: # The body is skipped.
+                core.program_counter = plan["exit"]
+                self.report[head][1] += 1
+                return True
+            if trips > LoopCollapser.MAX_TRIP_COUNT:
+                return False
+        else:
+            word, left_idx, right_idx = plan["branch"]
+            trips = self.trip_count(word, self.scalar(plan, init, left_idx, plan["end"]), self.scalar(plan, init, right_idx, plan["end"]))
+            if trips == None:
+                return False
+
+        # Induction variables must not saturate in any iteration, they are monotonic so the end points suffice.
+        for idx, updates in plan["induction"].items():
+            for pc in [update_pc + 1 for update_pc, _, _ in updates]:
+                value = self.scalar(plan, init, idx, pc)
+                if not (srf.min_value <= value(0) <= srf.max_value and srf.min_value <= value(trips - 1) <= srf.max_value):
+                    return False
+
+        vector_length = core.SRs["VL"].Read(0)[0]
+        if vector_length < 0:
+            return False
+        mask = [bit == '1' for bit in "{:064b}".format(core.SRs["VM"].Read(0)[0])[:vector_length]]
+        lanes = range(vector_length)
+        iterations = range(trips)
+
+        # Addresses of every memory instruction over all iterations, and the hazard check.
+        addresses = {}
+        writes = {}
+        for pc, word, ops in plan["body"]:
+            if word in ("LV", "SV", "LVWS", "SVWS"):
+                base = self.scalar(plan, init, ops[1], pc)
+                stride = self.scalar(plan, init, ops[2], pc) if word in ("LVWS", "SVWS") else (lambda k: 1)
+                flat = [base(k) + (i * stride(k)) for k in iterations for i in lanes]
+                if flat and (min(flat) < 0 or max(flat) >= vdmem.size):
+                    return False
+                addresses[pc] = flat
+                if word in ("SV", "SVWS"):
+                    for j, address in enumerate(flat):
+                        if writes.setdefault(address, j // vector_length) != j // vector_length:
+                            return False
+        for pc, flat in addresses.items():
+            if writes and not writes.keys().isdisjoint(flat):
+                for j, address in enumerate(flat):
+                    if writes.get(address, j // vector_length) != j // vector_length:
+                        return False
+
+        # Execute every body instruction once over the flattened iterations. The overwritten memory is saved
+        # first, so that a late bail out (division by zero) leaves the state untouched for the interpreter.
+        written = list(writes)
+        saved = vdmem.read_gather(written)
+        values = {} # VR index -> its value in every iteration, concatenated.
+        reductions = {} # SR index -> result of its reduction in every iteration.
+        def flat_register(idx):
+            return values[idx] if idx in values else vrf.registers[idx][:vector_length] * trips
+        full_mask = all(mask)
+        flat_mask = mask * trips
+        for pc, word, ops in plan["body"]:
+            if word in ("LV", "LVWS"):
+                values[ops[0]] = vdmem.read_gather(addresses[pc])
+            elif word in ("SV", "SVWS"):
+                vdmem.write_scatter(addresses[pc], flat_register(ops[0]))
+            elif word in REDUCTIONS:
+                source = flat_register(ops[1])
+                chunks = (list(compress(source[k * vector_length:(k + 1) * vector_length], mask)) for k in iterations)
+                results = [REDUCTIONS[word](active) if active else 0 for active in chunks]
+                if min(results) < srf.min_value or max(results) > srf.max_value:
+                    vdmem.write_scatter(written, saved)
+                    return False # Leave the saturation warnings to the interpreter.
+                reductions[ops[0]] = results
+            else:
+                operation = LoopCollapser.VECTOR_VV[LoopCollapser.VECTOR_VS.get(word, word)]
+                first = flat_register(ops[1])
+                if word in LoopCollapser.VECTOR_VV:
+                    second = flat_register(ops[2])
+                elif ops[2] in reductions:
+                    second = [result for result in reductions[ops[2]] for i in lanes]
+                else:
+                    scalar = self.scalar(plan, init, ops[2], pc)
+                    second = [scalar(k) for k in iterations for i in lanes]
+                if word in ("DIVVV", "DIVVS") and any(b == 0 for b, m in zip(second, flat_mask) if m):
+                    vdmem.write_scatter(written, saved)
+                    return False # Leave the division by zero to the interpreter.
+                if full_mask:
+                    result = list(map(operation, first, second))
+                else:
+                    result = [operation(a, b) if m else 0x0 for a, b, m in zip(first, second, flat_mask)]
+                if result and (min(result) < vrf.min_value or max(result) > vrf.max_value):
+                    for j in range(len(result)):
+                        if result[j] > vrf.max_value:
+                            print(vrf.name, "- WARNING: Register write overflow at index: ", ops[0], " with vector index: ", j % vector_length)
+                            result[j] = vrf.max_value
+                        elif result[j] < vrf.min_value:
+                            print(vrf.name, "- WARNING: Register write overflow at index: ", ops[0], " with vector index: ", j % vector_length)
+                            result[j] = vrf.min_value
+                values[ops[0]] = result
+
+        # Architectural state after the last iteration.
+        for idx, flat in values.items():
+            vrf.Write(idx, flat[len(flat) - vector_length:] + [0x0] * (vrf.vec_length - vector_length))
+        for idx in plan["induction"]:
+            srf.set(idx, self.scalar(plan, init, idx, plan["end"])(trips - 1))
+        for idx, results in reductions.items():
+            srf.set(idx, results[-1])
+        core.program_counter = plan["exit"]
+        self.report[head][1] += 1
+        self.report[head][2] += trips
+        print("LOOP - Collapsed loop at PC ", head, "-", self.report[head][0], " over ", trips, " iterations")
+        return True
+
+    def try_collapse(self, head: int):
+        if self.collapse(self.plans[head], head):
+            return True
+        del self.plans[head] # Dynamic checks failed, interpret this loop from now on.
+        self.report[head][3] = "runtime checks failed (trip count, saturation, addresses or memory hazards)"
+        return False
+
+    def dump_report(self):
+        for head, (end, times, iterations, reason) in sorted(self.report.items()):
+            if reason == None:
+                print("LOOP - PC ", head, "-", end, ": collapsed ", times, " times, ", iterations, " iterations")
+            else:
+                print("LOOP - PC ", head, "-", end, ": not collapsed,", reason)
+
+class VectorEfficiency(object):
+    # Lane usage counters, enabled with Core.enable_efficiency_counters. Every retired instruction adds to fixed
+    # per-PC arrays: executions, and for vector instructions the sum of VL, the executions at VL < MVL and the
+    # active lanes (VL, or for the instructions honoring VM the integer popcount of the mask bits below VL).
+    # The report sums them per run and per loop (backward branch or LOOP body) and flags the loops and PCs whose
+    # active lanes stay below WASTE_THRESHOLD of the issued lanes (instructions * MVL).
+    MASKED = set(LoopCollapser.VECTOR_VV) | set(LoopCollapser.VECTOR_VS) | set(PACKED_OPERATIONS) | set(REDUCTIONS)
+    UNMASKED = {"SEQVV", "SEQVS", "SNEVV", "SNEVS", "SGTVV", "SGTVS", "SLTVV", "SLTVS", "SGEVV", "SGEVS", "SLEVV", "SLEVS",
+                "LV", "SV", "LVWS", "SVWS", "LVI", "SVI", "UNPACKLO", "UNPACKHI", "PACKLO", "PACKHI"}
+    WASTE_THRESHOLD = 0.75
+
+    def __init__(self, core):
+        self.core = core
+        self.mvl = core.RFs["VRF"].vec_length
+        size = len(core.program)
+        # 0: scalar, 1: vector, 2: vector honoring VM.
+        self.kinds = array('b', [2 if words[0] in VectorEfficiency.MASKED else 1 if words[0] in VectorEfficiency.UNMASKED else 0
+                                 for words in core.program])
+        self.executions = array('q', [0]) * size
+        self.vector_lengths = array('q', [0]) * size
+        self.short = array('q', [0]) * size
+        self.lanes = array('q', [0]) * size
+
+    def count(self, program_counter: int):
+        self.executions[program_counter] += 1
+        kind = self.kinds[program_counter]
+        if kind:
+            vector_length = max(0, self.core.SRs["VL"].registers[0][0])
+            self.vector_lengths[program_counter] += vector_length
+            if vector_length < self.mvl:
+                self.short[program_counter] += 1
+            if kind == 2:
+                self.lanes[program_counter] += active_lanes(self.core.SRs["VM"].registers[0][0], vector_length, self.mvl)
+            else:
+                self.lanes[program_counter] += vector_length
+
+    def loops(self):
+        # [(first PC, last PC)] of the backward branch loops and LOOP bodies.
+        program = self.core.program
+        operands = self.core.operands
+        loops = []
+        for pc, words in enumerate(program):
+            if operands[pc] == None:
+                continue
+            if words[0] in LoopCollapser.BRANCHES and operands[pc][2] < 0 and pc + operands[pc][2] >= 0:
+                loops.append((pc + operands[pc][2], pc))
+            elif words[0] == "LOOP" and 0 < operands[pc][1] < len(program) - pc:
+                loops.append((pc + 1, pc + operands[pc][1]))
+        return sorted(set(loops))
+
+    def totals(self, first: int, last: int):
+        # (scalar instructions, vector instructions, sum of VL, executions at VL < MVL, active lanes) over [first, last].
+        scalar = vector = vector_length = short = lanes = 0
+        for pc in range(first, last + 1):
+            if self.kinds[pc]:
+                vector += self.executions[pc]
+                vector_length += self.vector_lengths[pc]
+                short += self.short[pc]
+                lanes += self.lanes[pc]
+            else:
+                scalar += self.executions[pc]
+        return scalar, vector, vector_length, short, lanes
+
+    def utilization(self, vector: int, lanes: int):
+        return lanes / (vector * self.mvl) if vector else 1.0
+
+    def dump_report(self):
+        program = self.core.program
+        scalar, vector, vector_length, short, lanes = self.totals(0, len(program) - 1)
+        masked = sum(self.executions[pc] for pc in range(len(program)) if self.kinds[pc] == 2)
+        masked_lanes = sum(self.lanes[pc] for pc in range(len(program)) if self.kinds[pc] == 2)
+        print("EFFICIENCY -", scalar + vector, "instructions:", vector, "vector,", scalar, "scalar,",
+              "{:.2f} scalar per vector instruction".format(scalar / vector if vector else 0.0))
+        print("EFFICIENCY - Average VL {:.1f} of {}, {:.1%} of the vector instructions at VL < {}".format(
+              vector_length / vector if vector else 0.0, self.mvl, short / vector if vector else 0.0, self.mvl))
+        print("EFFICIENCY - {} masked instructions, {:.1f} active lanes on average".format(masked, masked_lanes / masked if masked else 0.0))
+        print("EFFICIENCY - Lane utilization {:.1%}".format(self.utilization(vector, lanes)))
+        for first, last in self.loops():
+            scalar, vector, vector_length, short, lanes = self.totals(first, last)
+            if vector == 0:
+                if scalar:
+                    print("EFFICIENCY - Loop PC {} - {}: no vector instructions, {} scalar".format(first, last, scalar))
+                continue
+            utilization = self.utilization(vector, lanes)
+            print("EFFICIENCY - Loop PC {} - {}: {} vector, {} scalar ({:.2f} per vector), average VL {:.1f}, lane utilization {:.1%}{}".format(
+                  first, last, vector, scalar, scalar / vector, vector_length / vector,
+                  utilization, " <- wastes lanes" if utilization < VectorEfficiency.WASTE_THRESHOLD else ""))
+        print("EFFICIENCY - {:>6} {:>10} {:>8} {:>8} {:>8}  {}".format("PC", "Executed", "Avg VL", "Lanes", "VL<MVL", "Instruction"))
+        for pc in range(len(program)):
+            if self.kinds[pc] and self.executions[pc]:
+                executions = self.executions[pc]
+                utilization = self.utilization(executions, self.lanes[pc])
+                print("EFFICIENCY - {:>6} {:>10} {:>8.1f} {:>8.1f} {:>8}  {}{}".format(
+                      pc, executions, self.vector_lengths[pc] / executions, self.lanes[pc] / executions, self.short[pc],
+                      " ".join(program[pc]), "  <- wastes lanes" if utilization < VectorEfficiency.WASTE_THRESHOLD else ""))
+
 class Core():
     def __init__(self, imem: IMEM, sdmem: DMEM, vdmem: DMEM):
         self.IMEM = imem
         self.SDMEM = sdmem
         self.VDMEM = vdmem
 
-        self.RFs = {"SRF": RegisterFile("SRF", 8),
+        self.RFs = {"SRF": ScalarRegisterFile("SRF", 8),
                     "VRF": RegisterFile("VRF", 8, 64)}
         
         ### Special Purpose Registers
@@ -134,7 +868,30 @@ class Core():
         # Initialising Vector Length Register as the MVL
         self.SRs["VL"].Write(0, [self.RFs["VRF"].vec_length])
 
+        # Retired instruction trace for the timing model, only recorded when set to a list.
+        self.trace = None
+
+        # Observer events, see add_observer.
+        self.instrumentation = None
+
+        # Decoded program, see load_program.
+        self.program = None
+        self.operands = None
+        self.program_counter = 0
+
+        # Loop collapsing, enabled with enable_loop_collapsing.
+        self.loops = None
+
+        # Active LOOP instructions, innermost last: [first body PC, PC after the body, iterations left].
+        self.hardware_loops = []
+
+        # Lane usage counters, enabled with enable_efficiency_counters.
+        self.efficiency = None
+
     def get_operands(self, instruction: list):
+        if instruction[0] == "LOOP":
+            # LOOP SRc N: count register index, body length.
+            return int(str(instruction[1])[2:]), int(instruction[2])
         if len(instruction) == 4:
             destination = str(instruction[1])
             operand1 = str(instruction[2])
@@ -165,8 +922,8 @@ class Core():
         line_counter = 0
         program = list()
 
-        while(line_counter < len(imem.instructions)):
-            current_line = imem.Read(line_counter)
+        while(line_counter < len(self.IMEM.instructions)):
+            current_line = self.IMEM.Read(line_counter)
             
             # Logic to handle inline comments and line comments
             if '#' in current_line:
@@ -189,962 +946,1355 @@ class Core():
 
         return program
         
+    def trace_instruction(self, program_counter: int, current_instruction: list):
+        # Trace entry: (PC, instruction words, VL, popcount of the VM bits below VL, memory addresses touched).
+        # Addresses are resolved from the register state before the instruction executes.
+        instruction_word = current_instruction[0]
+        vector_length = self.SRs["VL"].Read(0)[0]
+        mask_count = active_lanes(self.SRs["VM"].Read(0)[0], vector_length, self.RFs["VRF"].vec_length)
+        addresses = ()
+        if instruction_word in ("LV", "SV", "LVWS", "SVWS", "LVI", "SVI", "LS", "SS"):
+            operands = self.operands[program_counter]
+            srf = self.RFs["SRF"]
+            vrf = self.RFs["VRF"]
+            if instruction_word in ("LS", "SS"):
+                if operands[1] < srf.reg_count:
+                    addresses = (srf.values[operands[1]] + operands[2],)
+            elif operands[1] < srf.reg_count:
+                base_address = srf.values[operands[1]]
+                if instruction_word in ("LV", "SV"):
+                    addresses = tuple(range(base_address, base_address + vector_length))
+                elif instruction_word in ("LVWS", "SVWS") and operands[2] < srf.reg_count:
+                    stride = srf.values[operands[2]]
+                    addresses = tuple(base_address + (i * stride) for i in range(vector_length))
+                elif instruction_word in ("LVI", "SVI") and operands[2] < vrf.reg_count:
+                    offsets = vrf.registers[operands[2]]
+                    addresses = tuple(base_address + offsets[i] for i in range(vector_length))
+        return (program_counter, tuple(current_instruction), vector_length, mask_count, addresses)
+
+    def add_observer(self, observer, batch_size: int = 4096):
+        # Register an analysis on the hot path events (see Instrumentation), delivered every batch_size retired instructions.
+        if self.instrumentation == None:
+            self.instrumentation = Instrumentation(self, batch_size)
+        self.instrumentation.observers.append(observer)
+        self.instrumentation.attach()
+
+    def remove_observer(self, observer):
+        self.instrumentation.flush()
+        self.instrumentation.observers.remove(observer)
+        self.instrumentation.detach()
+        if self.instrumentation.observers:
+            self.instrumentation.attach()
+        else:
+            self.instrumentation = None
+
+    def load_program(self, program: list = None, operands: list = None):
+        # Parse Code.asm and decode the register / immediate operands of every instruction once, up front.
+        # A decoded program can be shared between cores running the same code.
+        self.program = program if program != None else self.read_code_file()
+        if operands == None:
+            operands = []
+            for instruction in self.program:
+                try:
+                    operands.append(self.get_operands(instruction))
+                except (ValueError, IndexError):
+                    operands.append(None) # Malformed operands only fail if the instruction is executed.
+        self.operands = operands
+        self.program_counter = 0
+        self.hardware_loops = []
+
+    def enable_loop_collapsing(self, template: LoopCollapser = None):
+        # Loops are only collapsed while no trace or observer needs per-instruction events.
+        # A template LoopCollapser built for the same decoded program skips the loop analysis.
+        if self.program == None:
+            self.load_program()
+        self.loops = LoopCollapser(self, template)
+
+    def enable_efficiency_counters(self):
+        # Per-instruction counters, so loops are no longer collapsed while they are enabled.
+        if self.program == None:
+            self.load_program()
+        self.efficiency = VectorEfficiency(self)
+
     def run(self):
-        program_counter = 0
-        
-        program = self.read_code_file()
-        
-        while(True):
-            # --- ISSUE Stage ---
-            current_instruction = program[program_counter]
+        if self.program == None:
+            self.load_program()
 
-            print("Program Counter     : ", program_counter)
-            print("Current Instruction : ", current_instruction)
-            
-            # --- DECODE + EXECUTE + WRITEBACK Stage ---
-            instruction_word = current_instruction[0]
-            # print("Instruction Word    : ", instruction_word)
+        while(self.step()):
+            pass
+
+        if self.instrumentation != None:
+            self.instrumentation.flush()
 
-            if instruction_word == "HALT":
-                # --- EXECUTE : HALT --- 
-                print("Stopping the program execution!")
+    def step(self):
+        # Execute the instruction at the program counter, returns False once the execution stops.
+        # --- ISSUE Stage ---
+        program_counter = self.program_counter
+        hardware_loops = self.hardware_loops
+        while hardware_loops and program_counter == hardware_loops[-1][1]:
+            # End of a LOOP body: repeat it, no branch is decoded.
+            hardware_loops[-1][2] -= 1
+            if hardware_loops[-1][2] > 0:
+                program_counter = self.program_counter = hardware_loops[-1][0]
                 break
-            
-            # ----- VECTOR ARITHMETIC OPERATIONS
-            elif instruction_word == "ADDVV":
-                # --- DECODE : ADDVV ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : ADDVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] + vector2[i]
-                # --- WRITEBACK : ADDVV ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            elif instruction_word == "ADDVS":
-                # --- DECODE : ADDVS ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : ADDVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] + vector2[i]
-                # --- WRITEBACK : ADDVS ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            elif instruction_word == "SUBVV":
-                # --- DECODE : SUBVV ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SUBVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] - vector2[i]
-                # --- WRITEBACK : SUBVV ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            elif instruction_word == "SUBVS":
-                # --- DECODE : SUBVS ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SUBVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] - vector2[i]
-                # --- WRITEBACK : SUBVS ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            elif instruction_word == "MULVV":
-                # --- DECODE : MULVV ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : MULVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] * vector2[i]
-                # --- WRITEBACK : MULVV ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            elif instruction_word == "MULVS":
-                # --- DECODE : MULVS ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : MULVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] * vector2[i]
-                # --- WRITEBACK : MULVS ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            elif instruction_word == "DIVVV":
-                # --- DECODE : DIVVV ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : DIVVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    # TODO - Check Divide by zero condition
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] // vector2[i]
-                # --- WRITEBACK : DIVVV ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            elif instruction_word == "DIVVS":
-                # --- DECODE : DIVVS ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : DIVVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                # print("Current vector 1 value : ", vector1)
-                # print("Current vector 2 value : ", vector2)
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
-                vector_mask_list = list(vector_mask_string)
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    # TODO - Check Divide by zero condition
-                    if int(vector_mask_list[i]) == 1:
-                        result[i] = vector1[i] // vector2[i]
-                # --- WRITEBACK : DIVVS ---
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
+            hardware_loops.pop()
+        if self.loops != None and program_counter in self.loops.plans and self.trace == None and self.instrumentation == None and self.efficiency == None:
+            if self.loops.try_collapse(program_counter):
+                return True
+        current_instruction = self.program[program_counter]
+        if self.trace != None:
+            self.trace.append(self.trace_instruction(program_counter, current_instruction))
+        if self.instrumentation != None:
+            self.instrumentation.retire(program_counter, current_instruction)
+        if self.efficiency != None:
+            self.efficiency.count(program_counter)
+
+        print("Program Counter     : ", program_counter)
+        print("Current Instruction : ", current_instruction)
+        
+        # --- DECODE + EXECUTE + WRITEBACK Stage ---
+        instruction_word = current_instruction[0]
+        # print("Instruction Word    : ", instruction_word)
+
+        if instruction_word == "HALT":
+            # --- EXECUTE : HALT --- 
+            print("Stopping the program execution!")
+            return False
+        
+        # ----- VECTOR ARITHMETIC OPERATIONS
+        elif instruction_word == "ADDVV":
+            # --- DECODE : ADDVV ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : ADDVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current vector 2 value : ", vector2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] + vector2[i]
+            # --- WRITEBACK : ADDVV ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_add(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        elif instruction_word == "ADDVS":
+            # --- DECODE : ADDVS ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : ADDVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current scalar 2 value : ", scalar2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] + scalar2
+            # --- WRITEBACK : ADDVS ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_add(self.RFs["VRF"].bounds[operand1_reg_idx], (scalar2, scalar2)))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        elif instruction_word == "SUBVV":
+            # --- DECODE : SUBVV ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SUBVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current vector 2 value : ", vector2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] - vector2[i]
+            # --- WRITEBACK : SUBVV ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_sub(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        elif instruction_word == "SUBVS":
+            # --- DECODE : SUBVS ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SUBVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current scalar 2 value : ", scalar2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] - scalar2
+            # --- WRITEBACK : SUBVS ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_sub(self.RFs["VRF"].bounds[operand1_reg_idx], (scalar2, scalar2)))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        elif instruction_word == "MULVV":
+            # --- DECODE : MULVV ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : MULVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current vector 2 value : ", vector2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] * vector2[i]
+            # --- WRITEBACK : MULVV ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_mul(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        elif instruction_word == "MULVS":
+            # --- DECODE : MULVS ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : MULVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current scalar 2 value : ", scalar2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] * scalar2
+            # --- WRITEBACK : MULVS ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_mul(self.RFs["VRF"].bounds[operand1_reg_idx], (scalar2, scalar2)))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        elif instruction_word == "DIVVV":
+            # --- DECODE : DIVVV ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : DIVVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current vector 2 value : ", vector2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                # TODO - Check Divide by zero condition
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] // vector2[i]
+            # --- WRITEBACK : DIVVV ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_div(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        elif instruction_word == "DIVVS":
+            # --- DECODE : DIVVS ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : DIVVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            # print("Current vector 1 value : ", vector1)
+            # print("Current scalar 2 value : ", scalar2)
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                # TODO - Check Divide by zero condition
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = vector1[i] // scalar2
+            # --- WRITEBACK : DIVVS ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_div(self.RFs["VRF"].bounds[operand1_reg_idx], (scalar2, scalar2)))
+            if write_result == None:
+                return False
+            # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
+            # TODO - Test this instruction
+        
+        # ----- VECTOR MASK REGISTER OPERATIONS
+        elif instruction_word == "SEQVV":
+            # --- DECODE : SEQVV ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SEQVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] == vector2[i]:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SEQVV ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SEQVS":
+            # --- DECODE : SEQVS ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SEQVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] == scalar2:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SEQVS ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SNEVV":
+            # --- DECODE : SNEVV ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SNEVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] != vector2[i]:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SNEVV ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SNEVS":
+            # --- DECODE : SNEVS ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SNEVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] != scalar2:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SNEVS ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SGTVV":
+            # --- DECODE : SGTVV ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SGTVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] > vector2[i]:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SGTVV ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SGTVS":
+            # --- DECODE : SGTVS ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SGTVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] > scalar2:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SGTVS ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SLTVV":
+            # --- DECODE : SLTVV ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SLTVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] < vector2[i]:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SLTVV ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SLTVS":
+            # --- DECODE : SLTVS ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SLTVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] < scalar2:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SLTVS ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SGEVV":
+            # --- DECODE : SGEVV ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SGEVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] >= vector2[i]:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SGEVV ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SGEVS":
+            # --- DECODE : SGEVS ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SGEVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] >= scalar2:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SGEVS ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SLEVV":
+            # --- DECODE : SLEVV ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SLEVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] <= vector2[i]:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SLEVV ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "SLEVS":
+            # --- DECODE : SLEVS ---
+            operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SLEVS ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            vector_mask_value = 0
+            lane_bit = 1 << (self.RFs["VRF"].vec_length - 1)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if vector1[i] <= scalar2:
+                    vector_mask_value |= lane_bit >> i
+            # --- WRITEBACK : SLEVS ---
+            self.SRs["VM"].Write(0, [vector_mask_value])
+            # TODO - Test this instruction
+        elif instruction_word == "CVM":
+            # --- EXECUTE : CVM --- 
+            # print("Clearing the Vector Mask Register...")
+            # print("Current VM Value : ", bin(self.SRs["VM"].Read(0)[0]))
+            self.SRs["VM"].Write(0, [int('1' * self.RFs["VRF"].vec_length, 2)])
+            # print("Updated VM Value : ", bin(self.SRs["VM"].Read(0)[0]), self.SRs["VM"].Read(0)[0])
+        elif instruction_word == "POP":
+            # --- DECODE : POP ---
+            destination_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : POP --- 
+            count = bin(self.SRs["VM"].Read(0)[0]).count("1")
+            if count <= self.SRs["VM"].reg_bits:
+                write_result = self.RFs["SRF"].set(destination_reg_idx, count)
                 if write_result == None:
-                    break
-                # print("Updated result value   : ", self.RFs["VRF"].Read(destination_reg_idx))
-                # TODO - Test this instruction
-            
-            # ----- VECTOR MASK REGISTER OPERATIONS
-            elif instruction_word == "SEQVV":
-                # --- DECODE : SEQVV ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SEQVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] == vector2[i] else 0
-                # --- WRITEBACK : SEQVV ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SEQVS":
-                # --- DECODE : SEQVS ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SEQVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] == vector2[i] else 0
-                # --- WRITEBACK : SEQVS ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SNEVV":
-                # --- DECODE : SNEVV ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SNEVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] != vector2[i] else 0
-                # --- WRITEBACK : SNEVV ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SNEVS":
-                # --- DECODE : SNEVS ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SNEVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] != vector2[i] else 0
-                # --- WRITEBACK : SNEVS ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SGTVV":
-                # --- DECODE : SGTVV ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SGTVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] > vector2[i] else 0
-                # --- WRITEBACK : SGTVV ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SGTVS":
-                # --- DECODE : SGTVS ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SGTVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] > vector2[i] else 0
-                # --- WRITEBACK : SGTVS ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SLTVV":
-                # --- DECODE : SLTVV ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SLTVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] < vector2[i] else 0
-                # --- WRITEBACK : SLTVV ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SLTVS":
-                # --- DECODE : SLTVS ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SLTVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] < vector2[i] else 0
-                # --- WRITEBACK : SLTVS ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SGEVV":
-                # --- DECODE : SGEVV ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SGEVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] >= vector2[i] else 0
-                # --- WRITEBACK : SGEVV ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SGEVS":
-                # --- DECODE : SGEVS ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SGEVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] >= vector2[i] else 0
-                # --- WRITEBACK : SGEVS ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SLEVV":
-                # --- DECODE : SLEVV ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SLEVV ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] <= vector2[i] else 0
-                # --- WRITEBACK : SLEVV ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "SLEVS":
-                # --- DECODE : SLEVS ---
-                operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SLEVS ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                vector2 = [scalar2[0] for _ in range(self.RFs["VRF"].vec_length)]
-                result = [0] * self.RFs["VRF"].vec_length
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    result[i] = 1 if vector1[i] <= vector2[i] else 0
-                # --- WRITEBACK : SLEVS ---
-                result_string = ''.join(str(x) for x in result)
-                vector_mask_value = int(result_string, 2)
-                self.SRs["VM"].Write(0, [vector_mask_value])
-                # TODO - Test this instruction
-            elif instruction_word == "CVM":
-                # --- EXECUTE : CVM --- 
-                # print("Clearing the Vector Mask Register...")
-                # print("Current VM Value : ", bin(self.SRs["VM"].Read(0)[0]))
-                self.SRs["VM"].Write(0, [int('1' * self.RFs["VRF"].vec_length, 2)])
-                # print("Updated VM Value : ", bin(self.SRs["VM"].Read(0)[0]), self.SRs["VM"].Read(0)[0])
-            elif instruction_word == "POP":
-                # --- DECODE : POP ---
-                destination_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : POP --- 
-                count = bin(self.SRs["VM"].Read(0)[0]).count("1")
-                if count <= self.SRs["VM"].reg_bits:
-                    write_result = self.RFs["SRF"].Write(destination_reg_idx, [count])
-                    if write_result == None:
-                        break
-                else:
-                    print("WARNING: Invalid number popped, debug code!")
-                    self.RFs["SRF"].Write(destination_reg_idx, [self.SRs["VM"].reg_bits])
-                # TODO - Test this instruction
-            
-            # ----- VECTOR LENGTH REGISTER OPERATIONS
-            elif instruction_word == "MTCL":
-                # --- DECODE : MTCL ---
-                operand_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : MTCL --- 
-                # print("Moving the current value of operand in Vector Length Register...")
-                # print("Current VL Value  : ", self.SRs["VL"].Read(0)[0])
-                # print("Current operand Value : ", self.RFs["SRF"].Read(operand_reg_idx)[0])
-                value = self.RFs["SRF"].Read(operand_reg_idx)
-                # print(value)
-                if value == None:
-                    break
-                value = value[0]
-                if value <= self.RFs["VRF"].vec_length:
-                    self.SRs["VL"].Write(0, [value])
-                    # print("Updated VL Value  : ", self.SRs["VL"].Read(0)[0])
-                else:
-                    print("WARNING: Invalid Value for Vector Length Register, debug code!")
-            elif instruction_word == "MFCL":
-                # --- DECODE : MFCL ---
-                operand_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : MFCL --- 
-                # print("Moving the current value of Vector Length Register in operand...")
-                # print("Current VL Value  : ", self.SRs["VL"].Read(0)[0])
-                # print("Current operand Value : ", self.RFs["SRF"].Read(operand_reg_idx)[0])
-                self.RFs["SRF"].Write(operand_reg_idx, self.SRs["VL"].Read(0))
-                # print("Updated operand Value : ", self.RFs["SRF"].Read(operand_reg_idx)[0])
-            
-            # ----- MEMORY ACCESS OPERATIONS
-            elif instruction_word == "LV":
-                ### --- DECODE : LV ---
-                destination_reg_idx, operand1_reg_idx = self.get_operands(current_instruction)
-                ### --- EXECUTE : LV ---
-                memory_address = self.RFs["SRF"].Read(operand1_reg_idx)
-                if memory_address == None:
-                    break
-                memory_address = memory_address[0]
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                for i in range(self.SRs["VL"].Read(0)[0]):
+                    return False
+            else:
+                print("WARNING: Invalid number popped, debug code!")
+                self.RFs["SRF"].set(destination_reg_idx, self.SRs["VM"].reg_bits)
+            # TODO - Test this instruction
+        
+        # ----- HARDWARE LOOP
+        elif instruction_word == "LOOP":
+            # --- DECODE : LOOP ---
+            count_reg_idx, body_length = self.operands[program_counter]
+            # --- EXECUTE : LOOP ---
+            count = self.RFs["SRF"].get(count_reg_idx)
+            if count == None:
+                return False
+            if body_length < 1 or program_counter + body_length >= len(self.program):
+                print("LOOP - ERROR: Invalid body length at program counter: ", program_counter)
+                return False
+            if count < 1:
+                self.program_counter = program_counter + body_length + 1
+                print("")
+                return True
+            hardware_loops.append([program_counter + 1, program_counter + body_length + 1, count])
+
+        # ----- VECTOR LENGTH REGISTER OPERATIONS
+        elif instruction_word == "MTCL":
+            # --- DECODE : MTCL ---
+            operand_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : MTCL --- 
+            # print("Moving the current value of operand in Vector Length Register...")
+            # print("Current VL Value  : ", self.SRs["VL"].Read(0)[0])
+            # print("Current operand Value : ", self.RFs["SRF"].Read(operand_reg_idx)[0])
+            value = self.RFs["SRF"].get(operand_reg_idx)
+            # print(value)
+            if value == None:
+                return False
+            if value <= self.RFs["VRF"].vec_length:
+                self.SRs["VL"].Write(0, [value])
+                # print("Updated VL Value  : ", self.SRs["VL"].Read(0)[0])
+            else:
+                print("WARNING: Invalid Value for Vector Length Register, debug code!")
+        elif instruction_word == "MFCL":
+            # --- DECODE : MFCL ---
+            operand_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : MFCL --- 
+            # print("Moving the current value of Vector Length Register in operand...")
+            # print("Current VL Value  : ", self.SRs["VL"].Read(0)[0])
+            # print("Current operand Value : ", self.RFs["SRF"].Read(operand_reg_idx)[0])
+            self.RFs["SRF"].set(operand_reg_idx, self.SRs["VL"].Read(0)[0])
+            # print("Updated operand Value : ", self.RFs["SRF"].Read(operand_reg_idx)[0])
+        
+        # ----- MEMORY ACCESS OPERATIONS
+        elif instruction_word == "LV":
+            ### --- DECODE : LV ---
+            destination_reg_idx, operand1_reg_idx = self.operands[program_counter]
+            ### --- EXECUTE : LV ---
+            memory_address = self.RFs["SRF"].get(operand1_reg_idx)
+            if memory_address == None:
+                return False
+            result = self.RFs["VRF"].buffer(destination_reg_idx)
+            vector_length = max(0, self.SRs["VL"].Read(0)[0]) # A negative VL processes no elements.
+            values = self.VDMEM.read_strided(memory_address, 1, vector_length)
+            if values != None:
+                result[:vector_length] = values
+            else:
+                for i in range(vector_length):
                     if self.VDMEM.Read(memory_address + i) != None:
                         result[i] = self.VDMEM.Read(memory_address + i)
                     else:
                         result[i] = 0
                         print("WARNING: Reading from Invalid Memory Address, debug code!")
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-            elif instruction_word == "SV":
-                ### --- DECODE : SV ---
-                destination_reg_idx, operand1_reg_idx = self.get_operands(current_instruction)
-                ### --- EXECUTE : SV ---
-                memory_address = self.RFs["SRF"].Read(operand1_reg_idx)
-                if memory_address == None:
-                    break
-                memory_address = memory_address[0]
-                vector1 = self.RFs["VRF"].Read(destination_reg_idx)
-                if vector1 == None:
-                    break
-                for i in range(self.SRs["VL"].Read(0)[0]):
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_of(values) if values != None else None)
+            if write_result == None:
+                return False
+        elif instruction_word == "SV":
+            ### --- DECODE : SV ---
+            destination_reg_idx, operand1_reg_idx = self.operands[program_counter]
+            ### --- EXECUTE : SV ---
+            memory_address = self.RFs["SRF"].get(operand1_reg_idx)
+            if memory_address == None:
+                return False
+            vector1 = self.RFs["VRF"].Read(destination_reg_idx)
+            if vector1 == None:
+                return False
+            vector_length = max(0, self.SRs["VL"].Read(0)[0])
+            if self.VDMEM.write_strided(memory_address, 1, vector1[:vector_length]) == None:
+                for i in range(vector_length):
                     write_result = self.VDMEM.Write(memory_address + i, vector1[i])
                     if write_result == None:
                         print("WARNING: Trying to write on an Invalid Memory Address, debug code!")
-            elif instruction_word == "LVWS":
-                ### --- DECODE : LVWS ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                ### --- EXECUTE : LVWS ---
-                memory_address = self.RFs["SRF"].Read(operand1_reg_idx)
-                if memory_address == None:
-                    break
-                memory_address = memory_address[0]
-                stride = self.RFs["SRF"].Read(operand2_reg_idx)
-                if stride == None:
-                    break
-                stride = stride[0]
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                for i in range(self.SRs["VL"].Read(0)[0]):
+        elif instruction_word == "LVWS":
+            ### --- DECODE : LVWS ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            ### --- EXECUTE : LVWS ---
+            memory_address = self.RFs["SRF"].get(operand1_reg_idx)
+            if memory_address == None:
+                return False
+            stride = self.RFs["SRF"].get(operand2_reg_idx)
+            if stride == None:
+                return False
+            result = self.RFs["VRF"].buffer(destination_reg_idx)
+            vector_length = max(0, self.SRs["VL"].Read(0)[0])
+            values = self.VDMEM.read_strided(memory_address, stride, vector_length)
+            if values != None:
+                result[:vector_length] = values
+            else:
+                for i in range(vector_length):
                     if self.VDMEM.Read(memory_address + (i * stride)) != None:
                         result[i] = self.VDMEM.Read(memory_address + (i * stride))
                     else:
                         result[i] = 0
                         print("WARNING: Reading from Invalid Memory Address, debug code!")
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-            elif instruction_word == "SVWS":
-                ### --- DECODE : SVWS ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                ### --- EXECUTE : SVWS ---
-                memory_address = self.RFs["SRF"].Read(operand1_reg_idx)
-                if memory_address == None:
-                    break
-                memory_address = memory_address[0]
-                stride = self.RFs["SRF"].Read(operand2_reg_idx)
-                if stride == None:
-                    break
-                stride = stride[0]
-                vector1 = self.RFs["VRF"].Read(destination_reg_idx)
-                if vector1 == None:
-                    break
-                for i in range(self.SRs["VL"].Read(0)[0]):
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_of(values) if values != None else None)
+            if write_result == None:
+                return False
+        elif instruction_word == "SVWS":
+            ### --- DECODE : SVWS ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            ### --- EXECUTE : SVWS ---
+            memory_address = self.RFs["SRF"].get(operand1_reg_idx)
+            if memory_address == None:
+                return False
+            stride = self.RFs["SRF"].get(operand2_reg_idx)
+            if stride == None:
+                return False
+            vector1 = self.RFs["VRF"].Read(destination_reg_idx)
+            if vector1 == None:
+                return False
+            vector_length = max(0, self.SRs["VL"].Read(0)[0])
+            if self.VDMEM.write_strided(memory_address, stride, vector1[:vector_length]) == None:
+                for i in range(vector_length):
                     write_result = self.VDMEM.Write(memory_address + (i * stride), vector1[i])
                     if write_result == None:
                         print("WARNING: Trying to write on an Invalid Memory Address, debug code!")
-                # TODO - Test this instruction
-            elif instruction_word == "LVI":
-                ### --- DECODE : LVI ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                ### --- EXECUTE : LVI ---
-                base_address = self.RFs["SRF"].Read(operand1_reg_idx)
-                if base_address == None:
-                    break
-                base_address = base_address[0]
-                offsets = self.RFs["VRF"].Read(operand2_reg_idx)
-                if offsets == None:
-                    break
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    if self.VDMEM.Read(base_address + offsets[i]) != None:
-                        result[i] = self.VDMEM.Read(base_address + offsets[i])
+            # TODO - Test this instruction
+        elif instruction_word == "LVI":
+            ### --- DECODE : LVI ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            ### --- EXECUTE : LVI ---
+            base_address = self.RFs["SRF"].get(operand1_reg_idx)
+            if base_address == None:
+                return False
+            offsets = self.RFs["VRF"].Read(operand2_reg_idx)
+            if offsets == None:
+                return False
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand2_reg_idx)
+            vector_length = max(0, self.SRs["VL"].Read(0)[0])
+            values = self.VDMEM.read_gather([base_address + offset for offset in offsets[:vector_length]])
+            if values != None:
+                result[:vector_length] = values
+            else:
+                for i in range(vector_length):
+                    data = self.VDMEM.Read(base_address + offsets[i])
+                    if data != None:
+                        result[i] = data
                     else:
                         result[i] = 0
                         print("WARNING: Reading from Invalid Memory Address, debug code!")
-                write_result = self.RFs["VRF"].Write(destination_reg_idx, result)
-                if write_result == None:
-                    break
-            elif instruction_word == "SVI":
-                ### --- DECODE : SVI ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                ### --- EXECUTE : SVI ---
-                base_address = self.RFs["SRF"].Read(operand1_reg_idx)
-                if base_address == None:
-                    break
-                base_address = base_address[0]
-                offsets = self.RFs["VRF"].Read(operand2_reg_idx)
-                if offsets == None:
-                    break
-                vector1 = self.RFs["VRF"].Read(destination_reg_idx)
-                if vector1 == None:
-                    break
-                for i in range(self.SRs["VL"].Read(0)[0]):
-                    write_result = self.VDMEM.Write(base_address + offsets[i], vector1[i])
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_of(values) if values != None else None)
+            if write_result == None:
+                return False
+        elif instruction_word == "SVI":
+            ### --- DECODE : SVI ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            ### --- EXECUTE : SVI ---
+            base_address = self.RFs["SRF"].get(operand1_reg_idx)
+            if base_address == None:
+                return False
+            offsets = self.RFs["VRF"].Read(operand2_reg_idx)
+            if offsets == None:
+                return False
+            vector1 = self.RFs["VRF"].Read(destination_reg_idx)
+            if vector1 == None:
+                return False
+            vector_length = max(0, self.SRs["VL"].Read(0)[0])
+            addresses = [base_address + offset for offset in offsets[:vector_length]]
+            if self.VDMEM.write_scatter(addresses, vector1[:vector_length]) == None:
+                for i in range(vector_length):
+                    write_result = self.VDMEM.Write(addresses[i], vector1[i])
                     if write_result == None:
                         print("WARNING: Trying to write on an Invalid Memory Address, debug code!")
-                # TODO - Test this instruction
-            elif instruction_word == "LS":
-                # --- DECODE : LS ---
-                destination_reg_idx, operand1_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : LS ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                memory_address = scalar1 + imm
-                data = self.SDMEM.Read(memory_address)
-                if data == None:
-                    break
-                write_result = self.RFs["SRF"].Write(destination_reg_idx, [data])
-                if write_result == None:
-                    break
-            elif instruction_word == "SS":
-                # --- DECODE : SS ---
-                operand1_reg_idx, operand2_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : SS ---
-                data = self.RFs["SRF"].Read(operand1_reg_idx)
-                if data == None:
-                    break
-                data = data[0]
-                scalar1 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                memory_address = scalar1 + imm
-                write_result = self.SDMEM.Write(memory_address, data)
-                if write_result == None:
-                    print("WARNING: Trying to write on an Invalid Memory Address, debug code!")
-
-            # ----- SCALAR OPERATIONS
-            elif instruction_word == "ADD":
-                # --- DECODE : ADD ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : ADD ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                result = scalar1 + scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-            elif instruction_word == "SUB":
-                # --- DECODE : SUB ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SUB ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                result = scalar1 - scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-            elif instruction_word == "AND":
-                # --- DECODE : AND ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : AND ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                result = scalar1 & scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-                # TODO - Test this instruction
-            elif instruction_word == "OR":
-                # --- DECODE : OR ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : OR ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                result = scalar1 | scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-                # TODO - Test this instruction
-            elif instruction_word == "XOR":
-                # --- DECODE : XOR ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : XOR ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                result = scalar1 ^ scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-                # TODO - Test this instruction
-            elif instruction_word == "SLL":
-                # --- DECODE : SLL ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SLL ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                result = scalar1 << scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-                # TODO - Test this instruction
-            elif instruction_word == "SRL":
-                # --- DECODE : SRL ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SRL ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                unsigned_integer = scalar1 % (1 << self.RFs["SRF"].reg_bits)
-                result = unsigned_integer >> scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-                # TODO - Test this instruction
-                # https://realpython.com/python-bitwise-operators/#arithmetic-vs-logical-shift
-            elif instruction_word == "SRA":
-                # --- DECODE : SRA ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : SRA ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                result = scalar1 >> scalar2
-                self.RFs["SRF"].Write(destination_reg_idx, [result])
-                # TODO - Test this instruction
-
-            # ----- CONTROL OPERATIONS
-            elif instruction_word == "BEQ":
-                # --- DECODE : BEQ ---
-                operand1_reg_idx, operand2_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : BEQ ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                if scalar1 == scalar2:
-                    program_counter = program_counter + imm
-                    print("")
-                    continue
-                # TODO - Test this instruction
-            elif instruction_word == "BNE":
-                # --- DECODE : BNE ---
-                operand1_reg_idx, operand2_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : BNE ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                if scalar1 != scalar2:
-                    program_counter = program_counter + imm
-                    print("")
-                    continue
-                # TODO - Test this instruction
-            elif instruction_word == "BGT":
-                # --- DECODE : BGT ---
-                operand1_reg_idx, operand2_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : BGT ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                if scalar1 > scalar2:
-                    program_counter = program_counter + imm
-                    print("")
-                    continue
-                # TODO - Test this instruction
-            elif instruction_word == "BLT":
-                # --- DECODE : BLT ---
-                operand1_reg_idx, operand2_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : BLT ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                if scalar1 < scalar2:
-                    program_counter = program_counter + imm
-                    print("")
-                    continue
-                # TODO - Test this instruction
-            elif instruction_word == "BGE":
-                # --- DECODE : BGE ---
-                operand1_reg_idx, operand2_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : BGE ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                if scalar1 >= scalar2:
-                    program_counter = program_counter + imm
-                    print("")
-                    continue
-                # TODO - Test this instruction
-            elif instruction_word == "BLE":
-                # --- DECODE : BLE ---
-                operand1_reg_idx, operand2_reg_idx, imm = self.get_operands(current_instruction)
-                # --- EXECUTE : BLE ---
-                scalar1 = self.RFs["SRF"].Read(operand1_reg_idx)
-                if scalar1 == None:
-                    break
-                scalar1 = scalar1[0]
-                scalar2 = self.RFs["SRF"].Read(operand2_reg_idx)
-                if scalar2 == None:
-                    break
-                scalar2 = scalar2[0]
-                if scalar1 <= scalar2:
-                    program_counter = program_counter + imm
-                    print("")
-                    continue
-                # TODO - Test this instruction
-            
-            # ----- REGISTER-REGISTER SHUFFLE
-            elif instruction_word == "UNPACKLO":
-                # --- DECODE : UNPACKLO ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : UNPACKLO ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                j = 0
-                for i in range(0, self.SRs["VL"].Read(0)[0] // 2):
-                    result[j] = vector1[i]
-                    result[j+1] = vector2[i]
-                    j += 2
-                # --- WRITEBACK : UNPACKLO ---
-                self.RFs["VRF"].Write(destination_reg_idx, result)
-                # TODO - Test this instruction
-            elif instruction_word == "UNPACKHI":
-                # --- DECODE : UNPACKHI ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : UNPACKHI ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                j = 0
-                for i in range(self.SRs["VL"].Read(0)[0] // 2, self.SRs["VL"].Read(0)[0]):
-                    result[j] = vector1[i]
-                    result[j+1] = vector2[i]
-                    j += 2
-                # --- WRITEBACK : UNPACKHI ---
-                self.RFs["VRF"].Write(destination_reg_idx, result)
-                # TODO - Test this instruction
-            elif instruction_word == "PACKLO":
-                # --- DECODE : PACKLO ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : PACKLO ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                j = 0
-                mvl = self.SRs["VL"].Read(0)[0]
-                for i in range(0, mvl, 2):
-                    result[j] = vector1[i]
-                    result[(mvl // 2) + j] = vector2[i]
-                    j += 1
-                # --- WRITEBACK : PACKLO ---
-                self.RFs["VRF"].Write(destination_reg_idx, result)
-                # TODO - Test this instruction
-            elif instruction_word == "PACKHI":
-                # --- DECODE : PACKHI ---
-                destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.get_operands(current_instruction)
-                # --- EXECUTE : PACKHI ---
-                vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
-                if vector1 == None:
-                    break
-                vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
-                if vector2 == None:
-                    break
-                result = [0x0 for e in range(self.RFs["VRF"].vec_length)]
-                j = 0
-                mvl = self.SRs["VL"].Read(0)[0]
-                for i in range(1, mvl, 2):
-                    result[j] = vector1[i]
-                    result[(mvl // 2) + j] = vector2[i]
-                    j += 1
-                # --- WRITEBACK : PACKHI ---
-                self.RFs["VRF"].Write(destination_reg_idx, result)
-                # TODO - Test this instruction
+            # TODO - Test this instruction
+        elif instruction_word == "LS":
+            # --- DECODE : LS ---
+            destination_reg_idx, operand1_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : LS ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            memory_address = scalar1 + imm
+            data = self.SDMEM.Read(memory_address)
+            if data == None:
+                return False
+            write_result = self.RFs["SRF"].set(destination_reg_idx, data)
+            if write_result == None:
+                return False
+        elif instruction_word == "SS":
+            # --- DECODE : SS ---
+            operand1_reg_idx, operand2_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : SS ---
+            data = self.RFs["SRF"].get(operand1_reg_idx)
+            if data == None:
+                return False
+            scalar1 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar1 == None:
+                return False
+            memory_address = scalar1 + imm
+            write_result = self.SDMEM.Write(memory_address, data)
+            if write_result == None:
+                print("WARNING: Trying to write on an Invalid Memory Address, debug code!")
 
-            else:
-                print("DECODE - ERROR: Invalid instruction at program counter: ", program_counter)
+        # ----- SCALAR OPERATIONS
+        elif instruction_word == "ADD":
+            # --- DECODE : ADD ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : ADD ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            result = scalar1 + scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+        elif instruction_word == "SUB":
+            # --- DECODE : SUB ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SUB ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            result = scalar1 - scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+        elif instruction_word == "AND":
+            # --- DECODE : AND ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : AND ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            result = scalar1 & scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+            # TODO - Test this instruction
+        elif instruction_word == "OR":
+            # --- DECODE : OR ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : OR ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            result = scalar1 | scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+            # TODO - Test this instruction
+        elif instruction_word == "XOR":
+            # --- DECODE : XOR ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : XOR ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            result = scalar1 ^ scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+            # TODO - Test this instruction
+        elif instruction_word == "SLL":
+            # --- DECODE : SLL ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SLL ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            result = scalar1 << scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+            # TODO - Test this instruction
+        elif instruction_word == "SRL":
+            # --- DECODE : SRL ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SRL ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            unsigned_integer = scalar1 % (1 << self.RFs["SRF"].reg_bits)
+            result = unsigned_integer >> scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+            # TODO - Test this instruction
+            # https://realpython.com/python-bitwise-operators/#arithmetic-vs-logical-shift
+        elif instruction_word == "SRA":
+            # --- DECODE : SRA ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SRA ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            result = scalar1 >> scalar2
+            self.RFs["SRF"].set(destination_reg_idx, result)
+            # TODO - Test this instruction
+
+        # ----- CONTROL OPERATIONS
+        elif instruction_word == "BEQ":
+            # --- DECODE : BEQ ---
+            operand1_reg_idx, operand2_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : BEQ ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            if scalar1 == scalar2:
+                self.program_counter = program_counter + imm
+                print("")
+                return True
+            # TODO - Test this instruction
+        elif instruction_word == "BNE":
+            # --- DECODE : BNE ---
+            operand1_reg_idx, operand2_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : BNE ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            if scalar1 != scalar2:
+                self.program_counter = program_counter + imm
+                print("")
+                return True
+            # TODO - Test this instruction
+        elif instruction_word == "BGT":
+            # --- DECODE : BGT ---
+            operand1_reg_idx, operand2_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : BGT ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            if scalar1 > scalar2:
+                self.program_counter = program_counter + imm
+                print("")
+                return True
+            # TODO - Test this instruction
+        elif instruction_word == "BLT":
+            # --- DECODE : BLT ---
+            operand1_reg_idx, operand2_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : BLT ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            if scalar1 < scalar2:
+                self.program_counter = program_counter + imm
+                print("")
+                return True
+            # TODO - Test this instruction
+        elif instruction_word == "BGE":
+            # --- DECODE : BGE ---
+            operand1_reg_idx, operand2_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : BGE ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            if scalar1 >= scalar2:
+                self.program_counter = program_counter + imm
+                print("")
+                return True
+            # TODO - Test this instruction
+        elif instruction_word == "BLE":
+            # --- DECODE : BLE ---
+            operand1_reg_idx, operand2_reg_idx, imm = self.operands[program_counter]
+            # --- EXECUTE : BLE ---
+            scalar1 = self.RFs["SRF"].get(operand1_reg_idx)
+            if scalar1 == None:
+                return False
+            scalar2 = self.RFs["SRF"].get(operand2_reg_idx)
+            if scalar2 == None:
+                return False
+            if scalar1 <= scalar2:
+                self.program_counter = program_counter + imm
+                print("")
+                return True
+            # TODO - Test this instruction
+        
+        # ----- REGISTER-REGISTER SHUFFLE
+        elif instruction_word == "UNPACKLO":
+            # --- DECODE : UNPACKLO ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : UNPACKLO ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            j = 0
+            for i in range(0, self.SRs["VL"].Read(0)[0] // 2):
+                result[j] = vector1[i]
+                result[j+1] = vector2[i]
+                j += 2
+            # --- WRITEBACK : UNPACKLO ---
+            self.RFs["VRF"].Write(destination_reg_idx, result, bounds_union(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            # TODO - Test this instruction
+        elif instruction_word == "UNPACKHI":
+            # --- DECODE : UNPACKHI ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : UNPACKHI ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            j = 0
+            for i in range(self.SRs["VL"].Read(0)[0] // 2, self.SRs["VL"].Read(0)[0]):
+                result[j] = vector1[i]
+                result[j+1] = vector2[i]
+                j += 2
+            # --- WRITEBACK : UNPACKHI ---
+            self.RFs["VRF"].Write(destination_reg_idx, result, bounds_union(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            # TODO - Test this instruction
+        elif instruction_word == "PACKLO":
+            # --- DECODE : PACKLO ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : PACKLO ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            j = 0
+            mvl = self.SRs["VL"].Read(0)[0]
+            for i in range(0, mvl, 2):
+                result[j] = vector1[i]
+                result[(mvl // 2) + j] = vector2[i]
+                j += 1
+            # --- WRITEBACK : PACKLO ---
+            self.RFs["VRF"].Write(destination_reg_idx, result, bounds_union(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            # TODO - Test this instruction
+        elif instruction_word == "PACKHI":
+            # --- DECODE : PACKHI ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : PACKHI ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            j = 0
+            mvl = self.SRs["VL"].Read(0)[0]
+            for i in range(1, mvl, 2):
+                result[j] = vector1[i]
+                result[(mvl // 2) + j] = vector2[i]
+                j += 1
+            # --- WRITEBACK : PACKHI ---
+            self.RFs["VRF"].Write(destination_reg_idx, result, bounds_union(self.RFs["VRF"].bounds[operand1_reg_idx], self.RFs["VRF"].bounds[operand2_reg_idx]))
+            # TODO - Test this instruction
+
+        # ----- PACKED 2x16 ARITHMETIC
+        elif instruction_word in PACKED_OPERATIONS:
+            # --- DECODE : ADDPVV / SUBPVV / MULPVV / CMULPVV ---
+            destination_reg_idx, operand1_reg_idx, operand2_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : ADDPVV / SUBPVV / MULPVV / CMULPVV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector2 = self.RFs["VRF"].Read(operand2_reg_idx)
+            if vector2 == None:
+                return False
+            operation = PACKED_OPERATIONS[instruction_word]
+            result = self.RFs["VRF"].buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            vector_mask_list = list(vector_mask_string)
+            for i in range(self.SRs["VL"].Read(0)[0]):
+                if int(vector_mask_list[i]) == 1:
+                    result[i] = pack_halves(*operation(*unpack_halves(vector1[i]), *unpack_halves(vector2[i])))
+            # --- WRITEBACK : ADDPVV / SUBPVV / MULPVV / CMULPVV ---
+            write_result = self.RFs["VRF"].Write(destination_reg_idx, result, bounds_of(result))
+            if write_result == None:
+                return False
+
+        # ----- VECTOR REDUCTION OPERATIONS
+        elif instruction_word in REDUCTIONS:
+            # --- DECODE : SUMV / MINV / MAXV ---
+            destination_reg_idx, operand1_reg_idx = self.operands[program_counter]
+            # --- EXECUTE : SUMV / MINV / MAXV ---
+            vector1 = self.RFs["VRF"].Read(operand1_reg_idx)
+            if vector1 == None:
+                return False
+            vector_length = max(0, self.SRs["VL"].Read(0)[0])
+            vector_mask_string = "{:064b}".format(self.SRs["VM"].Read(0)[0])
+            active = list(compress(vector1[:vector_length], [bit == "1" for bit in vector_mask_string[:vector_length]]))
+            result = REDUCTIONS[instruction_word](active) if active else 0
+            # --- WRITEBACK : SUMV / MINV / MAXV ---
+            write_result = self.RFs["SRF"].set(destination_reg_idx, result)
+            if write_result == None:
+                return False
+
+        else:
+            print("DECODE - ERROR: Invalid instruction at program counter: ", program_counter)
 
-            program_counter += 1
-            print("")
+        self.program_counter = program_counter + 1
+        print("")
+        return True
+
+    def snapshot(self):
+        # Checkpoint of the architectural state (program counter, registers and memories), see restore.
+        state = {name: rf.snapshot() for name, rf in list(self.RFs.items()) + list(self.SRs.items())}
+        state["SDMEM"] = self.SDMEM.snapshot()
+        state["VDMEM"] = self.VDMEM.snapshot()
+        state["program_counter"] = self.program_counter
+        state["hardware_loops"] = [list(hardware_loop) for hardware_loop in self.hardware_loops]
+        return state
+
+    def restore(self, state: dict):
+        # Resume from a snapshot taken on a core running the same program.
+        for name, rf in list(self.RFs.items()) + list(self.SRs.items()):
+            rf.restore(state[name])
+        self.SDMEM.restore(state["SDMEM"])
+        self.VDMEM.restore(state["VDMEM"])
+        self.program_counter = state["program_counter"]
+        self.hardware_loops = [list(hardware_loop) for hardware_loop in state["hardware_loops"]]
 
     def dumpregs(self, iodir):
         for rf in self.RFs.values():
             rf.dump(iodir)
 
+    def dumptrace(self, iodir):
+        # One retired instruction per line: PC | instruction | VL | popcount of the VM bits below VL | comma separated addresses
+        opfilepath = os.path.abspath(os.path.join(iodir, "Trace.txt"))
+        try:
+            with open(opfilepath, 'w') as opf:
+                lines = ["{}|{}|{}|{}|{}\n".format(pc, " ".join(words), vector_length, mask_count, ",".join(map(str, addresses)))
+                         for pc, words, vector_length, mask_count, addresses in self.trace]
+                opf.writelines(lines)
+            print("Trace - Dumped data into output file in path:", opfilepath)
+        except:
+            print("Trace - ERROR: Couldn't open output file in path:", opfilepath)
+
+class LockstepBatch(object):
+    # Executes the instruction at the common program counter of a lockstep batch (see run_lockstep) once for all
+    # its cores. The vector operands of the cores are concatenated into flat N * MVL lists and the element-wise
+    # vector arithmetic (ADD/SUB/MUL/DIV VV and VS) runs over them in a single pass; PACKLO, PACKHI, the scalar
+    # arithmetic, LS, SS, MTCL, MFCL, CVM and the branches are decoded once and applied to every core. Any other
+    # instruction, or any case where a core would leave the plain path of Core.step (end of a LOOP body,
+    # collapsible loop, invalid register, address or mask, VL above MVL, division by zero, negative shift), is
+    # left to Core.step: step then returns False with no state changed. The log, trace and observer events are
+    # the same as with Core.step, and warnings are printed between the lines of the core they belong to.
+    VECTOR_BOUNDS = {"ADDVV": bounds_add, "SUBVV": bounds_sub, "MULVV": bounds_mul, "DIVVV": bounds_div}
+    SCALAR = {"ADD": operator.add, "SUB": operator.sub, "AND": operator.and_, "OR": operator.or_, "XOR": operator.xor,
+              "SLL": operator.lshift, "SRA": operator.rshift}
+
+    def __init__(self):
+        self.lanes = {} # (VM, VL) -> lane mask of one core, as a list of MVL booleans.
+
+    def step(self, cores: list):
+        program_counter = cores[0].program_counter
+        current_instruction = cores[0].program[program_counter]
+        instruction_word = current_instruction[0]
+        operands = cores[0].operands[program_counter]
+        if operands == None:
+            return False
+        for core in cores:
+            if core.hardware_loops and program_counter == core.hardware_loops[-1][1]:
+                return False
+            if core.loops != None and program_counter in core.loops.plans:
+                return False
+        if instruction_word in LoopCollapser.VECTOR_VV or instruction_word in LoopCollapser.VECTOR_VS:
+            execution = self.vector(cores, instruction_word, operands)
+        elif instruction_word in ("PACKLO", "PACKHI"):
+            execution = self.pack(cores, instruction_word, operands)
+        elif instruction_word in LockstepBatch.SCALAR:
+            execution = self.scalar(cores, instruction_word, operands)
+        elif instruction_word in LoopCollapser.BRANCHES:
+            execution = self.branch(cores, instruction_word, operands, program_counter)
+        elif instruction_word in ("LS", "SS"):
+            execution = self.memory(cores, instruction_word, operands)
+        elif instruction_word in ("MTCL", "MFCL", "CVM"):
+            execution = self.control(cores, instruction_word, operands)
+        else:
+            return False
+        if execution == None:
+            return False
+
+        # --- WRITEBACK, core by core ---
+        writeback, interleaved = execution
+        interleaved = interleaved or any(core.instrumentation != None for core in cores)
+        if not interleaved:
+            # Nothing prints between the lines of a core, so the log of the whole batch goes out at once.
+            print("Program Counter     :  {}\nCurrent Instruction :  {}\n\n".format(program_counter, current_instruction) * len(cores), end="")
+        for k, core in enumerate(cores):
+            if core.trace != None:
+                core.trace.append(core.trace_instruction(program_counter, current_instruction))
+            if core.instrumentation != None:
+                core.instrumentation.retire(program_counter, current_instruction)
+            if core.efficiency != None:
+                core.efficiency.count(program_counter)
+            if interleaved:
+                print("Program Counter     : ", program_counter)
+                print("Current Instruction : ", current_instruction)
+            core.program_counter = writeback(k, core)
+            if interleaved:
+                print("")
+        return True
+
+    # Each of the following returns None to leave the instruction to Core.step, or (writeback, interleaved):
+    # writeback(k, core) updates the k-th core and returns its next program counter, interleaved is True if
+    # any writeback may print.
+
+    def vector(self, cores: list, instruction_word: str, operands: tuple):
+        destination_reg_idx, operand1_reg_idx, operand2_reg_idx = operands
+        word = LoopCollapser.VECTOR_VS.get(instruction_word, instruction_word)
+        scalar = instruction_word in LoopCollapser.VECTOR_VS
+        vec_length = cores[0].RFs["VRF"].vec_length
+        first = []
+        second = []
+        flat_mask = []
+        scalars = []
+        for core in cores:
+            vrf = core.RFs["VRF"]
+            if vrf.vec_length != vec_length or max(destination_reg_idx, operand1_reg_idx) >= vrf.reg_count:
+                return None
+            if operand2_reg_idx >= (core.RFs["SRF"].reg_count if scalar else vrf.reg_count):
+                return None
+            vector_mask = core.SRs["VM"].registers[0][0]
+            vector_length = core.SRs["VL"].registers[0][0]
+            if vector_mask < 0 or vector_length > min(vec_length, 64):
+                return None
+            if (vector_mask, vector_length) not in self.lanes:
+                # Same lanes as Core.step: lane i is the i-th character of the 64 bit mask string, below VL.
+                active = [bit == "1" for bit in "{:064b}".format(vector_mask)[:max(0, vector_length)]]
+                self.lanes[(vector_mask, vector_length)] = active + [False] * (vec_length - len(active))
+            flat_mask += self.lanes[(vector_mask, vector_length)]
+            first += vrf.registers[operand1_reg_idx]
+            if scalar:
+                scalars.append(core.RFs["SRF"].get(operand2_reg_idx))
+                second += [scalars[-1]] * vec_length
+            else:
+                second += vrf.registers[operand2_reg_idx]
+        if word == "DIVVV" and any(b == 0 for b, m in zip(second, flat_mask) if m):
+            return None # Leave the division by zero to Core.step.
+
+        # --- EXECUTE, over the flattened registers ---
+        operation = LoopCollapser.VECTOR_VV[word]
+        if all(flat_mask):
+            result = list(map(operation, first, second))
+        else:
+            result = [operation(a, b) if m else 0x0 for a, b, m in zip(first, second, flat_mask)]
+        vrf = cores[0].RFs["VRF"]
+        interleaved = bool(result) and (min(result) < vrf.min_value or max(result) > vrf.max_value)
+
+        def writeback(k, core):
+            vrf = core.RFs["VRF"]
+            second_bounds = (scalars[k], scalars[k]) if scalar else vrf.bounds[operand2_reg_idx]
+            bounds = LockstepBatch.VECTOR_BOUNDS[word](vrf.bounds[operand1_reg_idx], second_bounds)
+            vrf.Write(destination_reg_idx, result[k * vec_length:(k + 1) * vec_length], bounds)
+            return core.program_counter + 1
+        return writeback, interleaved
+
+    def pack(self, cores: list, instruction_word: str, operands: tuple):
+        destination_reg_idx, operand1_reg_idx, operand2_reg_idx = operands
+        start = 0 if instruction_word == "PACKLO" else 1
+        for core in cores:
+            vector_length = core.SRs["VL"].registers[0][0]
+            # With an odd VL the two halves overlap, Core.step resolves that element by element.
+            if max(operands) >= core.RFs["VRF"].reg_count or not 0 <= vector_length <= core.RFs["VRF"].vec_length or vector_length % 2 == 1:
+                return None
+
+        def writeback(k, core):
+            vrf = core.RFs["VRF"]
+            vector_length = core.SRs["VL"].registers[0][0]
+            vector1 = vrf.registers[operand1_reg_idx]
+            vector2 = vrf.registers[operand2_reg_idx]
+            result = vrf.buffer(destination_reg_idx, operand1_reg_idx, operand2_reg_idx)
+            result[:vector_length // 2] = vector1[start:vector_length:2]
+            result[vector_length // 2:vector_length] = vector2[start:vector_length:2]
+            vrf.Write(destination_reg_idx, result, bounds_union(vrf.bounds[operand1_reg_idx], vrf.bounds[operand2_reg_idx]))
+            return core.program_counter + 1
+        return writeback, False
+
+    def scalar(self, cores: list, instruction_word: str, operands: tuple):
+        destination_reg_idx, operand1_reg_idx, operand2_reg_idx = operands
+        if any(max(operands) >= core.RFs["SRF"].reg_count for core in cores):
+            return None
+        pairs = [(core.RFs["SRF"].values[operand1_reg_idx], core.RFs["SRF"].values[operand2_reg_idx]) for core in cores]
+        if instruction_word in ("SLL", "SRA") and any(scalar2 < 0 for scalar1, scalar2 in pairs):
+            return None
+        operation = LockstepBatch.SCALAR[instruction_word]
+        results = [operation(scalar1, scalar2) for scalar1, scalar2 in pairs]
+        srf = cores[0].RFs["SRF"]
+        interleaved = min(results) < srf.min_value or max(results) > srf.max_value
+
+        def writeback(k, core):
+            core.RFs["SRF"].set(destination_reg_idx, results[k])
+            return core.program_counter + 1
+        return writeback, interleaved
+
+    def branch(self, cores: list, instruction_word: str, operands: tuple, program_counter: int):
+        operand1_reg_idx, operand2_reg_idx, imm = operands
+        if any(max(operand1_reg_idx, operand2_reg_idx) >= core.RFs["SRF"].reg_count for core in cores):
+            return None
+        condition = LoopCollapser.BRANCHES[instruction_word]
+        taken = [condition(core.RFs["SRF"].values[operand1_reg_idx], core.RFs["SRF"].values[operand2_reg_idx]) for core in cores]
+
+        def writeback(k, core):
+            return program_counter + imm if taken[k] else program_counter + 1
+        return writeback, False
+
+    def memory(self, cores: list, instruction_word: str, operands: tuple):
+        register_reg_idx, operand1_reg_idx, imm = operands # The loaded / stored register, then the address.
+        if any(max(register_reg_idx, operand1_reg_idx) >= core.RFs["SRF"].reg_count for core in cores):
+            return None
+        addresses = [core.RFs["SRF"].values[operand1_reg_idx] + imm for core in cores]
+        if any(not (-core.SDMEM.size <= address < core.SDMEM.size) for core, address in zip(cores, addresses)):
+            return None # Invalid addresses are reported by Core.step.
+
+        def writeback(k, core):
+            if instruction_word == "LS":
+                core.RFs["SRF"].set(register_reg_idx, core.SDMEM.Read(addresses[k]))
+            else:
+                core.SDMEM.Write(addresses[k], core.RFs["SRF"].values[register_reg_idx])
+            return core.program_counter + 1
+        return writeback, False
+
+    def control(self, cores: list, instruction_word: str, operands):
+        if instruction_word == "CVM":
+            def writeback(k, core):
+                core.SRs["VM"].Write(0, [int('1' * core.RFs["VRF"].vec_length, 2)])
+                return core.program_counter + 1
+            return writeback, False
+        if any(operands >= core.RFs["SRF"].reg_count for core in cores):
+            return None
+        if instruction_word == "MFCL":
+            def writeback(k, core):
+                core.RFs["SRF"].set(operands, core.SRs["VL"].registers[0][0])
+                return core.program_counter + 1
+            return writeback, False
+
+        def writeback(k, core):
+            value = core.RFs["SRF"].values[operands]
+            if value <= core.RFs["VRF"].vec_length:
+                core.SRs["VL"].Write(0, [value])
+            else:
+                print("WARNING: Invalid Value for Vector Length Register, debug code!")
+            return core.program_counter + 1
+        return writeback, any(core.RFs["SRF"].values[operands] > core.RFs["VRF"].vec_length for core in cores)
+
+def run_lockstep(cores: list):
+    # Run one program over several data images. The program is decoded once and shared by all the cores, which
+    # then advance in lockstep, one instruction each per step, for as long as their program counters agree.
+    # The common instructions execute once per step for the whole batch (see LockstepBatch), the others are
+    # stepped core by core. When a data dependent branch diverges, the remaining cores finish their runs
+    # independently.
+    # Returns True if the whole batch stayed in lockstep.
+    if cores[0].program == None:
+        cores[0].load_program()
+    for core in cores[1:]:
+        core.load_program(cores[0].program, cores[0].operands)
+
+    active = list(cores)
+    batch = LockstepBatch()
+    while active:
+        program_counter = active[0].program_counter
+        if any(core.program_counter != program_counter for core in active):
+            print("BATCH - WARNING: Branches diverged at program counter: ", program_counter, ", finishing ", len(active), " runs independently")
+            for core in active:
+                core.run()
+            return False
+        if batch.step(active):
+            continue
+        stopped = [core for core in active if not core.step()]
+        for core in stopped:
+            active.remove(core)
+            if core.instrumentation != None:
+                core.instrumentation.flush()
+    return True
+
 # class VectorCore(object):
 #     def handle_scalar(self, element, length):
 #         if not (isinstance(element, (list, tuple, dict, set, frozenset)) or hasattr(element, '__iter__')):
@@ -1281,26 +2431,92 @@ if __name__ == "__main__":
     #parse arguments for input file location
     parser = argparse.ArgumentParser(description='Vector Core Performance Model')
     parser.add_argument('--iodir', default="", type=str, help='Path to the folder containing the input files - instructions and data.')
+    parser.add_argument('--trace', action='store_true', help='Record the retired instruction trace into Trace.txt for the timing model.')
+    parser.add_argument('--collapse-loops', action='store_true', help='Execute provably independent strip-mined loops as whole-array operations and print a loop report.')
+    parser.add_argument('--batch', nargs='+', default=[], type=str, help='Folders with SDMEM.txt / VDMEM.txt images to run the program of iodir over in lockstep; outputs go to each folder.')
+    parser.add_argument('--server', default=None, type=str, help='Submit the run to a simulation server (see server.py) at this Unix socket path or host:port.')
+    parser.add_argument('--efficiency', action='store_true', help='Count the vector lane usage and print a per-run, per-loop and per-PC efficiency report.')
+    parser.add_argument('--incremental', nargs='?', const=".checkpoints", default=None, type=str, help='Resume from and save checkpoints of runs sharing a program prefix (see incremental.py) in this directory.')
     args = parser.parse_args()
+    if args.incremental and (args.server or args.batch):
+        parser.error("--incremental cannot be combined with --server or --batch")
 
     iodir = os.path.abspath(args.iodir)
     print("IO Directory:", iodir)
 
+    if args.server:
+        # Same runs and output files as below, executed by the warm workers of the server.
+        import server
+        jobs = [{"iodir": iodir, "datadir": os.path.abspath(datadir), "trace": args.trace, "collapse_loops": args.collapse_loops,
+                 "efficiency": args.efficiency}
+                for datadir in (args.batch or [iodir])]
+        results = server.submit(args.server, jobs, server.print_event)
+        raise SystemExit(0 if all(result != None and result["event"] == "done" for result in results) else 1)
+
     # Parse IMEM
     imem = IMEM(iodir)  
-    # Parse SMEM
-    sdmem = DMEM("SDMEM", iodir, 13) # 32 KB is 2^15 bytes = 2^13 K 32-bit words.
-    # Parse VMEM
-    vdmem = DMEM("VDMEM", iodir, 17) # 512 KB is 2^19 bytes = 2^17 K 32-bit words. 
 
-    # Create Vector Core
-    vcore = Core(imem, sdmem, vdmem)
+    if args.batch:
+        # One core per data image, all sharing the program in iodir.
+        batchdirs = [os.path.abspath(batchdir) for batchdir in args.batch]
+        vcores = [Core(imem, DMEM("SDMEM", batchdir, 13), DMEM("VDMEM", batchdir, 17)) for batchdir in batchdirs]
+        for vcore in vcores:
+            if args.trace:
+                vcore.trace = []
+        if args.collapse_loops:
+            # The loop analysis of the first core is shared with the others, which run the same decoded program.
+            vcores[0].enable_loop_collapsing()
+            for vcore in vcores[1:]:
+                vcore.load_program(vcores[0].program, vcores[0].operands)
+                vcore.enable_loop_collapsing(vcores[0].loops)
+        if args.efficiency:
+            for vcore in vcores:
+                vcore.enable_efficiency_counters()
 
-    # Run Core
-    vcore.run()   
-    vcore.dumpregs(iodir)
+        # Run Cores
+        run_lockstep(vcores)
+        for vcore, batchdir in zip(vcores, batchdirs):
+            if args.collapse_loops:
+                print("BATCH - Loop report of", batchdir)
+                vcore.loops.dump_report()
+            if args.efficiency:
+                print("BATCH - Efficiency report of", batchdir)
+                vcore.efficiency.dump_report()
+            vcore.dumpregs(batchdir)
+            if args.trace:
+                vcore.dumptrace(batchdir)
+            vcore.SDMEM.dump()
+            vcore.VDMEM.dump()
+    else:
+        # Parse SMEM
+        sdmem = DMEM("SDMEM", iodir, 13) # 32 KB is 2^15 bytes = 2^13 K 32-bit words.
+        # Parse VMEM
+        vdmem = DMEM("VDMEM", iodir, 17) # 512 KB is 2^19 bytes = 2^17 K 32-bit words. 
+
+        # Create Vector Core
+        vcore = Core(imem, sdmem, vdmem)
+        if args.trace:
+            vcore.trace = []
+        if args.collapse_loops:
+            vcore.enable_loop_collapsing()
+        if args.efficiency:
+            vcore.enable_efficiency_counters()
+
+        # Run Core
+        if args.incremental:
+            import incremental
+            incremental.run_incremental(vcore, incremental.CheckpointStore(args.incremental))
+        else:
+            vcore.run()   
+        if args.collapse_loops:
+            vcore.loops.dump_report()
+        if args.efficiency:
+            vcore.efficiency.dump_report()
+        vcore.dumpregs(iodir)
+        if args.trace:
+            vcore.dumptrace(iodir)
 
-    sdmem.dump()
-    vdmem.dump()
+        sdmem.dump()
+        vdmem.dump()
 
     # THE END
\ No newline at end of file
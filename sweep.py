@@ -0,0 +1,151 @@
+import os
+import random
+import pickle
+import hashlib
+import argparse
+import functools
+import itertools
+from multiprocessing import Pool
+
+import timing
+import sampling
+
+def parse_values(spec: str):
+    # "1,2,4" is a list of values, "lo:hi" or "lo:hi:step" an inclusive range.
+    if ':' in spec:
+        bounds = [int(word) for word in spec.split(':')]
+        return list(range(bounds[0], bounds[1] + 1, bounds[2] if len(bounds) == 3 else 1))
+    return [int(word) for word in spec.split(',')]
+
+def expand_configs(space: dict, samples: int = None, seed: int = 0):
+    # Cartesian product of the parameter space, or `samples` random points drawn from it.
+    names = sorted(space)
+    if samples == None:
+        points = list(itertools.product(*[space[name] for name in names]))
+    else:
+        rng = random.Random(seed)
+        points = list(dict.fromkeys(tuple(rng.choice(space[name]) for name in names) for _ in range(samples)))
+    configs = []
+    for point in points:
+        params = dict(zip(names, point))
+        config = timing.Config(**params)
+        config.name = ",".join("{}={}".format(name, value) for name, value in params.items()) or "default"
+        configs.append(config)
+    return configs
+
+def hardware_cost(config):
+    # Hardware cost proxies: pipeline latches across all lanes of the four vector pipelines, and VDMEM bank ports.
+    datapath = config.numLanes * (config.pipelineDepthAdd + config.pipelineDepthMul + config.pipelineDepthDiv + config.vlsPipelineDepth)
+    return {"datapath": datapath, "banks": config.vdmNumBanks}
+
+def pareto_front(points: list):
+    # Indices of the points (tuples, lower is better in every dimension) not dominated by any other point.
+    front = []
+    for i, p in enumerate(points):
+        dominated = False
+        for q in points:
+            if q != p and all(a <= b for a, b in zip(q, p)):
+                dominated = True
+                break
+        if not dominated:
+            front.append(i)
+    return front
+
+def kernel_key(iodir, sources: list):
+    # The functional result only depends on the simulator, the kernel inputs and the sources of the modules that
+    # build and pickle it (sources), not on the timing parameters.
+    digest = hashlib.sha256()
+    for filepath in [timing.skeleton.__file__] + sources + [os.path.join(iodir, name) for name in ("Code.asm", "SDMEM.txt", "VDMEM.txt")]:
+        if os.path.exists(filepath):
+            with open(filepath, 'rb') as f:
+                digest.update(f.read())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def load_cached(kernels: list, cachedir: str, suffix: str, record, sources: list, processes: int = None):
+    # record(iodir) for every kernel, computing (in parallel) only the results missing from the cache.
+    os.makedirs(cachedir, exist_ok=True)
+    paths = [os.path.join(cachedir, kernel_key(iodir, sources) + suffix + ".pkl") for iodir in kernels]
+    results = [None] * len(kernels)
+    missing = []
+    for i, path in enumerate(paths):
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                results[i] = pickle.load(f)
+            print("Sweep - Reusing cached", suffix.strip("-") or "trace", "for", kernels[i])
+        else:
+            missing.append(i)
+    if missing:
+        with Pool(processes) as pool:
+            recorded = pool.map(record, [kernels[i] for i in missing])
+        for i, result in zip(missing, recorded):
+            results[i] = result
+            with open(paths[i], 'wb') as f:
+                pickle.dump(result, f, pickle.HIGHEST_PROTOCOL)
+            print("Sweep - Recorded", suffix.strip("-") or "trace", "for", kernels[i])
+    return results
+
+def load_traces(kernels: list, cachedir: str, processes: int = None):
+    # Traces for every kernel.
+    return load_cached(kernels, cachedir, "", timing.record_trace, [timing.__file__], processes)
+
+def load_samples(kernels: list, cachedir: str, interval: int, processes: int = None):
+    # Sampled runs (see sampling.py) for every kernel.
+    return load_cached(kernels, cachedir, "-sample{}".format(interval), functools.partial(sampling.SampledRun, interval = interval),
+                       [timing.__file__, sampling.__file__], processes)
+
+def sweep(kernels: list, configs: list, cachedir: str, processes: int = None, interval: int = None):
+    # One row per configuration: its parameters, cycles per kernel, total cycles, cost proxies and Pareto flag.
+    # With an interval, the cycles are estimated by sampled simulation instead of replaying the full traces.
+    if interval:
+        runs = load_samples(kernels, cachedir, interval, processes)
+        cycles = [[stats["cycles"] for stats in sampling.estimate_configs(run, configs, processes)] for run in runs]
+    else:
+        traces = load_traces(kernels, cachedir, processes)
+        cycles = [[stats["cycles"] for stats in timing.simulate_configs(trace, configs, processes)] for trace in traces]
+    rows = []
+    for j, config in enumerate(configs):
+        row = {"config": config.name, "cycles": [cycles[k][j] for k in range(len(kernels))]}
+        row["total"] = sum(row["cycles"])
+        row.update(hardware_cost(config))
+        rows.append(row)
+    for i in pareto_front([(row["total"], row["datapath"], row["banks"]) for row in rows]):
+        rows[i]["pareto"] = True
+    return rows
+
+def report(kernels: list, rows: list, filepath: str = None):
+    names = [os.path.basename(os.path.normpath(iodir)) for iodir in kernels]
+    header = ["config"] + names + ["total", "datapath", "banks", "pareto"]
+    lines = [[row["config"]] + [str(c) for c in row["cycles"]] + [str(row["total"]), str(row["datapath"]), str(row["banks"]), "*" if row.get("pareto") else ""]
+             for row in sorted(rows, key=lambda row: row["total"])]
+    widths = [max(len(line[i]) for line in [header] + lines) for i in range(len(header))]
+    for line in [header] + lines:
+        print("  ".join(word.ljust(width) for word, width in zip(line, widths)).rstrip())
+    if filepath:
+        with open(filepath, 'w') as opf:
+            opf.writelines([",".join('"' + word + '"' if ',' in word else word for word in line) + "\n" for line in [header] + lines])
+        print("Sweep - Dumped results into output file in path:", os.path.abspath(filepath))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Vector Core Design Space Exploration')
+    parser.add_argument('--kernels', nargs='+', required=True, type=str, help='IO directories of the kernels to evaluate.')
+    parser.add_argument('--param', action='append', default=[], type=str, help='Swept parameter as name=v1,v2,... or name=lo:hi[:step]. Repeatable.')
+    parser.add_argument('--samples', default=None, type=int, help='Draw this many random points from the space instead of the full grid.')
+    parser.add_argument('--seed', default=0, type=int, help='Seed for --samples.')
+    parser.add_argument('--jobs', default=None, type=int, help='Number of worker processes, defaults to the number of CPUs.')
+    parser.add_argument('--cache', default=".sweep_cache", type=str, help='Directory holding the cached functional traces.')
+    parser.add_argument('--sample', default=None, type=int, help='Estimate the cycles by sampled simulation with intervals of this many instructions.')
+    parser.add_argument('--output', default=None, type=str, help='Optional CSV file for the result table.')
+    args = parser.parse_args()
+
+    space = {}
+    for param in args.param:
+        name, values = param.split('=')
+        if name.strip() not in timing.Config.defaults:
+            parser.error("unknown timing parameter: " + name.strip())
+        space[name.strip()] = parse_values(values.strip())
+
+    kernels = [os.path.abspath(iodir) for iodir in args.kernels]
+    configs = expand_configs(space, args.samples, args.seed)
+    print("Sweep -", len(configs), "configurations over", len(kernels), "kernels")
+    report(kernels, sweep(kernels, configs, args.cache, args.jobs, args.sample), args.output)
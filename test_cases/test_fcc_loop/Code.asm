@@ -0,0 +1,51 @@
+# Fully Connected Layer with hardware loops
+# Same computation as test_fcc, with every counted loop turned into a LOOP instruction: the row chunks (4), the
+# columns (256), the PACKLO / PACKHI halving steps (6), the advance to the next row chunk (64) and the bias loop (4).
+# The loop counters, compares and branches of test_fcc are gone.
+CVM                     # clear vector mask
+MFCL SR2                # SR2 = VLR = 64
+LS SR1 SR0 6            # SR1 = memory[SR0 + 6] = 256 <- This is the starting address of 'a' vector
+LS SR3 SR0 0            # SR3 = memory[SR0 + 0] = 1
+LS SR4 SR0 1            # SR4 = memory[SR0 + 1] = 512 <- This is the starting address of W matrix
+LS SR6 SR0 3            # SR6 = memory[SR0 + 3] = 256 <- This is the number of columns in matrix (we are using this as stride for LVWS)
+LS SR5 SR0 7            # SR5 = memory[SR0 + 7] = 4 <- Number of 64 row chunks
+LOOP SR5 29             # Repeat the next 29 instructions SR5 = 4 times
+    LS SR5 SR0 8        # SR5 = memory[SR0 + 8] = 6 <- Halving steps from 64 to 1 elements
+    LV VR1 SR1          # VR1 = memory[SR1] = memory[256] = [0, 1, 2 ... 63]
+    LOOP SR6 18         # Repeat the next 18 instructions SR6 = 256 times, once per column
+        LVWS VR2 SR4 SR6    # VR2 = 64 elements of the current column of W
+        MULVV VR2 VR1 VR2   # VR2 = VR1 * VR2
+        LOOP SR5 5          # Repeat the next 5 instructions SR5 = 6 times
+            PACKLO VR3 VR2 VR0  # VR3 = VR2[even elements]
+            PACKHI VR4 VR2 VR0  # VR4 = VR2[odd elements]
+            ADDVV VR2 VR3 VR4   # VR2 = VR3 + VR4
+            SRA SR2 SR2 SR3     # SR2 = SR2 >> 1
+            MTCL SR2            # VL = SR2
+        LS SR7 SR0 4        # SR7 = memory[SR0 + 4] <- Output element of the current column
+        LV VR5 SR7          # VR5 = memory[SR7]
+        ADDVV VR2 VR2 VR5   # VR2 = VR2 + VR5
+        SV VR2 SR7          # memory[SR7] = VR2[here VL = 1] = first element of VR2
+        ADD SR7 SR7 SR3     # SR7 = SR7 + 1
+        SS SR7 SR0 4        # memory[SR0 + 4] = SR7
+        CVM                 # clear vector mask
+        POP SR2             # SR2 = 64
+        MTCL SR2            # VL = SR2 = 64
+        ADD SR4 SR4 SR3     # SR4 = SR4 + 1 <- This is the starting address of the next column of matrix
+    LS SR4 SR0 1        # SR4 = memory[SR0 + 1] <- Top of the current row chunk
+    LOOP SR2 1          # Repeat the next instruction SR2 = 64 times
+        ADD SR4 SR4 SR6     # SR4 = SR4 + SR6
+    SS SR4 SR0 1        # memory[SR0 + 1] = SR4 <- Top of the next row chunk
+    LS SR7 SR0 4        # SR7 = memory[SR0 + 4] = 256
+    SUB SR7 SR7 SR6     # SR7 = SR7 - SR6 = 256 - 256 = 0
+    SS SR7 SR0 4        # memory[SR0 + 4] = SR7 = 0
+    ADD SR1 SR1 SR2     # SR1 = SR1 + SR2 = 256 + 64 = 320
+LS SR4 SR0 5            # SR4 = memory[SR0 + 5] = 66048 <- This is the starting address of 'b'
+LS SR5 SR0 7            # SR5 = memory[SR0 + 7] = 4
+LOOP SR5 6              # Repeat the next 6 instructions SR5 = 4 times
+    LV VR1 SR4          # VR1 = memory[SR4] = memory[66048] = [128, 256, 128 ... 256]
+    LV VR2 SR7          # VR2 = memory[SR7] = memory[0] = result of matrix multiplication
+    ADDVV VR2 VR1 VR2   # VR2 = VR1 + VR2
+    SV VR2 SR7          # memory[SR7] = memory[0] = VR2
+    ADD SR4 SR4 SR2     # SR4 = SR4 + SR2 = 66048 + 64 = 66112
+    ADD SR7 SR7 SR2     # SR7 = SR7 + SR2 = 0 + 64 = 64
+HALT
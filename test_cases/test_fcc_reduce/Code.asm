@@ -0,0 +1,55 @@
+# Fully Connected Layer with a reduction instruction
+# The four 64 element chunks of 'a' stay in VR4 - VR7. Every output element is the dot product of 'a' with one
+# column of W: the column is loaded in four strided chunks, multiplied and added lane-wise, and reduced by SUMV
+# straight into a scalar register, instead of the PACKLO / PACKHI tree and the partial sums kept in memory of
+# test_fcc. VR3 is never written and stays zero.
+CVM                     # clear vector mask
+MFCL SR2                # SR2 = VLR = 64
+LS SR1 SR0 6            # SR1 = memory[SR0 + 6] = 256 <- This is the starting address of 'a' vector
+LS SR3 SR0 0            # SR3 = memory[SR0 + 0] = 1
+LS SR4 SR0 1            # SR4 = memory[SR0 + 1] = 512 <- This is the starting address of W matrix
+LS SR5 SR0 7            # SR5 = memory[SR0 + 7] = 16384 <- Distance between two 64 row chunks of W
+LS SR6 SR0 3            # SR6 = memory[SR0 + 3] = 256 <- This is the number of columns in matrix (we are using this as stride for LVWS)
+LV VR4 SR1              # VR4 = a[0 ... 63]
+ADD SR1 SR1 SR2         # SR1 = 320
+LV VR5 SR1              # VR5 = a[64 ... 127]
+ADD SR1 SR1 SR2         # SR1 = 384
+LV VR6 SR1              # VR6 = a[128 ... 191]
+ADD SR1 SR1 SR2         # SR1 = 448
+LV VR7 SR1              # VR7 = a[192 ... 255]
+SUB SR1 SR1 SR1         # SR1 = 0 <- Output column
+LVWS VR0 SR4 SR6        # VR0 = W[0 ... 63][SR1] (JUMP #1 here...)
+MULVV VR0 VR0 VR4       # VR0 = VR0 * a[0 ... 63]
+ADD SR4 SR4 SR5         # SR4 = SR4 + 16384
+LVWS VR1 SR4 SR6        # VR1 = W[64 ... 127][SR1]
+MULVV VR1 VR1 VR5       # VR1 = VR1 * a[64 ... 127]
+ADDVV VR0 VR0 VR1       # VR0 = VR0 + VR1
+ADD SR4 SR4 SR5         # SR4 = SR4 + 16384
+LVWS VR1 SR4 SR6        # VR1 = W[128 ... 191][SR1]
+MULVV VR1 VR1 VR6       # VR1 = VR1 * a[128 ... 191]
+ADDVV VR0 VR0 VR1       # VR0 = VR0 + VR1
+ADD SR4 SR4 SR5         # SR4 = SR4 + 16384
+LVWS VR1 SR4 SR6        # VR1 = W[192 ... 255][SR1]
+MULVV VR1 VR1 VR7       # VR1 = VR1 * a[192 ... 255]
+ADDVV VR0 VR0 VR1       # VR0 = VR0 + VR1
+SUMV SR7 VR0            # SR7 = a . W[:][SR1]
+MTCL SR3                # VL = 1
+ADDVS VR2 VR3 SR7       # VR2[0] = SR7
+SV VR2 SR1              # memory[SR1] = SR7
+MTCL SR2                # VL = 64
+ADD SR1 SR1 SR3         # SR1 = SR1 + 1
+LS SR4 SR0 1            # SR4 = 512
+ADD SR4 SR4 SR1         # SR4 = 512 + SR1 <- Top of the next column
+BLT SR1 SR6 -22         # IF SR1 < 256, THEN JUMP -22 (JUMP #1)
+LS SR4 SR0 5            # SR4 = memory[SR0 + 5] = 66048 <- This is the starting address of 'b'
+LS SR5 SR0 2            # SR5 = memory[SR0 + 2] = 256 <- This is the length of the vector
+SUB SR7 SR7 SR7         # SR7 = 0
+LV VR1 SR4              # VR1 = memory[SR4] = memory[66048] = [128, 256, 128 ... 256] (JUMP #2 here...)
+LV VR2 SR7              # VR2 = memory[SR7] = memory[0] = result of matrix multiplication
+ADDVV VR2 VR1 VR2       # VR2 = VR1 + VR2
+SV VR2 SR7              # memory[SR7] = memory[0] = VR2
+ADD SR4 SR4 SR2         # SR4 = SR4 + SR2 = 66048 + 64 = 66112
+ADD SR7 SR7 SR2         # SR7 = SR7 + SR2 = 0 + 64 = 64
+SUB SR5 SR5 SR2         # SR5 = SR5 - SR2 = 256 - 64 = 192
+BGT SR5 SR0 -7          # IF SR5 > SR0 i.e SR5 > 0, THEN JUMP -7 (JUMP #2)
+HALT
@@ -0,0 +1,40 @@
+# 128 point FFT, real parts at VDMEM 0, imaginary parts at VDMEM 128, see generate.py
+CVM
+LS SR1 SR0 0 # Stages
+LS SR2 SR0 1 # 64
+LS SR3 SR0 2 # Base of the imaginary parts
+LS SR4 SR0 3 # 32768, the Q15 shift
+LS SR5 SR0 4 # Stage table
+LS SR6 SR0 5 # 1
+MTCL SR2
+LV VR0 SR5 # Top indexes
+ADD SR5 SR5 SR2
+LV VR1 SR5 # Bottom indexes
+ADD SR5 SR5 SR2
+LV VR4 SR5 # Twiddle, real part
+ADD SR5 SR5 SR2
+LV VR5 SR5 # Twiddle, imaginary part
+ADD SR5 SR5 SR2
+LVI VR2 SR0 VR1
+LVI VR3 SR3 VR1
+MULVV VR6 VR2 VR4
+MULVV VR7 VR3 VR5
+SUBVV VR6 VR6 VR7
+MULVV VR7 VR2 VR5
+MULVV VR2 VR3 VR4
+ADDVV VR7 VR7 VR2
+DIVVS VR6 VR6 SR4
+DIVVS VR7 VR7 SR4
+LVI VR2 SR0 VR0
+LVI VR3 SR3 VR0
+SUBVV VR4 VR2 VR6
+ADDVV VR2 VR2 VR6
+SUBVV VR5 VR3 VR7
+ADDVV VR3 VR3 VR7
+SVI VR2 SR0 VR0
+SVI VR3 SR3 VR0
+SVI VR4 SR0 VR1
+SVI VR5 SR3 VR1
+SUB SR1 SR1 SR6
+BGT SR1 SR0 -29
+HALT
@@ -0,0 +1,211 @@
+import os
+import sys
+import cmath
+import argparse
+import contextlib
+
+# 128 point radix-2 decimation in time FFT over the complex samples of the FFT section of PCA_Project_Phase2.ipynb,
+# in two versions: test_fft keeps the real and imaginary parts in separate arrays and computes the butterflies with
+# 32 bit vector arithmetic, test_fft_packed keeps every sample in one word (real part in the high half, imaginary
+# part in the low half) and uses the packed 2x16 instructions. Both compute the same Q15 fixed point butterflies,
+# so their outputs are identical.
+#
+# The input is stored in bit reversed order, so the output comes out in natural order. Every stage runs all its
+# 64 butterflies as one vector operation: the stage table holds the indexes of the top and bottom input of every
+# butterfly and its twiddle factor, already expanded to 64 elements.
+#
+#   python generate.py            writes Code.asm, SDMEM.txt and VDMEM.txt of both tests and checks them
+#   python generate.py --compare  also prints the instruction and cycle counts of both versions
+
+N = 128
+STAGES = 7
+BUTTERFLIES = N // 2
+SCALE = 32767 # Q15 twiddle factors.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+PACKED = os.path.join(os.path.dirname(HERE), "test_fft_packed")
+
+def samples():
+    # The notebook input, scaled down by 8 so every intermediate value fits in a signed 16 bit half.
+    period = [complex(1024, 512), complex(1024, -512), complex(512, 1024), complex(512, -1024)]
+    return [period[i % 4] / 8 for i in range(N)]
+
+def twiddles():
+    # W_0 ... W_63 from twiddle_factors.txt as (real, imaginary) Q15 integers.
+    factors = []
+    with open(os.path.join(ROOT, "twiddle_factors.txt"), 'r') as f:
+        for line in f:
+            if "=" in line:
+                w = complex(line.split("=")[1].strip())
+                factors.append((round(w.real * SCALE), round(w.imag * SCALE)))
+    return factors
+
+def bit_reverse(i: int):
+    return int("{:07b}".format(i)[::-1], 2)
+
+def stages():
+    # [(top indexes, bottom indexes, twiddle numbers)] of every stage.
+    table = []
+    for s in range(STAGES):
+        half = 1 << s
+        top, bottom, twiddle = [], [], []
+        for group in range(0, N, 2 * half):
+            for j in range(half):
+                top.append(group + j)
+                bottom.append(group + j + half)
+                twiddle.append(j * (N // (2 * half)))
+        table.append((top, bottom, twiddle))
+    return table
+
+def reference(x: list, factors: list):
+    # Fixed point FFT computing exactly what both programs compute.
+    re = [int(x[bit_reverse(i)].real) for i in range(N)]
+    im = [int(x[bit_reverse(i)].imag) for i in range(N)]
+    for top, bottom, twiddle in stages():
+        for t, b, k in zip(top, bottom, twiddle):
+            wr, wi = factors[k]
+            tr = ((re[b] * wr) - (im[b] * wi)) >> 15
+            ti = ((re[b] * wi) + (im[b] * wr)) >> 15
+            re[t], re[b] = re[t] + tr, re[t] - tr
+            im[t], im[b] = im[t] + ti, im[t] - ti
+    return re, im
+
+UNPACKED_CODE = """# 128 point FFT, real parts at VDMEM 0, imaginary parts at VDMEM 128, see generate.py
+CVM
+LS SR1 SR0 0 # Stages
+LS SR2 SR0 1 # 64
+LS SR3 SR0 2 # Base of the imaginary parts
+LS SR4 SR0 3 # 32768, the Q15 shift
+LS SR5 SR0 4 # Stage table
+LS SR6 SR0 5 # 1
+MTCL SR2
+LV VR0 SR5 # Top indexes
+ADD SR5 SR5 SR2
+LV VR1 SR5 # Bottom indexes
+ADD SR5 SR5 SR2
+LV VR4 SR5 # Twiddle, real part
+ADD SR5 SR5 SR2
+LV VR5 SR5 # Twiddle, imaginary part
+ADD SR5 SR5 SR2
+LVI VR2 SR0 VR1
+LVI VR3 SR3 VR1
+MULVV VR6 VR2 VR4
+MULVV VR7 VR3 VR5
+SUBVV VR6 VR6 VR7
+MULVV VR7 VR2 VR5
+MULVV VR2 VR3 VR4
+ADDVV VR7 VR7 VR2
+DIVVS VR6 VR6 SR4
+DIVVS VR7 VR7 SR4
+LVI VR2 SR0 VR0
+LVI VR3 SR3 VR0
+SUBVV VR4 VR2 VR6
+ADDVV VR2 VR2 VR6
+SUBVV VR5 VR3 VR7
+ADDVV VR3 VR3 VR7
+SVI VR2 SR0 VR0
+SVI VR3 SR3 VR0
+SVI VR4 SR0 VR1
+SVI VR5 SR3 VR1
+SUB SR1 SR1 SR6
+BGT SR1 SR0 -29
+HALT
+"""
+
+PACKED_CODE = """# 128 point FFT, packed samples at VDMEM 0, see ../test_fft/generate.py
+CVM
+LS SR1 SR0 0 # Stages
+LS SR2 SR0 1 # 64
+LS SR5 SR0 4 # Stage table
+LS SR6 SR0 5 # 1
+MTCL SR2
+LV VR0 SR5 # Top indexes
+ADD SR5 SR5 SR2
+LV VR1 SR5 # Bottom indexes
+ADD SR5 SR5 SR2
+LV VR2 SR5 # Packed twiddle
+ADD SR5 SR5 SR2
+LVI VR3 SR0 VR1
+CMULPVV VR3 VR3 VR2
+LVI VR4 SR0 VR0
+SUBPVV VR5 VR4 VR3
+ADDPVV VR4 VR4 VR3
+SVI VR4 SR0 VR0
+SVI VR5 SR0 VR1
+SUB SR1 SR1 SR6
+BGT SR1 SR0 -14
+HALT
+"""
+
+def pack(high: int, low: int):
+    return (high * 65536) + (low & 0xFFFF)
+
+def write_lines(path: str, values: list):
+    with open(path, 'w') as f:
+        f.write("".join(str(value) + "\n" for value in values))
+
+def generate():
+    x = samples()
+    factors = twiddles()
+    re = [int(x[bit_reverse(i)].real) for i in range(N)]
+    im = [int(x[bit_reverse(i)].imag) for i in range(N)]
+
+    # Unpacked: real parts, imaginary parts, then per stage top, bottom, twiddle real and twiddle imaginary parts.
+    vdmem = re + im
+    for top, bottom, twiddle in stages():
+        vdmem += top + bottom + [factors[k][0] for k in twiddle] + [factors[k][1] for k in twiddle]
+    write_lines(os.path.join(HERE, "VDMEM.txt"), vdmem)
+    write_lines(os.path.join(HERE, "SDMEM.txt"), [STAGES, BUTTERFLIES, N, 32768, 2 * N, 1])
+    with open(os.path.join(HERE, "Code.asm"), 'w') as f:
+        f.write(UNPACKED_CODE)
+
+    # Packed: samples, then per stage top, bottom and packed twiddles.
+    os.makedirs(PACKED, exist_ok=True)
+    vdmem = [pack(r, i) for r, i in zip(re, im)]
+    for top, bottom, twiddle in stages():
+        vdmem += top + bottom + [pack(*factors[k]) for k in twiddle]
+    write_lines(os.path.join(PACKED, "VDMEM.txt"), vdmem)
+    write_lines(os.path.join(PACKED, "SDMEM.txt"), [STAGES, BUTTERFLIES, 0, 0, N, 1])
+    with open(os.path.join(PACKED, "Code.asm"), 'w') as f:
+        f.write(PACKED_CODE)
+
+def check(compare: bool):
+    sys.path.insert(0, ROOT)
+    import skeleton
+    import timing
+    expected_re, expected_im = reference(samples(), twiddles())
+    results = {}
+    for iodir in (HERE, PACKED):
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            core = skeleton.Core(skeleton.IMEM(iodir), skeleton.DMEM("SDMEM", iodir, 13), skeleton.DMEM("VDMEM", iodir, 17))
+            core.trace = []
+            core.run()
+        memory = list(core.VDMEM.data[:2 * N])
+        if iodir == HERE:
+            re, im = memory[:N], memory[N:2 * N]
+        else:
+            re = [value >> 16 for value in memory[:N]]
+            im = [((value & 0xFFFF) ^ 0x8000) - 0x8000 for value in memory[:N]]
+        results[iodir] = (re == expected_re and im == expected_im, core.trace)
+
+    # Distance from the floating point FFT of the same input, relative to its largest bin.
+    x = samples()
+    exact = [sum(x[n] * cmath.exp(-2j * cmath.pi * k * n / N) for n in range(N)) for k in range(N)]
+    error = max(abs(complex(r, i) - e) for r, i, e in zip(expected_re, expected_im, exact)) / max(abs(e) for e in exact)
+    print("Fixed point FFT - largest error relative to the peak bin: {:.4f}".format(error))
+
+    for iodir, (matches, trace) in results.items():
+        line = "{:<16} output {}".format(os.path.basename(iodir), "matches the reference" if matches else "DIFFERS from the reference")
+        if compare:
+            cycles = timing.TimingModel(timing.Config()).simulate(trace)["cycles"]
+            line += ", {} instructions, {} cycles".format(len(trace), cycles)
+        print(line)
+    return all(matches for matches, trace in results.values())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='FFT benchmark generator')
+    parser.add_argument('--compare', action='store_true', help='Print the instruction and cycle counts of both versions.')
+    args = parser.parse_args()
+    generate()
+    sys.exit(0 if check(args.compare) else 1)
@@ -0,0 +1,23 @@
+# 128 point FFT, packed samples at VDMEM 0, see ../test_fft/generate.py
+CVM
+LS SR1 SR0 0 # Stages
+LS SR2 SR0 1 # 64
+LS SR5 SR0 4 # Stage table
+LS SR6 SR0 5 # 1
+MTCL SR2
+LV VR0 SR5 # Top indexes
+ADD SR5 SR5 SR2
+LV VR1 SR5 # Bottom indexes
+ADD SR5 SR5 SR2
+LV VR2 SR5 # Packed twiddle
+ADD SR5 SR5 SR2
+LVI VR3 SR0 VR1
+CMULPVV VR3 VR3 VR2
+LVI VR4 SR0 VR0
+SUBPVV VR5 VR4 VR3
+ADDPVV VR4 VR4 VR3
+SVI VR4 SR0 VR0
+SVI VR5 SR0 VR1
+SUB SR1 SR1 SR6
+BGT SR1 SR0 -14
+HALT
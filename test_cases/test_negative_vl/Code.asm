@@ -0,0 +1,20 @@
+LS SR1 SR0 0
+LS SR2 SR0 1
+LS SR3 SR0 2
+LS SR5 SR0 3
+CVM
+LV VR1 SR0
+LV VR2 SR5
+LV VR3 SR0
+LV VR4 SR0
+LV VR5 SR0
+MTCL SR1
+SV VR1 SR2
+SVWS VR1 SR2 SR3
+SVI VR1 SR2 VR2
+LV VR3 SR0
+LVWS VR4 SR0 SR3
+LVI VR5 SR0 VR2
+MFCL SR6
+ADDVV VR6 VR1 VR1
+HALT
@@ -0,0 +1,26 @@
+# Simple Dot Product with a reduction instruction
+# a = [0, 1, 2, ..., 449]
+# b = [0, 1, 2, ..., 449]
+# result = memory[2048]
+# The products are accumulated lane-wise in VR5 and reduced once by SUMV, instead of the PACKLO / PACKHI tree of
+# test_simple_dot_product in every iteration.
+
+CVM                     # clear vector mask
+MFCL SR2                # SR2 = 64
+LS SR3 SR0 0            # SR3 = 1
+LS SR4 SR0 1            # SR4 = 2048 <- Store Address
+LS SR5 SR0 2            # SR5 = 450 <- Vector Size
+LS SR6 SR0 3            # SR6 = 450 <- Starting address of vector 2
+LV VR1 SR1              # VR1 = a[SR1 ... SR1 + 63] (<- JUMP #1 HERE...)
+LV VR2 SR6              # VR2 = b[SR6 - 450 ... SR6 - 387]
+MULVV VR2 VR1 VR2       # VR2 = VR1 * VR2
+ADDVV VR5 VR5 VR2       # VR5 = VR5 + VR2
+ADD SR1 SR1 SR2         # SR1 = SR1 + 64
+ADD SR6 SR6 SR2         # SR6 = SR6 + 64
+SUB SR5 SR5 SR2         # SR5 = SR5 - 64
+BGT SR5 SR0 -7          # IF SR5 > 0, THEN JUMP -7 (JUMP #1)
+SUMV SR7 VR5            # SR7 = VR5[0] + VR5[1] + ... + VR5[63]
+MTCL SR3                # VL = 1
+ADDVS VR5 VR0 SR7       # VR5[0] = SR7
+SV VR5 SR4              # MEM[SR4] = VR5[0]
+HALT
@@ -0,0 +1,1024 @@
+import os
+import argparse
+import collections
+from array import array
+import contextlib
+from multiprocessing import Pool
+
+import skeleton
+
+class Config(object):
+    # Hardware parameters of the timing model. A Config.txt holds one "name = value" pair per line, '#' starts a comment.
+    defaults = {"vdmNumBanks"       : 16,  # Number of VDMEM banks, an address maps to bank (address % vdmNumBanks).
+                "vdmBankBusyTime"   : 2,   # Cycles a bank stays busy after an access.
+                "vlsPipelineDepth"  : 11,  # Latency of the vector load/store pipeline.
+                "numLanes"          : 4,   # Elements processed per cycle by each vector functional unit.
+                "pipelineDepthMul"  : 12,
+                "pipelineDepthAdd"  : 2,
+                "pipelineDepthDiv"  : 8,
+                "reductionTree"     : 0,   # 1: SUMV / MINV / MAXV combine the lane results through an adder tree.
+                # Optional memory hierarchy in front of VDMEM, see VectorCache. Disabled while vcacheSize is 0.
+                "vcacheSize"        : 0,   # Capacity of the vector cache in words.
+                "vcacheLineSize"    : 16,  # Words per cache line.
+                "vcacheAssociativity" : 4, # Ways per set.
+                "vcachePrefetchDegree" : 0, # Instructions ahead fetched by the stride prefetcher, 0 disables it.
+                "dramLatency"       : 100, # Cycles from a line request until its data arrives from DRAM.
+                "dramWordsPerCycle" : 4,   # DRAM bandwidth, a line transfer occupies the channel lineSize / this cycles.
+                # Decoupled scalar / vector issue, see TimingModel.advance_decoupled. Disabled while decoupled is 0.
+                "decoupled"         : 0,
+                "instructionQueueDepth" : 8, # Vector instructions dispatched but not yet issued.
+                "dataQueueDepth"    : 8,   # Scalar operands sent to the vector unit but not yet consumed, at least 2.
+                # Instruction fetch, see FrontEnd. Disabled while frontEnd is 0.
+                "frontEnd"          : 0,
+                "fetchWidth"        : 2,   # Instructions fetched per cycle, a taken branch ends the fetch group.
+                "fetchBufferSize"   : 8,   # Instructions fetched but not yet issued.
+                "branchPenalty"     : 3,   # Cycles from the resolution of a mispredicted branch until fetch restarts.
+                "branchPredictor"   : 0,   # 0: static, backward taken / forward not taken. 1: bimodal.
+                "predictorEntries"  : 512, # 2-bit counters of the bimodal predictor, indexed by PC.
+                "loopBufferSize"    : 0}   # Instructions of the loop buffer, 0 disables it.
+
+    def __init__(self, filepath = None, **params):
+        self.name = os.path.basename(filepath) if filepath else "default"
+        self.params = dict(Config.defaults)
+        if filepath:
+            with open(filepath, 'r') as cfgf:
+                for line in cfgf.readlines():
+                    line = line[:line.index('#')] if '#' in line else line
+                    if line.strip() == "":
+                        continue
+                    name, value = [word.strip() for word in line.split('=')]
+                    self.params[name] = int(value)
+        self.params.update(params)
+        for name, value in self.params.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return "Config(" + ", ".join("{}={}".format(name, value) for name, value in sorted(self.params.items())) + ")"
+
+def read_trace(iodir):
+    # Inverse of Core.dumptrace.
+    trace = []
+    with open(os.path.abspath(os.path.join(iodir, "Trace.txt")), 'r') as trf:
+        for line in trf.readlines():
+            pc, words, vector_length, mask_count, addresses = line.rstrip('\n').split('|')
+            trace.append((int(pc), tuple(words.split(" ")), int(vector_length), int(mask_count),
+                          tuple(int(address) for address in addresses.split(',')) if addresses else ()))
+    return trace
+
+def record_trace(iodir):
+    # Run the functional simulator once over iodir and return its retired instruction trace.
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        imem = skeleton.IMEM(iodir)
+        sdmem = skeleton.DMEM("SDMEM", iodir, 13)
+        vdmem = skeleton.DMEM("VDMEM", iodir, 17)
+        vcore = skeleton.Core(imem, sdmem, vdmem)
+        vcore.trace = []
+        vcore.run()
+    return vcore.trace
+
+# Functional unit and register usage of every opcode: (unit, destinations, sources).
+# Operand positions refer to the instruction words, "VL" and "VM" are the special purpose registers.
+VECTOR_ALU = {"ADDVV": "add", "ADDVS": "add", "SUBVV": "add", "SUBVS": "add",
+              "MULVV": "mul", "MULVS": "mul", "DIVVV": "div", "DIVVS": "div",
+              "UNPACKLO": "add", "UNPACKHI": "add", "PACKLO": "add", "PACKHI": "add",
+              "ADDPVV": "add", "SUBPVV": "add", "MULPVV": "mul", "CMULPVV": "mul"}
+VECTOR_REDUCE = ("SUMV", "MINV", "MAXV")
+VECTOR_COMPARE = ("SEQVV", "SEQVS", "SNEVV", "SNEVS", "SGTVV", "SGTVS", "SLTVV", "SLTVS", "SGEVV", "SGEVS", "SLEVV", "SLEVS")
+VECTOR_MEMORY = {"LV": "load", "LVWS": "load", "LVI": "load", "SV": "store", "SVWS": "store", "SVI": "store"}
+SCALAR_ALU = ("ADD", "SUB", "AND", "OR", "XOR", "SLL", "SRL", "SRA")
+BRANCHES = ("BEQ", "BNE", "BGT", "BLT", "BGE", "BLE")
+
+def decode(words: tuple):
+    op = words[0]
+    if op in VECTOR_ALU:
+        return VECTOR_ALU[op], (words[1],), (words[2], words[3], "VL", "VM")
+    elif op in VECTOR_REDUCE:
+        return "add", (words[1],), (words[2], "VL", "VM")
+    elif op in VECTOR_COMPARE:
+        return "add", ("VM",), (words[1], words[2], "VL")
+    elif op in VECTOR_MEMORY:
+        if VECTOR_MEMORY[op] == "load":
+            return "mem", (words[1],), words[2:] + ("VL",)
+        return "mem", (), words[1:] + ("VL",)
+    elif op == "CVM":
+        return "scalar", ("VM",), ()
+    elif op == "POP":
+        return "scalar", (words[1],), ("VM",)
+    elif op == "MTCL":
+        return "scalar", ("VL",), (words[1],)
+    elif op == "MFCL":
+        return "scalar", (words[1],), ("VL",)
+    elif op == "LS" or op in SCALAR_ALU:
+        return "scalar", (words[1],), tuple(word for word in words[2:] if word[:2] == "SR")
+    elif op == "SS" or op in BRANCHES:
+        return "scalar", (), tuple(word for word in words[1:] if word[:2] == "SR")
+    elif op == "LOOP":
+        return "scalar", (), (words[1],)
+    return "scalar", (), ()
+
+# CPI stack categories, see TimingModel.charge. Every cycle of a run goes to exactly one of them:
+#   vector      a vector instruction issues, or the run waits for the last vector results
+#   structural  the functional unit (or in decoupled mode the vector issue or a full queue) is busy
+#   raw         an operand is not ready yet, or a destination still has a write pending
+#   bank        the part of those waits caused by VDMEM bank conflicts of a vector memory instruction
+#   scalar      a scalar or branch instruction issues
+#   frontend    the fetch stage has not delivered the instruction yet
+CPI_CATEGORIES = ("vector", "structural", "raw", "bank", "scalar", "frontend")
+VECTOR_ISSUE, STRUCTURAL, RAW, BANK_CONFLICT, SCALAR_ISSUE, FRONTEND_BUBBLE = range(len(CPI_CATEGORIES))
+RETIRED = len(CPI_CATEGORIES) # Slot of the per PC counters holding the retired instructions.
+
+class VectorCache(object):
+    # Set associative, write-allocate, write-back vector cache in front of an off-chip DRAM with a fixed latency and
+    # a single channel of limited bandwidth. Tags, fill cycles, LRU stamps and dirty bits of all the ways live in
+    # flat arrays indexed by set * ways + way, so a lookup is a slice search in one array.
+    # A stride prefetcher keeps the address of the last access of every vector memory PC. Once the same non-zero
+    # stride is seen twice in a row, the lines of the next vcachePrefetchDegree accesses of that PC are fetched.
+    # Statistics are kept per PC: [line hits, line misses, stall cycles, bandwidth stall cycles], where a line
+    # access is a run of consecutive elements of one instruction in the same line, the stall cycles are the
+    # cycles the instruction waits for its data after the last element is sent, and the bandwidth stall cycles
+    # are the cycles its misses wait for the DRAM channel.
+    def __init__(self, config: Config):
+        self.line_size = config.vcacheLineSize
+        self.ways = config.vcacheAssociativity
+        self.sets = max(1, config.vcacheSize // (self.line_size * self.ways))
+        self.latency = config.dramLatency
+        self.transfer = max(1, -(-self.line_size // config.dramWordsPerCycle))
+        self.degree = config.vcachePrefetchDegree
+        self.reset()
+
+    def reset(self):
+        entries = self.sets * self.ways
+        self.tags = array('q', [-1]) * entries
+        self.filled = array('q', [0]) * entries # Cycle at which the data of the line is in the cache.
+        self.used = array('q', [0]) * entries   # LRU stamp.
+        self.dirty = array('b', [0]) * entries
+        self.clock = 0
+        self.dram_free = 0
+        self.streams = {} # PC -> (address of the last access, stride)
+        self.clear_stats()
+
+    def clear_stats(self):
+        self.stats = {}
+        self.prefetches = 0
+        self.writebacks = 0
+
+    def fill(self, line: int, cycle: int, write: bool):
+        # Allocate the line, evicting the LRU way of its set. Returns (cycle the data arrives, bandwidth stall).
+        base = (line % self.sets) * self.ways
+        used = self.used
+        victim = base
+        for way in range(base + 1, base + self.ways):
+            if used[way] < used[victim]:
+                victim = way
+        start = cycle if cycle > self.dram_free else self.dram_free
+        if self.dirty[victim]:
+            self.writebacks += 1
+            start += self.transfer
+        self.dram_free = start + self.transfer
+        self.tags[victim] = line
+        self.filled[victim] = start + self.latency + self.transfer
+        self.clock += 1
+        used[victim] = self.clock
+        self.dirty[victim] = write
+        return start + self.latency + self.transfer, start - cycle
+
+    def lookup(self, line: int):
+        # Way holding the line, or -1.
+        base = (line % self.sets) * self.ways
+        try:
+            return self.tags.index(line, base, base + self.ways)
+        except ValueError:
+            return -1
+
+    def prefetch(self, pc: int, addresses: tuple, cycle: int):
+        if not addresses:
+            return
+        first = addresses[0]
+        last, stride = self.streams.get(pc, (None, 0))
+        new_stride = first - last if last != None else 0
+        self.streams[pc] = (first, new_stride)
+        if self.degree == 0 or new_stride == 0 or new_stride != stride:
+            return
+        line_size = self.line_size
+        for ahead in range(1, self.degree + 1):
+            shift = ahead * new_stride
+            previous = None
+            for address in addresses:
+                line = (address + shift) // line_size
+                if line != previous and line >= 0 and self.lookup(line) < 0:
+                    self.fill(line, cycle, False)
+                    self.prefetches += 1
+                previous = line
+
+    def access(self, line: int, cycle: int, write: bool):
+        # Access a line at the given cycle. Returns (cycle its data is available, hit, bandwidth stall).
+        way = self.lookup(line)
+        if way < 0:
+            ready, stall = self.fill(line, cycle, write)
+            return ready, False, stall
+        self.clock += 1
+        self.used[way] = self.clock
+        if write:
+            self.dirty[way] = 1
+        filled = self.filled[way]
+        return (filled if filled > cycle else cycle), True, 0
+
+class FrontEnd(object):
+    # Fetch stage in front of the issue stage. Up to fetchWidth sequential instructions are fetched per cycle into
+    # a buffer of fetchBufferSize instructions, and a predicted taken branch ends its fetch group. Branches are
+    # predicted statically (backward taken) or by a table of 2-bit counters. A branch resolves one cycle after
+    # it issues, and a mispredicted one restarts fetch branchPenalty cycles later.
+    # The optional loop buffer captures a loop once its backward branch is taken and its body fits. While the
+    # instructions come from the buffer, that branch is predicted taken and does not end the fetch group, so
+    # only the loop exit costs a penalty.
+    # The trace has no wrong-path instructions, so the direction of a branch is only known at the next entry:
+    # the outcome of the previous branch is settled when the next instruction is fetched.
+    # A LOOP instruction tells the fetch stage where its body ends, so going back to the top of the body
+    # continues the fetch group like a sequential fetch.
+    def __init__(self, config: Config):
+        self.width = config.fetchWidth
+        self.penalty = config.branchPenalty
+        self.bimodal = config.branchPredictor == 1
+        self.entries = config.predictorEntries
+        self.loop_size = config.loopBufferSize
+        self.buffer_size = max(1, config.fetchBufferSize)
+        self.reset()
+
+    def reset(self):
+        self.counters = array('b', [2]) * self.entries # Weakly taken.
+        self.fetch_cycle = 0
+        self.slot = 0
+        self.issued = collections.deque(maxlen = self.buffer_size) # Issue cycles of the last instructions.
+        self.previous = None    # (pc, words, issue cycle) of the previous instruction.
+        self.loop = None        # (head, branch pc) of the loop in the loop buffer.
+        self.captured = False   # The loop buffer holds the whole body of self.loop.
+        self.cause = None       # PC charged with the front-end stall of the instruction being fetched.
+        self.hardware_loops = {} # Last body PC -> first body PC of the LOOP instructions fetched so far.
+        self.clear_stats()
+
+    def clear_stats(self):
+        self.stalls = {}   # PC -> front-end stall cycles charged to it, see issue.
+        self.branches = {} # PC -> [executions, mispredictions]
+        self.buffered = {} # PC -> instructions delivered by the loop buffer
+
+    def predict(self, pc: int, offset: int):
+        if self.loop != None and self.captured and pc == self.loop[1]:
+            return True
+        if self.bimodal:
+            return self.counters[pc % self.entries] >= 2
+        return offset < 0
+
+    def fetch(self, pc: int, words: tuple):
+        # Cycle at which the instruction is in the fetch buffer.
+        previous = self.previous
+        restart = None # Fetch cycle of a new fetch group, None to continue the current one.
+        self.cause = pc
+        if previous != None:
+            previous_pc, previous_words, previous_issue = previous
+            sequential = pc == previous_pc + 1
+            if previous_words[0] in BRANCHES:
+                offset = int(previous_words[3])
+                predicted = self.predict(previous_pc, offset)
+                if self.bimodal:
+                    index = previous_pc % self.entries
+                    counter = self.counters[index]
+                    self.counters[index] = min(3, counter + 1) if not sequential else max(0, counter - 1)
+                counts = self.branches.setdefault(previous_pc, [0, 0])
+                counts[0] += 1
+                in_buffer = self.captured and previous_pc == self.loop[1]
+                if predicted == sequential:
+                    counts[1] += 1
+                    restart = max(self.fetch_cycle + 1, previous_issue + 1 + self.penalty)
+                    self.cause = previous_pc
+                elif not sequential and not in_buffer:
+                    restart = self.fetch_cycle + 1
+                    self.cause = previous_pc
+                # Loop buffer: capture a small loop at its first taken backward branch, release it on exit.
+                if self.loop_size and not sequential and offset < 0 and previous_pc - pc + 1 <= self.loop_size:
+                    self.captured = self.loop == (pc, previous_pc)
+                    self.loop = (pc, previous_pc)
+            elif not sequential and self.hardware_loops.get(previous_pc) != pc:
+                restart = self.fetch_cycle + 1
+            if self.loop != None and not self.loop[0] <= pc <= self.loop[1]:
+                self.loop = None
+                self.captured = False
+        if restart != None:
+            self.fetch_cycle = restart
+            self.slot = 0
+        elif self.slot == self.width:
+            self.fetch_cycle += 1
+            self.slot = 0
+        if words[0] == "LOOP":
+            self.hardware_loops[pc + int(words[2])] = pc + 1
+        issued = self.issued
+        if len(issued) == issued.maxlen and issued[0] > self.fetch_cycle:
+            self.fetch_cycle = issued[0]
+            self.slot = 0
+        self.slot += 1
+        if self.captured:
+            self.buffered[pc] = self.buffered.get(pc, 0) + 1
+        return self.fetch_cycle
+
+    def issue(self, pc: int, words: tuple, cycle: int, stall: int):
+        # The instruction fetched last issued at cycle after waiting stall cycles for the fetch stage. The stall is
+        # charged to the branch that redirected the fetch, if any, so a loop exit counts towards its own loop.
+        self.issued.append(cycle)
+        self.previous = (pc, words, cycle)
+        if stall:
+            self.stalls[self.cause] = self.stalls.get(self.cause, 0) + stall
+
+class TimingModel(object):
+    # In-order, single issue timing model driven by a retired instruction trace.
+    # Every instruction issues once its source operands are ready, its destinations have no write pending
+    # and its functional unit is free. Scalar instructions take one cycle. Vector compute instructions occupy
+    # their unit for ceil(VL / numLanes) cycles and produce their result after the pipeline depth. Vector
+    # memory instructions send up to numLanes elements per cycle to the VDMEM banks, an element waits while
+    # its bank is busy, and the data is available vlsPipelineDepth cycles after the last element is sent.
+    # With a vector cache (vcacheSize > 0) the data is available vlsPipelineDepth cycles after the last element
+    # is sent or its line arrives from DRAM, whichever is later.
+    def __init__(self, config: Config):
+        self.config = config
+        self.depths = {"add": config.pipelineDepthAdd, "mul": config.pipelineDepthMul, "div": config.pipelineDepthDiv}
+        self.decoded = {}
+        self.words = {} # PC -> instruction words, for the reports.
+        self.cpi = {}   # PC -> cycles per CPI category charged to the PC, then its retired instructions.
+        self.cache = VectorCache(config) if config.vcacheSize > 0 else None
+        self.frontend = FrontEnd(config) if config.frontEnd else None
+        self.reset()
+
+    def reset(self):
+        self.ready = {} # Cycle at which each register's pending write completes.
+        self.unit_free = {"add": 0, "mul": 0, "div": 0, "mem": 0}
+        self.bank_free = [0] * self.config.vdmNumBanks
+        self.issue_cycle = 0
+        self.finish_cycle = 0
+        self.instructions = 0
+        self.vector_count = 0
+        self.vector_issue_cycle = 0
+        self.instruction_queue = collections.deque(maxlen = max(1, self.config.instructionQueueDepth))
+        self.data_queue = collections.deque(maxlen = max(2, self.config.dataQueueDepth))
+        self.queue_events = {"instruction": [], "data": []} # (dispatch cycle, issue cycle, entries) per dispatch.
+        self.full_stalls = {"instruction": 0, "data": 0}     # Scalar pipeline cycles lost to a full queue.
+        self.clear_cpi(0)
+        self.bank_delays = {} # Register -> (ready cycle, bank conflict cycles in it) of the vector load results.
+        self.bank_delay = 0   # Bank conflict cycles in the result of the last vector memory instruction.
+        self.mem_delay = 0    # Bank conflict cycles in unit_free["mem"].
+        self.last = (None, VECTOR_ISSUE, 0) # (pc, category, bank conflict cycles) of the instruction finishing last.
+        if self.cache != None:
+            self.cache.reset()
+        if self.frontend != None:
+            self.frontend.reset()
+
+    def advance(self, trace: list):
+        # Issue the trace entries on top of the current pipeline state.
+        if self.config.decoupled:
+            return self.advance_decoupled(trace)
+        decoded = self.decoded
+        ready = self.ready
+        frontend = self.frontend
+        bank_delays = self.bank_delays
+        issue_cycle = self.issue_cycle
+        finish_cycle = self.finish_cycle
+        vector_count = self.vector_count
+        accounted = self.accounted
+        last_pc, last_category, last_bank = self.last
+        stall = 0
+
+        for pc, words, vector_length, mask_count, addresses in trace:
+            if pc not in decoded:
+                self.decode(pc, words)
+            unit, destinations, sources, _, _, _, _, counters = decoded[pc]
+
+            cycle = issue_cycle
+            blocker = None
+            for reg in sources:
+                if ready.get(reg, 0) > cycle:
+                    blocker = reg
+                    cycle = ready[reg]
+            for reg in destinations:
+                if ready.get(reg, 0) > cycle:
+                    blocker = reg
+                    cycle = ready[reg]
+            operands_ready = cycle
+            if frontend != None:
+                fetched = frontend.fetch(pc, words)
+                stall = fetched - cycle if fetched > cycle else 0
+                cycle += stall
+
+            waiting = cycle
+            if unit == "scalar":
+                done = cycle + 1
+                category = SCALAR_ISSUE
+            else:
+                vector_count += 1
+                unit_delay = self.mem_delay
+                cycle, done = self.execute(pc, words, unit, cycle, vector_length, addresses)
+                category = VECTOR_ISSUE
+            if frontend != None:
+                frontend.issue(pc, words, cycle, stall)
+
+            # CPI stack: the cycles since the previous issue waited for the operands, the fetch stage and the unit.
+            if cycle == accounted:
+                counters[category] += 1
+                accounted = cycle + 1
+            else:
+                raw = operands_ready - issue_cycle
+                raw_bank = 0
+                if blocker in bank_delays and bank_delays[blocker][0] == operands_ready:
+                    raw_bank = min(raw, bank_delays[blocker][1])
+                busy = cycle - waiting
+                busy_bank = min(busy, unit_delay) if unit == "mem" else 0
+                if accounted == issue_cycle:
+                    counters[RAW] += raw - raw_bank
+                    counters[BANK_CONFLICT] += raw_bank + busy_bank
+                    counters[FRONTEND_BUBBLE] += stall
+                    counters[STRUCTURAL] += busy - busy_bank
+                    counters[category] += 1
+                    accounted = cycle + 1
+                else:
+                    accounted = self.charge(counters, accounted, issue_cycle, ((RAW, raw - raw_bank), (BANK_CONFLICT, raw_bank),
+                                            (FRONTEND_BUBBLE, stall), (STRUCTURAL, busy - busy_bank), (BANK_CONFLICT, busy_bank), (category, 1)))
+            counters[RETIRED] += 1
+
+            for reg in destinations:
+                ready[reg] = done
+            if unit == "mem":
+                for reg in destinations:
+                    bank_delays[reg] = (done, self.bank_delay)
+            issue_cycle = cycle + 1
+            if done > finish_cycle:
+                finish_cycle = done
+                last_pc = pc
+                last_category = category
+                last_bank = self.bank_delay if unit == "mem" else 0
+
+        self.issue_cycle = issue_cycle
+        self.finish_cycle = finish_cycle
+        self.vector_count = vector_count
+        self.accounted = accounted
+        self.last = (last_pc, last_category, last_bank)
+        self.instructions += len(trace)
+
+    def decode(self, pc: int, words: tuple):
+        # decode() plus the split of the registers between the scalar and the vector side for the decoupled model:
+        # (unit, destinations, sources, runs on the vector side, scalar sources, vector sources, scalar operands,
+        # CPI stack counters of the PC).
+        unit, destinations, sources = decode(words)
+        vector_side = unit != "scalar" or words[0] == "CVM"
+        scalar_sources = tuple(reg for reg in sources if reg[:2] == "SR" or reg == "VL")
+        vector_sources = tuple(reg for reg in sources if reg not in scalar_sources)
+        operands = len([reg for reg in sources if reg[:2] == "SR"]) if vector_side else 0
+        counters = self.cpi[pc] = [0] * (RETIRED + 1)
+        self.decoded[pc] = (unit, destinations, sources, vector_side, scalar_sources, vector_sources, operands, counters)
+        self.words[pc] = words
+
+    def execute(self, pc: int, words: tuple, unit: str, cycle: int, vector_length: int, addresses: tuple):
+        # Vector instruction ready to issue at cycle: wait for its unit, returns (issue cycle, result cycle).
+        unit_free = self.unit_free
+        if unit_free[unit] > cycle:
+            cycle = unit_free[unit]
+        lanes = self.config.numLanes
+        if unit == "mem":
+            banks = self.config.vdmNumBanks
+            bank_busy = self.config.vdmBankBusyTime
+            bank_free = self.bank_free
+            element_cycle = cycle
+            slot = 0
+            for address in addresses:
+                if slot == lanes:
+                    element_cycle += 1
+                    slot = 0
+                bank = address % banks
+                if bank_free[bank] > element_cycle:
+                    element_cycle = bank_free[bank]
+                    slot = 0
+                bank_free[bank] = element_cycle + bank_busy
+                slot += 1
+            unit_free["mem"] = element_cycle + 1
+            # Bank conflicts delayed the last element past the cycle numLanes elements per cycle would reach.
+            self.mem_delay = self.bank_delay = element_cycle - cycle - (len(addresses) - 1) // lanes if addresses else 0
+            if self.cache != None:
+                data_cycle = self.cache_access(pc, words, addresses, cycle, element_cycle)
+                if data_cycle > element_cycle:
+                    self.bank_delay = 0 # The data waits for a line from DRAM anyway.
+                element_cycle = data_cycle
+            return cycle, element_cycle + self.config.vlsPipelineDepth
+        occupancy = max(1, -(-vector_length // lanes))
+        unit_free[unit] = cycle + occupancy
+        if self.config.reductionTree and words[0] in VECTOR_REDUCE:
+            # Each lane accumulates its elements, then the lane results pass ceil(log2(lanes used)) adder levels.
+            levels = (min(lanes, vector_length) - 1).bit_length() if vector_length > 1 else 0
+            return cycle, cycle + self.depths[unit] * (1 + levels) + occupancy - 1
+        return cycle, cycle + self.depths[unit] + occupancy - 1
+
+    def advance_decoupled(self, trace: list):
+        # Decoupled issue (decoupled = 1): the scalar pipeline issues one instruction per cycle in order and
+        # dispatches the vector instructions (and CVM, which writes VM) into the instruction queue, pushing their
+        # scalar register operands into the data queue. The vector unit issues from the instruction queue in order,
+        # one instruction per cycle, once its vector operands are ready. VL is read at dispatch, so MTCL does not
+        # wait for the queued instructions, while POP reads VM and waits for the vector unit. The scalar pipeline
+        # stalls when either queue is full; an entry leaves its queue when its instruction issues.
+        decoded = self.decoded
+        ready = self.ready
+        instruction_depth = self.instruction_queue.maxlen
+        data_depth = self.data_queue.maxlen
+        instruction_queue = self.instruction_queue
+        data_queue = self.data_queue
+        frontend = self.frontend
+        bank_delays = self.bank_delays
+        scalar_cycle = self.issue_cycle
+        vector_cycle = self.vector_issue_cycle
+        finish_cycle = self.finish_cycle
+        vector_count = self.vector_count
+        accounted = self.accounted
+        last_pc, last_category, last_bank = self.last
+        stall = 0
+
+        for pc, words, vector_length, mask_count, addresses in trace:
+            if pc not in decoded:
+                self.decode(pc, words)
+            unit, destinations, sources, vector_side, scalar_sources, vector_sources, operands, counters = decoded[pc]
+
+            start = scalar_cycle
+            cycle = scalar_cycle
+            blocker = None
+            for reg in scalar_sources:
+                if ready.get(reg, 0) > cycle:
+                    blocker = reg
+                    cycle = ready[reg]
+
+            if not vector_side:
+                for reg in vector_sources:
+                    if ready.get(reg, 0) > cycle:
+                        blocker = reg
+                        cycle = ready[reg]
+                for reg in destinations:
+                    if ready.get(reg, 0) > cycle:
+                        blocker = reg
+                        cycle = ready[reg]
+            operands_ready = cycle
+            if frontend != None:
+                fetched = frontend.fetch(pc, words)
+                stall = fetched - cycle if fetched > cycle else 0
+                cycle += stall
+
+            if not vector_side:
+                done = cycle + 1
+                scalar_cycle = cycle + 1
+                category = SCALAR_ISSUE
+                issued = cycle
+            else:
+                # Dispatch once the queues have room.
+                dispatch_ready = cycle
+                if len(instruction_queue) == instruction_depth and instruction_queue[0] > cycle:
+                    self.full_stalls["instruction"] += instruction_queue[0] - cycle
+                    cycle = instruction_queue[0]
+                if operands:
+                    leaving = len(data_queue) + operands - data_depth
+                    if leaving > 0 and data_queue[leaving - 1] > cycle:
+                        self.full_stalls["data"] += data_queue[leaving - 1] - cycle
+                        cycle = data_queue[leaving - 1]
+                scalar_cycle = cycle + 1
+
+                vcycle = cycle + 1 if cycle + 1 > vector_cycle else vector_cycle
+                in_order = vcycle
+                vector_blocker = None
+                for reg in vector_sources:
+                    if ready.get(reg, 0) > vcycle:
+                        vector_blocker = reg
+                        vcycle = ready[reg]
+                for reg in destinations:
+                    if ready.get(reg, 0) > vcycle:
+                        vector_blocker = reg
+                        vcycle = ready[reg]
+                vector_ready = vcycle
+                if unit == "scalar":
+                    done = vcycle + 1
+                    category = SCALAR_ISSUE
+                else:
+                    vector_count += 1
+                    unit_delay = self.mem_delay
+                    vcycle, done = self.execute(pc, words, unit, vcycle, vector_length, addresses)
+                    category = VECTOR_ISSUE
+                vector_cycle = vcycle + 1
+                issued = vcycle
+
+                instruction_queue.append(vcycle)
+                self.queue_events["instruction"].append((cycle, vcycle, 1))
+                for _ in range(operands):
+                    data_queue.append(vcycle)
+                if operands:
+                    self.queue_events["data"].append((cycle, vcycle, operands))
+            if frontend != None:
+                frontend.issue(pc, words, scalar_cycle - 1, stall)
+
+            # CPI stack: only the cycles of the instruction past the ones already charged count, see charge.
+            if issued == accounted:
+                counters[category] += 1
+                accounted += 1
+            elif issued > accounted:
+                if vector_side:
+                    raw = vector_ready - in_order
+                    raw_bank = 0
+                    if vector_blocker in bank_delays and bank_delays[vector_blocker][0] == vector_ready:
+                        raw_bank = min(raw, bank_delays[vector_blocker][1])
+                    busy = vcycle - vector_ready
+                    busy_bank = min(busy, unit_delay) if unit == "mem" else 0
+                if vector_side and accounted == in_order:
+                    # The usual case: everything up to the vector issue of the previous vector instruction is charged.
+                    counters[RAW] += raw - raw_bank
+                    counters[BANK_CONFLICT] += raw_bank + busy_bank
+                    counters[STRUCTURAL] += busy - busy_bank
+                    counters[category] += 1
+                    accounted = vcycle + 1
+                else:
+                    segments = [(FRONTEND_BUBBLE, stall)]
+                    if not vector_side:
+                        segments.append((category, 1))
+                    else:
+                        segments += [(STRUCTURAL, cycle - dispatch_ready), (category, 1), (STRUCTURAL, in_order - cycle - 1), (RAW, raw - raw_bank),
+                                     (BANK_CONFLICT, raw_bank), (STRUCTURAL, busy - busy_bank), (BANK_CONFLICT, busy_bank), (category, 1)]
+                    raw = operands_ready - start
+                    raw_bank = self.bank_wait(blocker, operands_ready, raw)
+                    accounted = self.charge(counters, accounted, start, [(RAW, raw - raw_bank), (BANK_CONFLICT, raw_bank)] + segments)
+            counters[RETIRED] += 1
+
+            for reg in destinations:
+                ready[reg] = done
+            if unit == "mem":
+                for reg in destinations:
+                    bank_delays[reg] = (done, self.bank_delay)
+            if done > finish_cycle:
+                finish_cycle = done
+                last_pc = pc
+                last_category = category
+                last_bank = self.bank_delay if unit == "mem" else 0
+
+        self.last = (last_pc, last_category, last_bank)
+        self.issue_cycle = scalar_cycle
+        self.vector_issue_cycle = vector_cycle
+        self.finish_cycle = finish_cycle
+        self.vector_count = vector_count
+        self.accounted = accounted
+        self.instructions += len(trace)
+
+    def queue_histograms(self, start_cycle: int = 0):
+        # Cycles spent at each occupancy of the two queues between start_cycle and the end of the run:
+        # {"instruction": {entries: cycles}, "data": {entries: cycles}}.
+        histograms = {}
+        for name, events in self.queue_events.items():
+            changes = {}
+            for enter, leave, count in events:
+                enter = max(enter, start_cycle)
+                leave = max(leave, start_cycle)
+                if enter < leave:
+                    changes[enter] = changes.get(enter, 0) + count
+                    changes[leave] = changes.get(leave, 0) - count
+            histogram = {}
+            occupancy = 0
+            previous = start_cycle
+            for cycle in sorted(changes) + [self.finish_cycle]:
+                if cycle > previous:
+                    histogram[occupancy] = histogram.get(occupancy, 0) + cycle - previous
+                    previous = cycle
+                occupancy += changes.get(cycle, 0)
+            histograms[name] = dict(sorted(histogram.items()))
+        return histograms
+
+    def cache_access(self, pc: int, words: tuple, addresses: tuple, cycle: int, last_cycle: int):
+        # Look up the lines of a vector memory instruction that issued at cycle and sent its last element at
+        # last_cycle. Elements are spread over the issue cycles at numLanes per cycle for the lookups, bank
+        # conflicts only delay the last element. Returns the cycle at which all the data is available.
+        cache = self.cache
+        write = VECTOR_MEMORY[words[0]] == "store"
+        cache.prefetch(pc, addresses, cycle)
+        stats = cache.stats.get(pc)
+        if stats == None:
+            stats = cache.stats[pc] = [0, 0, 0, 0]
+        lanes = self.config.numLanes
+        line_size = cache.line_size
+        data_cycle = last_cycle
+        previous = None
+        for i, address in enumerate(addresses):
+            line = address // line_size
+            if line == previous:
+                continue
+            previous = line
+            ready, hit, stall = cache.access(line, cycle + i // lanes, write)
+            if hit:
+                stats[0] += 1
+            else:
+                stats[1] += 1
+                stats[3] += stall
+            if ready > data_cycle:
+                data_cycle = ready
+        stats[2] += data_cycle - last_cycle
+        return data_cycle
+
+    def cache_report(self):
+        # Per PC cache statistics, see VectorCache: [(pc, words, hits, misses, stall cycles, bandwidth stall cycles)].
+        if self.cache == None:
+            return []
+        return [(pc, self.words[pc], *stats) for pc, stats in sorted(self.cache.stats.items())]
+
+    def frontend_report(self):
+        # Front-end statistics per loop: [(head, branch pc, stall cycles, branches, mispredictions, instructions from
+        # the loop buffer)]. Loops are the ranges closed by the backward branches seen in the trace, and every PC
+        # counts towards the innermost loop around it; a last entry with head None collects the PCs outside loops.
+        frontend = self.frontend
+        loops = sorted((pc + int(self.words[pc][3]), pc) for pc in frontend.branches if int(self.words[pc][3]) < 0)
+        totals = {loop: [0, 0, 0, 0] for loop in loops}
+        totals[(None, None)] = [0, 0, 0, 0]
+
+        def innermost(pc):
+            around = [loop for loop in loops if loop[0] <= pc <= loop[1]]
+            return min(around, key = lambda loop: loop[1] - loop[0]) if around else (None, None)
+
+        for pc, cycles in frontend.stalls.items():
+            totals[innermost(pc)][0] += cycles
+        for pc, (executions, mispredictions) in frontend.branches.items():
+            totals[innermost(pc)][1] += executions
+            totals[innermost(pc)][2] += mispredictions
+        for pc, count in frontend.buffered.items():
+            totals[innermost(pc)][3] += count
+        return [(head, end, *totals[(head, end)]) for head, end in loops + [(None, None)]]
+
+    def clear_cpi(self, cycle: int):
+        # Start the CPI stack over, with the cycles before cycle left out.
+        for counters in self.cpi.values():
+            counters[:] = [0] * (RETIRED + 1)
+        self.accounted = cycle # Every cycle before this one is charged to a category.
+
+    def bank_wait(self, reg, cycle: int, wait: int):
+        # Cycles of a wait for reg, ready at cycle, caused by the bank conflicts of the vector load writing it.
+        delay = self.bank_delays.get(reg)
+        return min(wait, delay[1]) if delay != None and delay[0] == cycle else 0
+
+    def charge(self, counters, accounted: int, cycle: int, segments):
+        # Charge the consecutive segments [(category, cycles)] of an instruction, the first one starting at cycle,
+        # to its counters. Issue cycles only grow, so the cycles before accounted were charged to the instructions
+        # that issued earlier (or, in decoupled mode, overlap the other pipeline) and are left out: every cycle of
+        # the run ends up in exactly one category. Returns the new accounted cycle.
+        for category, cycles in segments:
+            end = cycle + cycles
+            if end > accounted:
+                counters[category] += end - (cycle if cycle > accounted else accounted)
+                accounted = end
+            cycle = end
+        return accounted
+
+    def loop_ranges(self):
+        # (head, last pc) of the loops seen in the trace: the ranges closed by a backward branch and the bodies of
+        # the LOOP instructions.
+        loops = set()
+        for pc, words in self.words.items():
+            if words[0] in BRANCHES and int(words[3]) < 0:
+                loops.add((pc + int(words[3]), pc))
+            elif words[0] == "LOOP":
+                loops.add((pc + 1, pc + int(words[2])))
+        return sorted(loops)
+
+    def cpi_report(self):
+        # CPI stack of the run: ({category: cycles}, [(head, last pc, instructions, {category: cycles})]). The
+        # cycles from the last issue until the last result is written go to the instruction finishing last, so the
+        # categories add up to the cycles of the run. Every PC counts towards the innermost loop around it, and a
+        # last entry with head None collects the PCs outside loops.
+        per_pc = {pc: list(counters) for pc, counters in self.cpi.items()}
+        pc, category, bank = self.last
+        drain = self.finish_cycle - self.accounted
+        if drain > 0 and pc in per_pc:
+            per_pc[pc][BANK_CONFLICT] += min(drain, bank)
+            per_pc[pc][category] += drain - min(drain, bank)
+        loops = self.loop_ranges()
+        totals = {loop: [0] * (RETIRED + 1) for loop in loops + [(None, None)]}
+
+        def innermost(pc):
+            around = [loop for loop in loops if loop[0] <= pc <= loop[1]]
+            return min(around, key = lambda loop: loop[1] - loop[0]) if around else (None, None)
+
+        for pc, counters in per_pc.items():
+            total = totals[innermost(pc)]
+            for i, cycles in enumerate(counters):
+                total[i] += cycles
+        run = [sum(total[i] for total in totals.values()) for i in range(RETIRED)]
+        return (dict(zip(CPI_CATEGORIES, run)),
+                [(head, end, totals[(head, end)][RETIRED], dict(zip(CPI_CATEGORIES, totals[(head, end)]))) for head, end in loops + [(None, None)]])
+
+    def simulate(self, trace: list, warmup: int = 0):
+        # Simulate the trace from an empty pipeline. The first `warmup` entries only bring the pipeline and bank
+        # state up to speed: the statistics cover the remaining entries, and cycles counts from the point where
+        # the warmup entries would have finished.
+        warmup = min(warmup, len(trace))
+        self.reset()
+        self.advance(trace[:warmup])
+        start_cycle = self.finish_cycle
+        start_vector = self.vector_count
+        if self.cache != None:
+            self.cache.clear_stats()
+        self.full_stalls = {"instruction": 0, "data": 0}
+        if self.frontend != None:
+            self.frontend.clear_stats()
+        self.clear_cpi(start_cycle)
+        self.advance(trace[warmup:] if warmup else trace)
+        instructions = self.instructions - warmup
+        vector_count = self.vector_count - start_vector
+        stats = {"config": self.config.name, "cycles": self.finish_cycle - start_cycle, "instructions": instructions,
+                 "vector_instructions": vector_count, "scalar_instructions": instructions - vector_count}
+        if self.cache != None:
+            report = self.cache_report()
+            stats["cache"] = {"hits": sum(entry[2] for entry in report), "misses": sum(entry[3] for entry in report),
+                              "stall_cycles": sum(entry[4] for entry in report), "bandwidth_stall_cycles": sum(entry[5] for entry in report),
+                              "prefetches": self.cache.prefetches, "writebacks": self.cache.writebacks, "per_pc": report}
+        if self.config.decoupled:
+            stats["queues"] = self.queue_histograms(start_cycle)
+            stats["queue_full_stalls"] = dict(self.full_stalls)
+        total, loops = self.cpi_report()
+        stats["cpi"] = {"total": total, "loops": loops}
+        if self.frontend != None:
+            report = self.frontend_report()
+            stats["frontend"] = {"stall_cycles": sum(entry[2] for entry in report), "branches": sum(entry[3] for entry in report),
+                                 "mispredictions": sum(entry[4] for entry in report), "buffered": sum(entry[5] for entry in report), "loops": report}
+        return stats
+
+# Trace shared with the pool workers, sent once per worker instead of once per configuration.
+_worker_trace = None
+
+def _init_worker(trace):
+    global _worker_trace
+    _worker_trace = trace
+
+def _simulate_worker(config):
+    return TimingModel(config).simulate(_worker_trace)
+
+def simulate_configs(trace: list, configs: list, processes: int = None):
+    # Replay one trace over many hardware configurations, in parallel worker processes.
+    if processes == 1 or len(configs) <= 1:
+        return [TimingModel(config).simulate(trace) for config in configs]
+    with Pool(processes, initializer=_init_worker, initargs=(trace,)) as pool:
+        return pool.map(_simulate_worker, configs)
+
+# Parallel interval simulation of one long run. A functional run drops a checkpoint `warmup` instructions before
+# every interval boundary, and each checkpoint is handed to a worker as soon as it is taken. The worker restores
+# it, records the trace of the warmup and the interval, and simulates it with the warmup only warming up the
+# pipeline and bank state. The cycles of the intervals are summed into the total of the run.
+_interval_core = None
+_interval_configs = None
+
+def _init_interval_worker(iodir, configs):
+    global _interval_core, _interval_configs
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        _interval_core = skeleton.Core(skeleton.IMEM(iodir), skeleton.DMEM("SDMEM", iodir, 13), skeleton.DMEM("VDMEM", iodir, 17))
+        _interval_core.load_program()
+    _interval_configs = configs
+
+def _interval_worker(job):
+    start, checkpoint_start, interval, state = job
+    core = _interval_core
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        core.restore(state)
+        core.trace = []
+        length = start - checkpoint_start + interval
+        while len(core.trace) < length and core.step():
+            pass
+        trace = core.trace
+        core.trace = None
+    return [TimingModel(config).simulate(trace, start - checkpoint_start) for config in _interval_configs]
+
+def checkpoints(iodir, interval: int, warmup: int):
+    # Functional run over iodir yielding (interval start, checkpoint position, interval, snapshot) jobs.
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        core = skeleton.Core(skeleton.IMEM(iodir), skeleton.DMEM("SDMEM", iodir, 13), skeleton.DMEM("VDMEM", iodir, 17))
+        core.load_program()
+    retired = 0
+    start = 0
+    while True:
+        while max(0, start - warmup) == retired:
+            yield (start, retired, interval, core.snapshot())
+            start += interval
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            while retired < max(0, start - warmup):
+                if not core.step():
+                    return
+                retired += 1
+
+def simulate_intervals(iodir, configs: list, interval: int = 10000, warmup: int = 1000, processes: int = None):
+    # Per configuration the stitched statistics of all intervals, see above.
+    totals = [{"config": config.name, "cycles": 0, "instructions": 0, "vector_instructions": 0, "scalar_instructions": 0, "intervals": 0}
+              for config in configs]
+    with Pool(processes, initializer=_init_interval_worker, initargs=(iodir, configs)) as pool:
+        for results in pool.imap(_interval_worker, checkpoints(iodir, interval, warmup)):
+            for total, stats in zip(totals, results):
+                for name in ("cycles", "instructions", "vector_instructions", "scalar_instructions"):
+                    total[name] += stats[name]
+                if "cache" in stats:
+                    cache = total.setdefault("cache", {"hits": 0, "misses": 0, "stall_cycles": 0, "bandwidth_stall_cycles": 0, "prefetches": 0, "writebacks": 0})
+                    for name in cache:
+                        cache[name] += stats["cache"][name]
+                cpi = total.setdefault("cpi", {"total": dict.fromkeys(CPI_CATEGORIES, 0), "loops": {}})
+                for name in CPI_CATEGORIES:
+                    cpi["total"][name] += stats["cpi"]["total"][name]
+                for head, end, retired, categories in stats["cpi"]["loops"]:
+                    loop = cpi["loops"].setdefault((head, end), [0, dict.fromkeys(CPI_CATEGORIES, 0)])
+                    loop[0] += retired
+                    for name in CPI_CATEGORIES:
+                        loop[1][name] += categories[name]
+                total["intervals"] += 1
+    for total in totals:
+        if "cpi" in total:
+            loops = total["cpi"]["loops"]
+            total["cpi"]["loops"] = [(head, end, *loops[(head, end)]) for head, end in sorted(loops, key = lambda loop: (loop[0] == None, loop))]
+    return totals
+
+def print_cache_stats(stats: dict, per_pc: bool = False):
+    cache = stats.get("cache")
+    if cache == None:
+        return
+    accesses = max(1, cache["hits"] + cache["misses"])
+    print("{:<24} vcache hits: {} misses: {} ({:.1f}%) stall cycles: {} bandwidth stall cycles: {} prefetches: {} writebacks: {}".format(
+        "", cache["hits"], cache["misses"], 100.0 * cache["misses"] / accesses, cache["stall_cycles"], cache["bandwidth_stall_cycles"],
+        cache["prefetches"], cache["writebacks"]))
+    if per_pc:
+        for pc, words, hits, misses, stall, bandwidth_stall in cache["per_pc"]:
+            print("  PC {:<5} {:<24} hits: {:<8} misses: {:<8} stall cycles: {:<10} bandwidth stall cycles: {}".format(
+                pc, " ".join(words), hits, misses, stall, bandwidth_stall))
+
+def print_frontend_stats(stats: dict):
+    frontend = stats.get("frontend")
+    if frontend == None:
+        return
+    print("{:<24} front-end stall cycles: {} branches: {} mispredicted: {} from loop buffer: {}".format(
+        "", frontend["stall_cycles"], frontend["branches"], frontend["mispredictions"], frontend["buffered"]))
+    for head, end, stall, branches, mispredictions, buffered in frontend["loops"]:
+        if head == None and stall == 0 and branches == 0:
+            continue
+        name = "outside loops" if head == None else "loop PC {} - {}".format(head, end)
+        print("  {:<20} stall cycles: {:<10} branches: {:<8} mispredicted: {:<8} from loop buffer: {}".format(
+            name, stall, branches, mispredictions, buffered))
+
+def print_cpi_stats(stats: dict):
+    # CPI stack of the run and of every loop, as cycles and as their share of the CPI.
+    cpi = stats.get("cpi")
+    if cpi == None:
+        return
+    instructions = max(1, stats["instructions"])
+    print("{:<24} CPI {:.2f} = {}".format("", stats["cycles"] / instructions, " + ".join(
+          "{} {:.2f} ({})".format(name, cycles / instructions, cycles) for name, cycles in cpi["total"].items())))
+    for head, end, retired, categories in cpi["loops"]:
+        if retired == 0:
+            continue
+        name = "outside loops" if head == None else "loop PC {} - {}".format(head, end)
+        print("  {:<20} instructions: {:<8} cycles: {:<10} CPI {:.2f} = {}".format(name, retired, sum(categories.values()),
+              sum(categories.values()) / retired, " + ".join("{} {:.2f}".format(name, cycles / retired) for name, cycles in categories.items())))
+
+def print_queue_stats(stats: dict):
+    for name, histogram in stats.get("queues", {}).items():
+        cycles = max(1, sum(histogram.values()))
+        print("{:<24} {} queue full stall cycles: {:<8} occupancy: {}".format("", name, stats["queue_full_stalls"][name],
+              " ".join("{}:{:.1f}%".format(entries, 100.0 * count / cycles) for entries, count in histogram.items())))
+
+if __name__ == "__main__":
+    #parse arguments for input file location
+    parser = argparse.ArgumentParser(description='Vector Core Timing Model')
+    parser.add_argument('--iodir', default="", type=str, help='Path to the folder containing the input files - instructions and data.')
+    parser.add_argument('--config', nargs='*', default=[], type=str, help='Timing configuration files, defaults to Config.txt in iodir.')
+    parser.add_argument('--jobs', default=None, type=int, help='Number of worker processes, defaults to the number of CPUs.')
+    parser.add_argument('--intervals', default=None, type=int, help='Simulate the run in parallel intervals of this many instructions from functional checkpoints.')
+    parser.add_argument('--warmup', default=1000, type=int, help='Instructions simulated before each interval to warm up the pipeline (with --intervals).')
+    parser.add_argument('--cache-report', action='store_true', help='Print the vector cache statistics of every memory instruction.')
+    parser.add_argument('--cpi-stack', action='store_true', help='Print the CPI stack of the run and of every loop.')
+    args = parser.parse_args()
+
+    iodir = os.path.abspath(args.iodir)
+    print("IO Directory:", iodir)
+
+    if args.config:
+        configs = [Config(filepath) for filepath in args.config]
+    elif os.path.exists(os.path.join(iodir, "Config.txt")):
+        configs = [Config(os.path.join(iodir, "Config.txt"))]
+    else:
+        configs = [Config()]
+
+    if args.intervals:
+        for stats in simulate_intervals(iodir, configs, args.intervals, args.warmup, args.jobs):
+            print("{:<24} cycles: {:<10} instructions: {:<10} (vector: {}, scalar: {}, intervals: {})".format(
+                stats["config"], stats["cycles"], stats["instructions"], stats["vector_instructions"], stats["scalar_instructions"], stats["intervals"]))
+            print_cache_stats(stats)
+            if args.cpi_stack:
+                print_cpi_stats(stats)
+        raise SystemExit(0)
+
+    if os.path.exists(os.path.join(iodir, "Trace.txt")):
+        trace = read_trace(iodir)
+        print("Trace - Loaded", len(trace), "instructions from Trace.txt")
+    else:
+        trace = record_trace(iodir)
+        print("Trace - Recorded", len(trace), "instructions from a functional run")
+
+    for stats in simulate_configs(trace, configs, args.jobs):
+        print("{:<24} cycles: {:<10} instructions: {:<10} (vector: {}, scalar: {})".format(
+            stats["config"], stats["cycles"], stats["instructions"], stats["vector_instructions"], stats["scalar_instructions"]))
+        print_cache_stats(stats, args.cache_report)
+        print_queue_stats(stats)
+        print_frontend_stats(stats)
+        if args.cpi_stack:
+            print_cpi_stats(stats)